@@ -0,0 +1,57 @@
+"""
+    Measure the cold-start cost of importing Lab2.src.main in a fresh interpreter,
+    with geopy loaded lazily as it is now and eagerly as it used to be, and the
+    per-call cost of the distance backends. Run from the repository root:
+
+        python -m Lab2.benchmarks.bench_import --runs 20
+    """
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from Lab2.src.distance import BACKENDS
+
+SCENARIOS = {
+    "interpreter only": "pass",
+    "main, lazy geopy": "import Lab2.src.main",
+    "main, eager geopy": "import Lab2.src.main; import geopy.distance",
+}
+
+
+def cold_start(code: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def per_call(name: str, calls: int) -> float:
+    compute = BACKENDS[name]
+    compute((46.48, 30.72), (41.01, 28.97))  # pays the lazy import up front
+    start = time.perf_counter()
+    for i in range(calls):
+        compute((46.48, 30.72 + i * 1e-6), (41.01, 28.97))
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    baseline = None
+    for label, code in SCENARIOS.items():
+        median = cold_start(code, args.runs)
+        baseline = median if baseline is None else baseline
+        print(f"{label:18} {median * 1000:8.1f} ms  (+{(median - baseline) * 1000:.1f} ms over the interpreter)")
+    for name in ("haversine", "geodesic"):
+        print(f"{name:18} {per_call(name, args.calls) * 1e6:8.2f} us per distance")
+
+
+if __name__ == "__main__":
+    main()
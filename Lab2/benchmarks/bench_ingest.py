@@ -0,0 +1,67 @@
+"""
+    Compare the in-memory and the streaming ingestion paths of ``main``.
+
+    Every mode runs in its own interpreter so that the reported peak RSS
+    belongs to that mode only. Run from the repository root:
+
+        python -m Lab2.benchmarks.bench_ingest --records 1000000
+    """
+import argparse
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from Lab2.benchmarks.synthetic import scaled, write_input
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_mode(filename: str, stream: bool) -> None:
+    from Lab2.src.main import main
+
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        main(filename, stream=stream)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"elapsed": elapsed, "peak_rss_mb": peak_rss_mb()}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--child", choices=["load", "stream"], help=argparse.SUPPRESS)
+    parser.add_argument("--input", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_mode(args.input, stream=args.child == "stream")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "input.json")
+        write_input(filename, scaled(args.records))
+        size_mb = os.path.getsize(filename) / (1024 * 1024)
+        print(f"{args.records} records, {size_mb:.1f} MB")
+
+        for mode in ("load", "stream"):
+            out = subprocess.run(
+                [sys.executable, "-m", "Lab2.benchmarks.bench_ingest", "--child", mode, "--input", filename],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            rate = args.records / result["elapsed"]
+            print(f"{mode:>6}: {result['elapsed']:8.2f} s  {rate:12,.0f} records/s  "
+                  f"peak RSS {result['peak_rss_mb']:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
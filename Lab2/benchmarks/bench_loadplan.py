@@ -0,0 +1,55 @@
+"""
+    Measure the fleet load optimizer on synthetic ports: loaded share of the
+    ships' weight capacity and planning time for the greedy pass alone, with
+    the local search, and with the ports solved in a process pool. Run from
+    the repository root:
+
+        python -m Lab2.benchmarks.bench_loadplan --ports 8 --containers 5000 --ships 20
+    """
+import argparse
+import random
+import time
+from typing import List
+
+from Lab2.src.conteiners import container_factory
+from Lab2.src.loadplan import plan_fleet
+from Lab2.src.port import Port
+from Lab2.src.ship import Ship, ContainerLimits
+
+
+def build_ports(ports: int, containers: int, ships: int, seed: int = 1) -> List[Port]:
+    rng = random.Random(seed)
+    built = []
+    for p in range(ports):
+        port = Port(p, (rng.uniform(-60, 60), rng.uniform(-170, 170)))
+        for i in range(containers):
+            port.load_container(container_factory(f"{p}-{i}", rng.randint(100, 6000),
+                                                  rng.choice((None, None, "R", "L"))))
+        for s in range(ships):
+            port.incoming_ship(Ship(f"{p}-{s}", 1000, port, rng.randint(20_000, 200_000), 1.0,
+                                    ContainerLimits(rng.randint(10, 80), rng.randint(5, 40),
+                                                    rng.randint(1, 10), rng.randint(1, 10))))
+        built.append(port)
+    return built
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ports", type=int, default=8)
+    parser.add_argument("--containers", type=int, default=5000)
+    parser.add_argument("--ships", type=int, default=20)
+    args = parser.parse_args()
+
+    ports = build_ports(args.ports, args.containers, args.ships)
+    capacity = sum(ship.total_weight_capacity for port in ports for ship in port.ships)
+    for label, refine, workers in (("greedy", False, 1), ("local search", True, 1), ("local search, pool", True, None)):
+        start = time.perf_counter()
+        commands = plan_fleet(ports, refine=refine, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        loaded = sum(command.container.weight for command in commands)
+        print(f"{label:20} {elapsed * 1000:9.1f} ms  {len(commands):6} containers  "
+              f"{loaded / capacity:7.2%} of capacity")
+
+
+if __name__ == "__main__":
+    main()
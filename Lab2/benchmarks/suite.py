@@ -0,0 +1,136 @@
+"""
+    Time the hot paths of the Lab2 model at several scales and write the
+    results to a JSON file that later runs can be compared against.
+    Run from the repository root:
+
+        python -m Lab2.benchmarks.suite --scales 1000,10000,100000,1000000 --output lab2.json
+    """
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from Lab2.benchmarks.synthetic import scaled, write_input
+from Lab2.src.conteiners import BasicContainer, HeavyContainer
+from Lab2.src.distance import distance_cache
+from Lab2.src.port import Port
+from Lab2.src.ship import Ship, ContainerLimits
+
+
+def _containers(n: int) -> List[Any]:
+    rng = random.Random(n)
+    return [(BasicContainer if i % 2 else HeavyContainer)(f"C{i}", rng.randint(500, 20000)) for i in range(n)]
+
+
+def _ship(port: Port) -> Ship:
+    limits = ContainerLimits(10 ** 9, 10 ** 9, 10 ** 9, 10 ** 9)
+    return Ship("S", 10 ** 12, port, 10 ** 15, 1.0, limits)
+
+
+def bench_port_load(n: int) -> float:
+    port, containers = Port(0, (45.0, 30.0)), _containers(n)
+    start = time.perf_counter()
+    for container in containers:
+        port.load_container(container)
+    return time.perf_counter() - start
+
+
+def bench_port_unload(n: int) -> float:
+    port, containers = Port(0, (45.0, 30.0)), _containers(n)
+    for container in containers:
+        port.load_container(container)
+    start = time.perf_counter()
+    for container in containers:
+        port.unload_container(container.id)
+    return time.perf_counter() - start
+
+
+def bench_ship_load(n: int) -> float:
+    ship, containers = _ship(Port(0, (45.0, 30.0))), _containers(n)
+    start = time.perf_counter()
+    for container in containers:
+        ship.load(container)
+    return time.perf_counter() - start
+
+
+def bench_ship_unload(n: int) -> float:
+    ship, containers = _ship(Port(0, (45.0, 30.0))), _containers(n)
+    for container in containers:
+        ship.load(container)
+    start = time.perf_counter()
+    for container in containers:
+        ship.un_load(container)
+    return time.perf_counter() - start
+
+
+def bench_get_distance(n: int) -> float:
+    rng = random.Random(n)
+    ports = [Port(i, (rng.uniform(-60, 60), rng.uniform(-180, 180))) for i in range(100)]
+    pairs = [(rng.choice(ports), rng.choice(ports)) for _ in range(n)]
+    distance_cache.clear()
+    start = time.perf_counter()
+    for a, b in pairs:
+        a.get_distance(b)
+    return time.perf_counter() - start
+
+
+def bench_main(n: int) -> float:
+    from Lab2.src.main import main
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "input.json")
+        write_input(filename, scaled(n))
+        distance_cache.clear()
+        start = time.perf_counter()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            main(filename)
+        return time.perf_counter() - start
+
+
+BENCHMARKS: Dict[str, Callable[[int], float]] = {
+    "Port.load_container": bench_port_load,
+    "Port.unload_container": bench_port_unload,
+    "Ship.load": bench_ship_load,
+    "Ship.un_load": bench_ship_unload,
+    "Port.get_distance": bench_get_distance,
+    "main": bench_main,
+}
+
+
+def run(scales: List[int], names: List[str], repeat: int) -> Dict[str, Any]:
+    results = []
+    for name in names:
+        for n in scales:
+            seconds = min(BENCHMARKS[name](n) for _ in range(repeat))
+            results.append({"benchmark": name, "n": n, "seconds": seconds, "ops_per_second": n / seconds})
+            print(f"{name:<24} n={n:<9} {seconds:10.4f} s  {n / seconds:14,.0f} ops/s", file=sys.stderr)
+    return {
+        "lab": "Lab2",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", default="1000,10000,100000")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    report = run([int(float(n)) for n in args.scales.split(",")], args.benchmarks.split(","), args.repeat)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+    Deterministic generator of synthetic worlds in the input.json schema.
+
+    The same seed always produces the same records. Commands follow a
+    simulation of the world, so most of them are valid: ships load containers
+    that are in their current port, unload what they carry and sail between
+    ports with enough fuel.
+    """
+import json
+import random
+from typing import Any, Dict, Iterator, List
+
+SPECIALS = (None, None, "R", "L")
+
+
+def generate(ports: int, ships: int, containers: int, commands: int,
+             seed: int = 0) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed)
+    ports = max(ports, 2)
+    ships = max(ships, 1)
+
+    for i in range(ports):
+        yield {"type": "port", "id": i,
+               "latitude": round(rng.uniform(-60.0, 60.0), 4),
+               "longitude": round(rng.uniform(-180.0, 180.0), 4)}
+
+    ship_ports: List[int] = []
+    for i in range(ships):
+        port_id = rng.randrange(ports)
+        ship_ports.append(port_id)
+        yield {"type": "ship", "id": f"S{i}", "port_id": port_id, "fuel": 10 ** 12,
+               "max_weight": 10 ** 9, "max_containers": 10 ** 6, "max_heavy": 10 ** 6,
+               "max_refrigerated": 10 ** 6, "max_liquid": 10 ** 6,
+               "fuel_consumption_per_km": round(rng.uniform(0.5, 2.0), 2)}
+
+    in_port: List[List[str]] = [[] for _ in range(ports)]
+    for i in range(containers):
+        port_id = rng.randrange(ports)
+        in_port[port_id].append(f"C{i}")
+        yield {"type": "container", "id": f"C{i}", "weight": rng.randint(500, 20000),
+               "port_id": port_id, "special": rng.choice(SPECIALS)}
+
+    on_ship: List[List[str]] = [[] for _ in range(ships)]
+    for _ in range(commands):
+        ship = rng.randrange(ships)
+        roll = rng.random()
+        stock = in_port[ship_ports[ship]]
+        if roll < 0.4 and stock:
+            container_id = stock.pop(rng.randrange(len(stock)))
+            on_ship[ship].append(container_id)
+            yield {"type": "action", "action": "load", "ship_id": f"S{ship}", "container_id": container_id}
+        elif roll < 0.6 and on_ship[ship]:
+            cargo = on_ship[ship]
+            container_id = cargo.pop(rng.randrange(len(cargo)))
+            yield {"type": "action", "action": "unload", "ship_id": f"S{ship}", "container_id": container_id}
+        elif roll < 0.9:
+            destination = rng.randrange(ports)
+            ship_ports[ship] = destination
+            yield {"type": "action", "action": "sail", "ship_id": f"S{ship}", "destination_port_id": destination}
+        else:
+            yield {"type": "action", "action": "refuel", "ship_id": f"S{ship}", "amount": rng.randint(100, 1000)}
+
+
+def scaled(records: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+        Generate a world of roughly ``records`` records: 0.1% ports, 1% ships,
+        half containers and the rest commands.
+        """
+    ports = max(2, records // 1000)
+    ships = max(1, records // 100)
+    containers = max(1, (records - ports - ships) // 2)
+    commands = max(0, records - ports - ships - containers)
+    return generate(ports, ships, containers, commands, seed)
+
+
+def write_input(filename: str, records: Iterator[Dict[str, Any]]) -> int:
+    """
+        Stream records into a JSON array file without holding them all in memory.
+
+        Returns:
+            int: The number of records written.
+        """
+    count = 0
+    with open(filename, "w") as f:
+        f.write("[\n")
+        for record in records:
+            if count:
+                f.write(",\n")
+            json.dump(record, f)
+            count += 1
+        f.write("\n]\n")
+    return count
@@ -0,0 +1,249 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
+
+from Lab2.src.conteiners import (Container, BasicContainer, HeavyContainer,
+                                 RefrigeratedContainer, LiquidContainer)
+
+CONTAINER_TYPES: Tuple[Type[Container], ...] = (
+    BasicContainer,
+    HeavyContainer,
+    RefrigeratedContainer,
+    LiquidContainer,
+)
+TYPE_CODES: Dict[Type[Container], int] = {cls: code for code, cls in enumerate(CONTAINER_TYPES)}
+UNIT_CONSUMPTION = np.array([cls.UNIT_CONSUMPTION for cls in CONTAINER_TYPES], dtype=np.float64)
+
+
+class ContainerView:
+    """
+        Lightweight view of one row of a ContainerTable.
+
+        It exposes the same ``id``, ``weight`` and ``consumption()`` as a regular
+        Container, reading them from the table instead of storing them. A view is
+        not a Container: it has no ``to_dict()`` and its class says nothing about
+        its type, so hand ``to_container()`` to ports and ships instead.
+
+        Attributes:
+            id (Any): Unique identifier for the container.
+            weight (float): Weight of the container, written through to the table.
+            container_type (Type[Container]): The container class this row stands for.
+        """
+    __slots__ = ("_table", "_id")
+
+    def __init__(self, table: "ContainerTable", id: Any) -> None:
+        self._table = table
+        self._id = id
+
+    @property
+    def id(self) -> Any:
+        return self._id
+
+    @property
+    def weight(self) -> float:
+        return float(self._table.weights[self._table.row(self._id)])
+
+    @weight.setter
+    def weight(self, weight: float) -> None:
+        self._table.weights[self._table.row(self._id)] = weight
+
+    @property
+    def container_type(self) -> Type[Container]:
+        return CONTAINER_TYPES[self._table.codes[self._table.row(self._id)]]
+
+    def consumption(self) -> float:
+        row = self._table.row(self._id)
+        return float(UNIT_CONSUMPTION[self._table.codes[row]] * self._table.weights[row])
+
+    def to_container(self) -> Container:
+        return self.container_type(self._id, self.weight)
+
+    def __repr__(self) -> str:
+        return f"ContainerView({self.container_type.__name__}, id={self._id!r}, weight={self.weight})"
+
+
+class ContainerTable:
+    """
+        Columnar store of containers for a port or a ship.
+
+        Containers are kept as parallel NumPy arrays of id, type code and weight,
+        so totals over the whole inventory are single vectorized reductions
+        instead of one ``consumption()`` call per object. The unit consumption
+        of every row is kept in its own column so the total consumption is a
+        single dot product. Removing a container moves the last row into its
+        place, so row order is not preserved.
+
+        Attributes:
+            ids (np.ndarray): Container IDs, one per row.
+            codes (np.ndarray): Index of the container class in CONTAINER_TYPES, one per row.
+            weights (np.ndarray): Container weights, one per row.
+
+        Methods:
+            add(container: Container) -> None:
+                Appends one container.
+
+            extend(containers: Iterable[Container]) -> None:
+                Appends many containers at once.
+
+            remove(container_id: Any) -> bool:
+                Removes a container by ID.
+
+            total_weight() -> float:
+                Sum of all weights.
+
+            total_consumption() -> float:
+                Sum of the consumption of all containers.
+
+            weight_by_type() / consumption_by_type() -> Dict[str, float]:
+                Per container type totals.
+
+            count_by_type() -> Dict[str, int]:
+                Number of containers per type.
+        """
+    def __init__(self, capacity: int = 1024) -> None:
+        capacity = max(1, capacity)
+        self._ids = np.empty(capacity, dtype=object)
+        self._codes = np.empty(capacity, dtype=np.int8)
+        self._weights = np.empty(capacity, dtype=np.float64)
+        self._rates = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+        self._rows: Dict[Any, int] = {}
+
+    @classmethod
+    def from_containers(cls, containers: Iterable[Container]) -> "ContainerTable":
+        containers = list(containers)
+        table = cls(capacity=len(containers))
+        table.extend(containers)
+        return table
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self._codes[:self._size]
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, container_id: Any) -> bool:
+        return container_id in self._rows
+
+    def __iter__(self) -> Iterator[ContainerView]:
+        for container_id in self._ids[:self._size]:
+            yield ContainerView(self, container_id)
+
+    def row(self, container_id: Any) -> int:
+        return self._rows[container_id]
+
+    def get(self, container_id: Any) -> Optional[ContainerView]:
+        if container_id in self._rows:
+            return ContainerView(self, container_id)
+        return None
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_ids", "_codes", "_weights", "_rates"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def add(self, container: Container) -> None:
+        """
+            Append one container to the table.
+
+            Args:
+                container (Container): The container to store.
+
+            Raises:
+                ValueError: If the ID is already stored or the container type is unknown.
+            """
+        self.extend((container,))
+
+    def extend(self, containers: Iterable[Container]) -> None:
+        """
+            Append many containers to the table at once.
+
+            Args:
+                containers (Iterable[Container]): The containers to store.
+
+            Raises:
+                ValueError: If an ID is already stored or a container type is unknown.
+            """
+        containers: List[Container] = list(containers)
+        codes = []
+        batch = set()
+        for container in containers:
+            code = TYPE_CODES.get(type(container))
+            if code is None:
+                raise ValueError(f"Unknown container type: {type(container).__name__}")
+            if container.id in self._rows or container.id in batch:
+                raise ValueError(f"Container {container.id} is already stored")
+            batch.add(container.id)
+            codes.append(code)
+
+        self._reserve(len(containers))
+        start, end = self._size, self._size + len(containers)
+        self._ids[start:end] = [container.id for container in containers]
+        self._codes[start:end] = codes
+        self._weights[start:end] = [container.weight for container in containers]
+        self._rates[start:end] = UNIT_CONSUMPTION[codes]
+        self._rows.update(zip(self._ids[start:end].tolist(), range(start, end)))
+        self._size = end
+
+    def remove(self, container_id: Any) -> bool:
+        row = self._rows.pop(container_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._codes[row] = self._codes[last]
+            self._weights[row] = self._weights[last]
+            self._rates[row] = self._rates[last]
+            self._rows[moved_id] = row
+        self._ids[last] = None
+        self._size = last
+        return True
+
+    def to_containers(self) -> List[Container]:
+        """
+            Materialize every row as a regular Container object.
+
+            Returns:
+                List[Container]: The containers, in row order.
+            """
+        return [CONTAINER_TYPES[code](container_id, float(weight))
+                for container_id, code, weight in zip(self.ids, self.codes, self.weights)]
+
+    def total_weight(self) -> float:
+        return float(self.weights.sum())
+
+    def total_consumption(self) -> float:
+        return float(np.dot(self._rates[:self._size], self.weights))
+
+    def _by_type(self, values: np.ndarray) -> Dict[str, float]:
+        return {cls.__name__: float(value) for cls, value in zip(CONTAINER_TYPES, values)}
+
+    def count_by_type(self) -> Dict[str, int]:
+        counts = np.bincount(self.codes, minlength=len(CONTAINER_TYPES))
+        return {cls.__name__: int(count) for cls, count in zip(CONTAINER_TYPES, counts)}
+
+    def weight_by_type(self) -> Dict[str, float]:
+        return self._by_type(np.bincount(self.codes, weights=self.weights, minlength=len(CONTAINER_TYPES)))
+
+    def consumption_by_type(self) -> Dict[str, float]:
+        weights = np.bincount(self.codes, weights=self.weights, minlength=len(CONTAINER_TYPES))
+        return self._by_type(weights * UNIT_CONSUMPTION)
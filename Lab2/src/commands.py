@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from Lab2.src.conteiners import Container
+from Lab2.src.port import Port
+from Lab2.src.ship import Ship
+
+
+class Command(ABC):
+    """
+        Base class for a command whose ship, port and container IDs have already
+        been resolved to direct references.
+
+        Methods:
+            execute() -> bool:
+                Runs the command and reports whether it succeeded.
+        """
+    @abstractmethod
+    def execute(self) -> bool:
+        pass
+
+
+@dataclass
+class LoadCommand(Command):
+    ship: Ship
+    container_id: Any
+    container: Optional[Container]
+
+    def execute(self) -> bool:
+        port = self.ship.current_port
+        container = self.container
+        if (container is not None and port.get_container(container.id) is container
+                and self.ship.load(container)):
+            port.unload_container(container.id)
+            print(f"Container {container.id} loaded onto Ship {self.ship.id}")
+            return True
+        print(f"Container {self.container_id} cannot be loaded onto Ship {self.ship.id}")
+        return False
+
+
+@dataclass
+class UnloadCommand(Command):
+    ship: Ship
+    container_id: Any
+    container: Optional[Container]
+
+    def execute(self) -> bool:
+        if self.container is not None and self.ship.un_load(self.container):
+            print(f"Container {self.container.id} unloaded from Ship {self.ship.id}")
+            return True
+        print(f"Container {self.container_id} cannot be unloaded from Ship {self.ship.id}")
+        return False
+
+
+@dataclass
+class SailCommand(Command):
+    ship: Ship
+    destination_port_id: Any
+    destination_port: Optional[Port]
+
+    def execute(self) -> bool:
+        if self.destination_port is not None and self.ship.sail_to(self.destination_port):
+            print(f"Ship {self.ship.id} sailed to Port {self.destination_port.id}")
+            return True
+        print(f"Ship {self.ship.id} failed to sail to Port {self.destination_port_id}")
+        return False
+
+
+@dataclass
+class RefuelCommand(Command):
+    ship: Ship
+    amount: float
+
+    def execute(self) -> bool:
+        self.ship.re_fuel(self.amount)
+        print(f"Ship {self.ship.id} refueled by {self.amount} units. Current fuel: {self.ship.fuel}")
+        return True
+
+
+def _load(command: Dict[str, Any], ship: Ship, ports: Dict[Any, Port],
+          containers: Dict[Any, Container]) -> Command:
+    return LoadCommand(ship, command["container_id"], containers.get(command["container_id"]))
+
+
+def _unload(command: Dict[str, Any], ship: Ship, ports: Dict[Any, Port],
+            containers: Dict[Any, Container]) -> Command:
+    return UnloadCommand(ship, command["container_id"], containers.get(command["container_id"]))
+
+
+def _sail(command: Dict[str, Any], ship: Ship, ports: Dict[Any, Port],
+          containers: Dict[Any, Container]) -> Command:
+    return SailCommand(ship, command["destination_port_id"], ports.get(command["destination_port_id"]))
+
+
+def _refuel(command: Dict[str, Any], ship: Ship, ports: Dict[Any, Port],
+            containers: Dict[Any, Container]) -> Command:
+    return RefuelCommand(ship, command["amount"])
+
+
+COMPILERS: Dict[str, Callable[..., Command]] = {
+    "load": _load,
+    "unload": _unload,
+    "un_load": _unload,
+    "sail": _sail,
+    "sail_to": _sail,
+    "refuel": _refuel,
+}
+
+
+def compile_command(command: Dict[str, Any],
+                    ports: Dict[Any, Port],
+                    ships: Dict[Any, Ship],
+                    containers: Dict[Any, Container]) -> Optional[Command]:
+    """
+       Resolve the IDs referenced by a raw command record.
+
+       Args:
+           command (Dict[str, Any]): The raw command record.
+           ports (Dict[Any, Port]): Ports by ID.
+           ships (Dict[Any, Ship]): Ships by ID.
+           containers (Dict[Any, Container]): Every known container by ID.
+
+       Returns:
+           Optional[Command]: The resolved command, or None if its ship or action is unknown.
+       """
+    ship = ships.get(command["ship_id"])
+    compiler = COMPILERS.get(command["action"])
+    if ship is None or compiler is None:
+        return None
+    return compiler(command, ship, ports, containers)
+
+
+def compile_commands(commands: Iterable[Dict[str, Any]],
+                     ports: Dict[Any, Port],
+                     ships: Dict[Any, Ship],
+                     containers: Dict[Any, Container]) -> List[Command]:
+    """
+       Resolve a batch of raw command records, dropping the ones that cannot run.
+
+       Returns:
+           List[Command]: The resolved commands in their original order.
+       """
+    compiled = (compile_command(command, ports, ships, containers) for command in commands)
+    return [command for command in compiled if command is not None]
+
+
+def run_commands(commands: Iterable[Command]) -> int:
+    """
+       Execute resolved commands one after another.
+
+       Returns:
+           int: The number of commands that succeeded.
+       """
+    return sum(1 for command in commands if command.execute())
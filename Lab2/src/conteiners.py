@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Self
+from typing import Any, Dict, Optional, Self, Type
 
 
 class Container(ABC):
@@ -15,7 +15,13 @@ class Container(ABC):
                 Abstract method to calculate the consumption of the container.
             __eq__(other: Self) -> bool:
                 Checks if two containers are equal based on their class and weight.
+            to_dict() -> Dict[str, Any]:
+                Converts the container to a dictionary with its type, ID and weight.
+            from_dict(data: Dict[str, Any]) -> Container:
+                Creates a container from a dictionary made by ``to_dict``.
         """
+    __slots__ = ("id", "weight")
+
     def __init__(self, id: int,weight: float )-> None:
         self.id = id
         self.weight = weight
@@ -39,6 +45,25 @@ class Container(ABC):
         return (self.__class__.__name__ == other.__class__.__name__ and
            self.weight == other.weight)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self.__class__.__name__, "id": self.id, "weight": self.weight}
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'Container':
+        """
+              Create a container from a dictionary made by ``to_dict``.
+
+              The type is looked up in ``CONTAINER_CLASSES``, so types added with
+              ``register_container`` are restored too.
+
+              Raises:
+                  ValueError: If the container type is unknown.
+              """
+        cls = CONTAINER_CLASSES.get(data["type"])
+        if cls is None:
+            raise ValueError(f"Unknown container type {data['type']}")
+        return cls(data["id"], data["weight"])
+
 
 class BasicContainer(Container):
     """
@@ -49,6 +74,7 @@ class BasicContainer(Container):
 
        Inherits all attributes and methods from Container.
        """
+    __slots__ = ()
 
     UNIT_CONSUMPTION = 2.5
 
@@ -74,6 +100,7 @@ class HeavyContainer(Container):
 
       Inherits all attributes and methods from Container.
       """
+    __slots__ = ()
     UNIT_CONSUMPTION = 3.0
 
     def __init__(self, id: int, weight: float) -> None:
@@ -97,6 +124,7 @@ class RefrigeratedContainer(HeavyContainer):
 
         Inherits all attributes and methods from HeavyContainer.
         """
+    __slots__ = ()
     UNIT_CONSUMPTION = 5.0
 
     def __init__(self, id: int, weight: float) -> None:
@@ -121,6 +149,7 @@ class LiquidContainer(HeavyContainer):
 
         Inherits all attributes and methods from HeavyContainer.
         """
+    __slots__ = ()
     UNIT_CONSUMPTION = 4.0
 
     def __init__(self, id: int, weight: float) -> None:
@@ -136,27 +165,52 @@ class LiquidContainer(HeavyContainer):
         return LiquidContainer.UNIT_CONSUMPTION * self.weight
 
 
+BASIC_WEIGHT_LIMIT = 3000
+
+# Container classes by class name, as written by ``to_dict``.
+CONTAINER_CLASSES: Dict[str, Type[Container]] = {
+    cls.__name__: cls for cls in (BasicContainer, HeavyContainer, RefrigeratedContainer, LiquidContainer)
+}
+# Heavy container classes by the special requirement code of the input records.
+SPECIAL_CONTAINERS: Dict[str, Type[Container]] = {
+    "R": RefrigeratedContainer,
+    "L": LiquidContainer,
+}
 
-def container_factory(id: int, weight: float )-> Container:
+
+def register_container(cls: Type[Container], special: Optional[str] = None) -> Type[Container]:
+    """
+       Make a container class known to ``from_dict`` and, with a code, to ``container_factory``.
+
+       Args:
+           cls (Type[Container]): The container class.
+           special (Optional[str]): Special requirement code that selects the class for heavy containers.
+
+       Returns:
+           Type[Container]: The class itself, so this can be used as a decorator.
+       """
+    CONTAINER_CLASSES[cls.__name__] = cls
+    if special is not None:
+        SPECIAL_CONTAINERS[special] = cls
+    return cls
+
+
+def container_factory(id: int, weight: float, special: Optional[str] = None)-> Container:
     """
        Factory function to create different types of containers based on weight and special requirements.
 
+       Containers up to ``BASIC_WEIGHT_LIMIT`` are basic; heavier ones are picked by
+       their special requirement code from ``SPECIAL_CONTAINERS``.
+
        Args:
            id (int): Unique identifier for the container.
            weight (float): Weight of the container in kilograms.
            special (str, optional): Special requirement code. 'R' for refrigerated, 'L' for liquid.
 
        Returns:
-           Container: An instance of the appropriate Container subclass.
-
-       Raises:
-           ValueError: If an invalid special requirement code is provided.
+           Container: An instance of the appropriate Container subclass; heavy
+           containers with an unknown or no code are plain HeavyContainers.
        """
-    if weight <= 3000:
+    if weight <= BASIC_WEIGHT_LIMIT:
         return BasicContainer(id, weight)
-    elif special == "R":
-        return RefrigeratedContainer(id, weight)
-    elif special == "L":
-        return LiquidContainer(id, weight)
-    else:
-        return HeavyContainer(id, weight)
\ No newline at end of file
+    return SPECIAL_CONTAINERS.get(special, HeavyContainer)(id, weight)
@@ -0,0 +1,91 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from Lab2.src.conteiners import (Container, BasicContainer, HeavyContainer, BASIC_WEIGHT_LIMIT,
+                                 SPECIAL_CONTAINERS)
+from Lab2.src.port import Port
+from Lab2.src.ship import Ship, ContainerLimits
+
+
+def build_containers(records: Iterable[Dict[str, Any]]) -> List[Container]:
+    """
+       Build containers from input records in one pass.
+
+       Every record needs ``id`` and ``weight`` and may have ``special``; the class
+       is chosen like ``container_factory`` does, through the ``SPECIAL_CONTAINERS``
+       table, so registered types are built too.
+
+       Args:
+           records (Iterable[Dict[str, Any]]): Container records, e.g. from the input file.
+
+       Returns:
+           List[Container]: The containers, in the order of the records.
+       """
+    limit, basic, heavy, special = BASIC_WEIGHT_LIMIT, BasicContainer, HeavyContainer, SPECIAL_CONTAINERS
+    return [basic(record["id"], weight) if (weight := record["weight"]) <= limit
+            else special.get(record.get("special"), heavy)(record["id"], weight)
+            for record in records]
+
+
+def containers_from_columns(ids: Sequence[Any], weights: Sequence[float],
+                            specials: Optional[Sequence[Optional[str]]] = None) -> List[Container]:
+    """
+       Build containers from parallel columns of IDs, weights and special codes.
+
+       Args:
+           ids (Sequence[Any]): Container IDs.
+           weights (Sequence[float]): Container weights.
+           specials (Optional[Sequence[Optional[str]]]): Special requirement codes; none means no codes.
+
+       Returns:
+           List[Container]: One container per row.
+
+       Raises:
+           ValueError: If the columns differ in length.
+       """
+    if len(ids) != len(weights) or (specials is not None and len(specials) != len(ids)):
+        raise ValueError("Container columns must have the same length")
+    limit, basic, heavy, special = BASIC_WEIGHT_LIMIT, BasicContainer, HeavyContainer, SPECIAL_CONTAINERS
+    if specials is None:
+        return [basic(id, weight) if weight <= limit else heavy(id, weight)
+                for id, weight in zip(ids, weights)]
+    return [basic(id, weight) if weight <= limit else special.get(code, heavy)(id, weight)
+            for id, weight, code in zip(ids, weights, specials)]
+
+
+def build_ship(record: Dict[str, Any], port: Port) -> Ship:
+    """
+       Build a ship from an input record, at the given port.
+
+       Args:
+           record (Dict[str, Any]): A ship record with its ID, fuel, capacities and container limits.
+           port (Port): The port the ship starts at. The ship is not docked there.
+
+       Returns:
+           Ship: The new ship.
+       """
+    return Ship(record["id"], record["fuel"], port, record["max_weight"], record["fuel_consumption_per_km"],
+                ContainerLimits(record["max_containers"], record["max_heavy"],
+                                record["max_refrigerated"], record["max_liquid"]))
+
+
+def build_ships(records: Iterable[Dict[str, Any]], ports: Dict[Any, Port]) -> List[Ship]:
+    """
+       Build ships from input records in one pass and dock them at their ports.
+
+       Args:
+           records (Iterable[Dict[str, Any]]): Ship records with a ``port_id``.
+           ports (Dict[Any, Port]): Ports by ID.
+
+       Returns:
+           List[Ship]: The ships, in the order of the records.
+
+       Raises:
+           KeyError: If a record names an unknown port.
+       """
+    ships = []
+    for record in records:
+        port = ports[record["port_id"]]
+        ship = build_ship(record, port)
+        port.incoming_ship(ship)
+        ships.append(ship)
+    return ships
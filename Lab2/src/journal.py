@@ -0,0 +1,267 @@
+import json
+import os
+import threading
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from Lab2.src.conteiners import Container
+from Lab2.src.port import Port
+from Lab2.src.ship import Ship, ContainerLimits
+
+
+def port_state(port: Port) -> Dict[str, Any]:
+    return {
+        "id": port.id,
+        "coordinates": list(port.coordinates),
+        "containers": [container.to_dict() for container in port.containers],
+        "ship_history": list(port.ship_history),
+        "ships": [ship.id for ship in port.ships],
+    }
+
+
+def ship_state(ship: Ship) -> Dict[str, Any]:
+    return {
+        "id": ship.id,
+        "fuel": ship.fuel,
+        "port": ship.current_port.id,
+        "total_weight_capacity": ship.total_weight_capacity,
+        "fuel_consumption_per_km": ship.fuel_consumption_per_km,
+        "container_limits": asdict(ship.container_limits),
+        "containers": [container.to_dict() for container in ship.containers],
+    }
+
+
+class Journal:
+    """
+        Append-only journal of the domain events of ports and ships.
+
+        Every change of an attached port or ship is appended to the journal file
+        as one JSON line with an increasing sequence number, so a checkpoint costs
+        O(changes) instead of rewriting the whole world. ``compact`` folds the
+        journal into a snapshot of the world and starts a new, empty journal;
+        ``replay`` rebuilds the world from the snapshot and the events after it.
+
+        Compact only while no commands are running, e.g. between two batches of
+        commands: an event recorded by another thread during compaction could otherwise
+        be applied twice on replay.
+
+        Attributes:
+            path (str): Path to the journal file.
+            seq (int): Sequence number of the last recorded event.
+
+        Methods:
+            attach(entity: Union[Port, Ship]) -> None:
+                Records the full state of a port or ship and starts journaling its changes.
+
+            attach_world(ports: Dict, ships: Dict) -> None:
+                Attaches every port, then every ship.
+
+            record(event: str, **fields: Any) -> None:
+                Appends an event to the journal.
+
+            flush() -> None:
+                Makes every recorded event durable on disk.
+
+            compact(snapshot_path: str, ports: Dict, ships: Dict) -> None:
+                Writes a snapshot of the world and truncates the journal.
+        """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.seq = 0
+        _drop_torn_tail(path)
+        for event in read_events(path):
+            self.seq = event["seq"]
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+
+    def record(self, event: str, **fields: Any) -> None:
+        with self._lock:
+            self.seq += 1
+            fields["seq"] = self.seq
+            fields["event"] = event
+            self._file.write(json.dumps(fields) + "\n")
+
+    def attach(self, entity: Any) -> None:
+        if isinstance(entity, Port):
+            self.record("port_added", state=port_state(entity))
+        else:
+            self.record("ship_added", state=ship_state(entity))
+        entity.journal = self
+
+    def attach_world(self, ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+        for port in ports.values():
+            self.attach(port)
+        for ship in ships.values():
+            self.attach(ship)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def compact(self, snapshot_path: str, ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+        """
+               Fold the journal into a snapshot of the world.
+
+               The snapshot is written next to its final path and moved into place,
+               so a crash leaves either the old or the new snapshot. It remembers the
+               sequence number it covers, and replay skips older events, so a crash
+               before the journal is truncated loses nothing either.
+
+               Args:
+                   snapshot_path (str): Path to the snapshot file.
+                   ports (Dict[Any, Port]): Every port of the world by ID.
+                   ships (Dict[Any, Ship]): Every ship of the world by ID.
+               """
+        with self._lock:
+            self._file.flush()
+            snapshot = {
+                "seq": self.seq,
+                "ports": [port_state(port) for port in ports.values()],
+                "ships": [ship_state(ship) for ship in ships.values()],
+            }
+            temporary = snapshot_path + ".tmp"
+            with open(temporary, "w") as f:
+                json.dump(snapshot, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, snapshot_path)
+            self._file.close()
+            self._file = open(self.path, "w")
+            # Keeps the sequence going when the journal is reopened later.
+            self._file.write(json.dumps({"seq": self.seq, "event": "compacted"}) + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def _drop_torn_tail(path: str) -> None:
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end != len(data):
+            f.truncate(end)
+
+
+def read_events(path: str) -> Iterator[Dict[str, Any]]:
+    """
+       Read the events of a journal file in the order they were recorded.
+
+       A torn last line, left by a crash in the middle of a write, is ignored.
+       """
+    if not os.path.exists(path):
+        return
+    with open(path) as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
+def _add_port(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    state = event["state"]
+    port = Port(state["id"], tuple(state["coordinates"]))
+    for data in state["containers"]:
+        port.load_container(Container.from_dict(data))
+    port.ship_history = list(state["ship_history"])
+    # Ships are kept by ID until the replay is over, they may not exist yet.
+    port._ships = {ship_id: ship_id for ship_id in state["ships"]}
+    ports[port.id] = port
+
+
+def _add_ship(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    state = event["state"]
+    ship = Ship(state["id"], state["fuel"], ports[state["port"]], state["total_weight_capacity"],
+                state["fuel_consumption_per_km"], ContainerLimits(**state["container_limits"]))
+    for data in state["containers"]:
+        ship._add(Container.from_dict(data))
+    ships[ship.id] = ship
+
+
+def _port_container_loaded(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    ports[event["port"]].load_container(Container.from_dict(event["container"]))
+
+
+def _port_container_unloaded(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    ports[event["port"]].unload_container(event["container"])
+
+
+def _ship_arrived(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    ports[event["port"]]._ships[event["ship"]] = event["ship"]
+
+
+def _ship_left(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    ports[event["port"]]._ships.pop(event["ship"], None)
+
+
+def _ship_container_loaded(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    ships[event["ship"]]._add(Container.from_dict(event["container"]))
+
+
+def _ship_container_unloaded(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    ship = ships[event["ship"]]
+    ship.un_load(ship._containers[event["container"]])
+
+
+def _ship_sailed(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    ship = ships[event["ship"]]
+    ship.current_port = ports[event["port"]]
+    ship.fuel = event["fuel"]
+
+
+def _ship_refueled(event: Dict[str, Any], ports: Dict[Any, Port], ships: Dict[Any, Ship]) -> None:
+    ships[event["ship"]].re_fuel(event["amount"])
+
+
+APPLY: Dict[str, Callable[[Dict[str, Any], Dict[Any, Port], Dict[Any, Ship]], None]] = {
+    "port_added": _add_port,
+    "ship_added": _add_ship,
+    "port_container_loaded": _port_container_loaded,
+    "port_container_unloaded": _port_container_unloaded,
+    "ship_arrived": _ship_arrived,
+    "ship_left": _ship_left,
+    "ship_container_loaded": _ship_container_loaded,
+    "ship_container_unloaded": _ship_container_unloaded,
+    "ship_sailed": _ship_sailed,
+    "ship_refueled": _ship_refueled,
+    "compacted": lambda event, ports, ships: None,
+}
+
+
+def replay(journal_path: str,
+           snapshot_path: Optional[str] = None) -> Tuple[Dict[Any, Port], Dict[Any, Ship]]:
+    """
+       Rebuild the world from a snapshot and the journal recorded after it.
+
+       The rebuilt ports and ships are not attached to any journal.
+
+       Args:
+           journal_path (str): Path to the journal file.
+           snapshot_path (Optional[str]): Path to the snapshot written by ``Journal.compact``, if any.
+
+       Returns:
+           Tuple[Dict[Any, Port], Dict[Any, Ship]]: Ports and ships by ID.
+       """
+    ports: Dict[Any, Port] = {}
+    ships: Dict[Any, Ship] = {}
+    seq = 0
+    if snapshot_path is not None and os.path.exists(snapshot_path):
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+        seq = snapshot["seq"]
+        for state in snapshot["ports"]:
+            _add_port({"state": state}, ports, ships)
+        for state in snapshot["ships"]:
+            _add_ship({"state": state}, ports, ships)
+
+    for event in read_events(journal_path):
+        if event["seq"] > seq:
+            APPLY[event["event"]](event, ports, ships)
+
+    for port in ports.values():
+        port._ships = {ship_id: ships[ship_id] for ship_id in port._ships if ship_id in ships}
+    return ports, ships
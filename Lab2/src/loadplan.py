@@ -0,0 +1,217 @@
+from bisect import bisect_left, insort
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from Lab2.src.commands import LoadCommand
+from Lab2.src.port import Port
+from Lab2.src.ship import Ship, container_kinds
+
+# Room left on a ship: weight, containers, heavy, refrigerated and liquid containers.
+Room = Tuple[float, int, int, int, int]
+Kinds = Tuple[int, int, int]
+
+
+class _Hold:
+    """
+        Free room of one ship while a plan is built, with the planned
+        containers kept sorted by weight for the swap search.
+        """
+    __slots__ = ("weight", "count", "heavy", "refrigerated", "liquid", "planned")
+
+    def __init__(self, room: Room) -> None:
+        self.weight, self.count, self.heavy, self.refrigerated, self.liquid = room
+        self.planned: List[Tuple[float, int]] = []
+
+    def fits(self, weight: float, kinds: Kinds) -> bool:
+        return (self.count >= 1 and weight <= self.weight and kinds[0] <= self.heavy
+                and kinds[1] <= self.refrigerated and kinds[2] <= self.liquid)
+
+    def replaces(self, weight: float, kinds: Kinds, old_weight: float, old_kinds: Kinds) -> bool:
+        return (weight - old_weight <= self.weight and kinds[0] - old_kinds[0] <= self.heavy
+                and kinds[1] - old_kinds[1] <= self.refrigerated and kinds[2] - old_kinds[2] <= self.liquid)
+
+    def swaps(self, weight: float, kinds: Kinds, all_kinds: Sequence[Kinds]) -> Iterator[Tuple[float, int]]:
+        # Planned containers that ``weight`` could replace, lightest first.
+        planned = self.planned
+        for position in range(bisect_left(planned, (weight - self.weight, -1)), len(planned)):
+            old_weight, old = planned[position]
+            if self.replaces(weight, kinds, old_weight, all_kinds[old]):
+                yield old_weight, old
+
+    def add(self, index: int, weight: float, kinds: Kinds) -> None:
+        insort(self.planned, (weight, index))
+        self.weight -= weight
+        self.count -= 1
+        self.heavy -= kinds[0]
+        self.refrigerated -= kinds[1]
+        self.liquid -= kinds[2]
+
+    def remove(self, index: int, weight: float, kinds: Kinds) -> None:
+        self.planned.remove((weight, index))
+        self.weight += weight
+        self.count += 1
+        self.heavy += kinds[0]
+        self.refrigerated += kinds[1]
+        self.liquid += kinds[2]
+
+
+def _best_fit(holds: List[_Hold], weight: float, kinds: Kinds, numbers: Optional[Iterable[int]] = None) -> int:
+    best, best_left = -1, None
+    for number in range(len(holds)) if numbers is None else numbers:
+        hold = holds[number]
+        if hold.fits(weight, kinds) and (best_left is None or hold.weight - weight < best_left):
+            best, best_left = number, hold.weight - weight
+    return best
+
+
+def _bounds(holds: List[_Hold]) -> Tuple[List[int], float, float]:
+    open_holds = [number for number, hold in enumerate(holds) if hold.count]
+    most_room = max((holds[number].weight for number in open_holds), default=-1.0)
+    lightest = min((hold.planned[0][0] for hold in holds if hold.planned), default=float("inf"))
+    return open_holds, most_room, lightest
+
+
+def _improve(holds: List[_Hold], placement: List[int], index: int, weights: Sequence[float],
+             kinds: Sequence[Kinds], bounds: Tuple[List[int], float, float]) -> bool:
+    weight, kind = weights[index], kinds[index]
+    open_holds, most_room, lightest = bounds
+    number = _best_fit(holds, weight, kind, open_holds)
+    if number >= 0:
+        holds[number].add(index, weight, kind)
+        placement[index] = number
+        return True
+    if weight <= lightest and most_room < lightest:
+        return False
+    # Best-fit decreasing leaves no lighter container that the new one could simply replace, so
+    # the replaced one has to move to another ship, unless the limits on heavy, refrigerated or
+    # liquid containers made the difference; then dropping a lighter one still gains weight.
+    for number, hold in enumerate(holds):
+        for old_weight, old in hold.swaps(weight, kind, kinds):
+            if old_weight > most_room and old_weight >= weight:
+                break
+            target = _best_fit(holds, old_weight, kinds[old], (other for other in open_holds if other != number))
+            if target < 0 and old_weight >= weight:
+                continue
+            hold.remove(old, old_weight, kinds[old])
+            hold.add(index, weight, kind)
+            placement[index], placement[old] = number, target
+            if target >= 0:
+                holds[target].add(old, old_weight, kinds[old])
+            return True
+    return False
+
+
+def assign(weights: Sequence[float], kinds: Sequence[Kinds], rooms: Sequence[Room],
+           refine: bool = True, max_rounds: int = 10) -> List[int]:
+    """
+       Assign containers to ships so that as much weight as possible is loaded.
+
+       Containers are placed heaviest first, each on the ship it leaves the
+       least free weight on (best-fit decreasing). The optional refinement then
+       tries every container left behind again: it goes on a ship that has room
+       for it, or replaces a planned container that moves to another ship, or,
+       failing that, replaces a lighter planned container that is left behind.
+       Every move loads strictly more weight, and the search stops after a
+       round without one or after ``max_rounds`` rounds.
+
+       The arguments are plain numbers, so the function can run in a worker process.
+
+       Args:
+           weights (Sequence[float]): Container weights.
+           kinds (Sequence[Kinds]): Heavy, refrigerated and liquid flags of every container.
+           rooms (Sequence[Room]): Free room of every ship, see ``Ship.remaining_capacity``.
+           refine (bool): Whether to run the swap search after the greedy pass.
+           max_rounds (int): Maximum number of swap rounds.
+
+       Returns:
+           List[int]: The ship number of every container, or -1 for containers left at the port.
+       """
+    holds = [_Hold(room) for room in rooms]
+    placement = [-1] * len(weights)
+    order = sorted(range(len(weights)), key=weights.__getitem__, reverse=True)
+    for index in order:
+        number = _best_fit(holds, weights[index], kinds[index])
+        if number >= 0:
+            holds[number].add(index, weights[index], kinds[index])
+            placement[index] = number
+
+    for _ in range(max_rounds if refine else 0):
+        improved = False
+        bounds = _bounds(holds)
+        for index in order:
+            if placement[index] < 0 and _improve(holds, placement, index, weights, kinds, bounds):
+                improved = True
+                bounds = _bounds(holds)
+        if not improved:
+            break
+    return placement
+
+
+def _problem(port: Port) -> Tuple[list, list, list, list, list]:
+    ships = [ship for ship in port.ships if ship.current_port is port]
+    containers = list(port.containers)
+    return (ships, containers, [container.weight for container in containers],
+            [container_kinds(container) for container in containers],
+            [ship.remaining_capacity() for ship in ships])
+
+
+def _commands(ships: List[Ship], containers: List[Any], placement: List[int]) -> List[LoadCommand]:
+    chosen = sorted((number, -container.weight, position)
+                    for position, (number, container) in enumerate(zip(placement, containers)) if number >= 0)
+    return [LoadCommand(ships[number], containers[position].id, containers[position])
+            for number, _, position in chosen]
+
+
+def plan_port(port: Port, refine: bool = True, max_rounds: int = 10) -> List[LoadCommand]:
+    """
+       Plan how to load the containers of a port onto the ships docked there.
+
+       Nothing is changed; running the returned commands, e.g. with
+       ``run_commands``, carries the plan out.
+
+       Args:
+           port (Port): The port.
+           refine (bool): Whether to improve the greedy plan with the swap search.
+           max_rounds (int): Maximum number of swap rounds.
+
+       Returns:
+           List[LoadCommand]: One command per planned container, grouped by ship, heaviest first.
+       """
+    ships, containers, weights, kinds, rooms = _problem(port)
+    if not ships or not containers:
+        return []
+    return _commands(ships, containers, assign(weights, kinds, rooms, refine, max_rounds))
+
+
+def plan_fleet(ports: Iterable[Port], refine: bool = True, max_rounds: int = 10,
+               max_workers: Optional[int] = None) -> List[LoadCommand]:
+    """
+       Plan the loading of every port, solving the ports in parallel.
+
+       Ports share no containers and no docked ships, so every port is an
+       independent problem. The problems are reduced to plain numbers and
+       solved in a process pool, which sidesteps the GIL; the commands are
+       built back in this process from the returned assignments. With
+       ``max_workers=1`` or a single port to solve, everything runs in-process.
+
+       Args:
+           ports (Iterable[Port]): The ports.
+           refine (bool): Whether to improve the greedy plans with the swap search.
+           max_rounds (int): Maximum number of swap rounds per port.
+           max_workers (Optional[int]): Size of the process pool.
+
+       Returns:
+           List[LoadCommand]: The commands of every port, port after port.
+       """
+    problems = [problem for problem in map(_problem, ports) if problem[0] and problem[1]]
+    if len(problems) < 2 or max_workers == 1:
+        placements = [assign(weights, kinds, rooms, refine, max_rounds)
+                      for _, _, weights, kinds, rooms in problems]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            placements = list(pool.map(assign, *zip(*(problem[2:] for problem in problems)),
+                                       [refine] * len(problems), [max_rounds] * len(problems)))
+    commands: List[LoadCommand] = []
+    for (ships, containers, *_), placement in zip(problems, placements):
+        commands.extend(_commands(ships, containers, placement))
+    return commands
@@ -1,96 +1,102 @@
-import json
+from typing import Any, Dict, Optional
+
+from Lab2.src.commands import compile_command, compile_commands, run_commands
+from Lab2.src.distance import use_backend
+from Lab2.src.metrics import registry
 from Lab2.src.port import Port
+from Lab2.src.reader import iter_records, load_records
+from Lab2.src.factories import build_ship
 from Lab2.src.ship import Ship
-from Lab2.src.conteiners import BasicContainer, RefrigeratedContainer, LiquidContainer, HeavyContainer
+from Lab2.src.conteiners import Container, container_factory
+
+
+def handle_entry(entry: Dict[str, Any],
+                 ports: Dict[int, Port],
+                 ships: Dict[Any, Ship],
+                 containers: Dict[Any, Container]) -> None:
+    try:
+        if entry["type"] == "port":
+            port = Port(entry["id"], (entry["latitude"], entry["longitude"]))
+            ports[port.id] = port
+
+        elif entry["type"] == "ship":
+            if entry["port_id"] in ports:
+                port = ports[entry["port_id"]]
+                ship = build_ship(entry, port)
+                port.incoming_ship(ship)
+                ships[ship.id] = ship
+            else:
+                print(f"Port ID {entry['port_id']} not found for Ship {entry['id']}")
+
+        elif entry["type"] == "container":
+            container = container_factory(entry["id"], entry["weight"], entry.get("special"))
+
+            if entry["port_id"] in ports:
+                port = ports[entry["port_id"]]
+                port.load_container(container)
+                containers[container.id] = container
+            else:
+                print(f"Port ID {entry['port_id']} not found for Container {entry['id']}")
+
+    except KeyError as e:
+        print(f"Missing key: {e} in entry: {entry}")
+    except Exception as e:
+        print(f"Error processing entry: {entry}. Error: {e}")
 
 
-def main():
-    with open("input.json") as f:
-        data = json.load(f)
+def main(filename: str = "input.json", stream: bool = False,
+         metrics_file: Optional[str] = None, distance_backend: Optional[str] = None) -> None:
+    """
+        Build the world described by an input file and run its commands.
+
+        By default the whole file is parsed first, every entity is created and
+        only then the commands are executed. With ``stream=True`` the records are
+        parsed one by one and each of them is handled as soon as it arrives, so
+        memory use stays flat no matter how large the file is. Commands then see
+        only the entities declared before them in the file.
+
+        Args:
+            filename (str): Path to the input JSON file.
+            stream (bool): Handle records in a single streaming pass.
+            metrics_file (Optional[str]): Collect operation metrics during the run and
+                write them here, as JSON for ``.json`` files and Prometheus text otherwise.
+            distance_backend (Optional[str]): ``"haversine"`` for fast distances, ``"geodesic"`` for
+                precise ones; geopy is only imported for the latter. By default the shared
+                distance cache keeps the backend it has.
+        """
+    if distance_backend is not None:
+        use_backend(distance_backend)
+    if metrics_file is not None:
+        registry.enable()
+        try:
+            main(filename, stream)
+        finally:
+            registry.save(metrics_file)
+            registry.disable()
+        return
 
     ports = {}
     ships = {}
+    containers = {}
+
+    if stream:
+        for record in iter_records(filename):
+            if "action" in record:
+                command = compile_command(record, ports, ships, containers)
+                if command is not None:
+                    command.execute()
+            else:
+                handle_entry(record, ports, ships, containers)
+        return
+
+    data = load_records(filename)
 
     for entry in data:
-        try:
-            if entry["type"] == "port":
-                port = Port(entry["id"], (entry["latitude"], entry["longitude"]))
-                ports[port.id] = port
-
-            elif entry["type"] == "ship":
-                if entry["port_id"] in ports:
-                    port = ports[entry["port_id"]]
-                    container_limits = Ship.ContainerLimits(
-                        max_all_containers=entry["max_containers"],
-                        max_heavy_containers=entry["max_heavy"],
-                        max_refrigerated_containers=entry["max_refrigerated"],
-                        max_liquid_containers=entry["max_liquid"]
-                    )
-                    ship = Ship(
-                        id=entry["id"],
-                        fuel=entry["fuel"],
-                        current_port=port,
-                        total_weight_capacity=entry["max_weight"],
-                        fuel_consumption_per_km=entry["fuel_consumption_per_km"],
-                        container_limits=container_limits
-                    )
-                    port.incoming_ship(ship)
-                    ships[ship.id] = ship
-                else:
-                    print(f"Port ID {entry['port_id']} not found for Ship {entry['id']}")
-
-            elif entry["type"] == "container":
-                if entry["weight"] <= 3000:
-                    container = BasicContainer(entry["id"], entry["weight"])
-                else:
-                    if entry["special"] == "R":
-                        container = RefrigeratedContainer(entry["id"], entry["weight"])
-                    elif entry["special"] == "L":
-                        container = LiquidContainer(entry["id"], entry["weight"])
-                    else:
-                        container = HeavyContainer(entry["id"], entry["weight"])
-
-                if entry["port_id"] in ports:
-                    port = ports[entry["port_id"]]
-                    port.containers.append(container)
-                else:
-                    print(f"Port ID {entry['port_id']} not found for Container {entry['id']}")
-
-        except KeyError as e:
-            print(f"Missing key: {e} in entry: {entry}")
-        except Exception as e:
-            print(f"Error processing entry: {entry}. Error: {e}")
-
-    for command in data:
-        if "action" in command:
-            ship = ships.get(command["ship_id"])
-
-            if command["action"] == "load" and ship:
-                port = ship.current_port
-                container = next((c for c in port.containers if c.id == command["container_id"]), None)
-                if container and ship.load(container):
-                    port.containers.remove(container)
-                    print(f"Container {container.id} loaded onto Ship {ship.id}")
-                else:
-                    print(f"Container {command['container_id']} cannot be loaded onto Ship {ship.id}")
-
-            elif command["action"] == "un_load" and ship:
-                container = next((c for c in ship.containers if c.id == command["container_id"]), None)
-                if container and ship.un_load(container):
-                    print(f"Container {container.id} unloaded from Ship {ship.id}")
-                else:
-                    print(f"Container {command['container_id']} cannot be unloaded from Ship {ship.id}")
-
-            elif command["action"] == "sail" and ship:
-                destination_port = ports.get(command["destination_port_id"])
-                if destination_port and ship.sail_to(destination_port):
-                    print(f"Ship {ship.id} sailed to Port {destination_port.id}")
-                else:
-                    print(f"Ship {ship.id} failed to sail to Port {destination_port.id}")
-
-            elif command["action"] == "refuel" and ship:
-                ship.re_fuel(command["amount"])
-                print(f"Ship {ship.id} refueled by {command['amount']} units. Current fuel: {ship.fuel}")
+        if "action" not in entry:
+            handle_entry(entry, ports, ships, containers)
+
+    commands = compile_commands((entry for entry in data if "action" in entry), ports, ships, containers)
+    run_commands(commands)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,225 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from Lab2.src.commands import LoadCommand, UnloadCommand, SailCommand, RefuelCommand
+from Lab2.src.port import Port
+from Lab2.src.ship import Ship
+
+LATENCY_BUCKETS: Tuple[float, ...] = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+
+class Counter:
+    """
+        Monotonic counter.
+
+        Attributes:
+            name (str): Metric name.
+            help (str): One-line description.
+            value (int): Current value.
+        """
+    def __init__(self, name: str, help: str) -> None:
+        self.name = name
+        self.help = help
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """
+        Histogram of observed values with fixed bucket upper bounds.
+
+        Attributes:
+            name (str): Metric name.
+            help (str): One-line description.
+            buckets (Tuple[float, ...]): Upper bounds of the buckets, ascending.
+            counts (List[int]): Number of observations per bucket, plus one for +Inf.
+            sum (float): Sum of all observations.
+            count (int): Number of observations.
+        """
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return result
+
+
+class MetricsRegistry:
+    """
+        Opt-in registry of counters and latency histograms for model operations.
+
+        Operations are registered with ``instrument`` but left untouched until
+        ``enable`` swaps them for timed wrappers; ``disable`` puts the original
+        methods back. While metrics are disabled there is no wrapper at all, so
+        the overhead is zero.
+
+        For every instrumented operation ``<name>`` the registry keeps
+        ``<name>_total`` (calls), ``<name>_failures_total`` (calls that returned
+        a failure or raised) and ``<name>_seconds`` (latency histogram).
+
+        Methods:
+            instrument(cls: type, method: str, name: str, failed: Callable[[Any], bool]) -> None:
+                Registers a method to be timed while metrics are enabled.
+
+            enable() -> None / disable() -> None:
+                Installs or removes the timed wrappers.
+
+            to_prometheus() -> str:
+                Renders all metrics in the Prometheus text exposition format.
+
+            to_dict() -> Dict[str, Any]:
+                Returns all metrics as plain data.
+
+            save(filename: str) -> None:
+                Writes a JSON snapshot for ``.json`` files and Prometheus text otherwise.
+        """
+    def __init__(self) -> None:
+        self.counters: Dict[str, Counter] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.enabled = False
+        self._started: Optional[float] = None
+        self._instruments: List[Tuple[type, str, str, Callable[[Any], bool]]] = []
+        self._originals: Dict[Tuple[type, str], Callable] = {}
+
+    def counter(self, name: str, help: str) -> Counter:
+        if name not in self.counters:
+            self.counters[name] = Counter(name, help)
+        return self.counters[name]
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(name, help, buckets)
+        return self.histograms[name]
+
+    def instrument(self, cls: type, method: str, name: str,
+                   failed: Callable[[Any], bool] = lambda result: result is False) -> None:
+        self._instruments.append((cls, method, name, failed))
+        if self.enabled:
+            self._wrap(cls, method, name, failed)
+
+    def _wrap(self, cls: type, method: str, name: str, failed: Callable[[Any], bool]) -> None:
+        original = cls.__dict__[method]
+        calls = self.counter(f"{name}_total", f"Calls of {cls.__name__}.{method}")
+        failures = self.counter(f"{name}_failures_total", f"Failed calls of {cls.__name__}.{method}")
+        latency = self.histogram(f"{name}_seconds", f"Latency of {cls.__name__}.{method} in seconds")
+        clock = time.perf_counter
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                result = original(*args, **kwargs)
+            except BaseException:
+                latency.observe(clock() - start)
+                calls.inc()
+                failures.inc()
+                raise
+            latency.observe(clock() - start)
+            calls.inc()
+            if failed(result):
+                failures.inc()
+            return result
+
+        timed.__wrapped__ = original
+        timed.__name__ = original.__name__
+        timed.__doc__ = original.__doc__
+        self._originals[(cls, method)] = original
+        setattr(cls, method, timed)
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        for cls, method, name, failed in self._instruments:
+            self._wrap(cls, method, name, failed)
+        self.enabled = True
+        self._started = time.time()
+
+    def disable(self) -> None:
+        for (cls, method), original in self._originals.items():
+            setattr(cls, method, original)
+        self._originals.clear()
+        self.enabled = False
+
+    def reset(self) -> None:
+        self.counters.clear()
+        self.histograms.clear()
+        self._started = time.time() if self.enabled else None
+        if self.enabled:
+            self.disable()
+            self.enable()
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for counter in self.counters.values():
+            lines.append(f"# HELP {counter.name} {counter.help}")
+            lines.append(f"# TYPE {counter.name} counter")
+            lines.append(f"{counter.name} {counter.value}")
+        for histogram in self.histograms.values():
+            lines.append(f"# HELP {histogram.name} {histogram.help}")
+            lines.append(f"# TYPE {histogram.name} histogram")
+            for bound, count in histogram.cumulative():
+                lines.append(f'{histogram.name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f"{histogram.name}_sum {histogram.sum!r}")
+            lines.append(f"{histogram.name}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = time.time() - self._started if self._started is not None else 0.0
+        return {
+            "elapsed_seconds": elapsed,
+            "counters": {name: counter.value for name, counter in self.counters.items()},
+            "histograms": {
+                name: {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+                    "per_second": histogram.count / elapsed if elapsed else 0.0,
+                    "buckets": dict(histogram.cumulative()),
+                }
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+    def save(self, filename: str) -> None:
+        with open(filename, "w") as f:
+            if filename.endswith(".json"):
+                json.dump(self.to_dict(), f, indent=4)
+            else:
+                f.write(self.to_prometheus())
+
+
+registry = MetricsRegistry()
+
+registry.instrument(Port, "load_container", "port_load_container")
+registry.instrument(Port, "unload_container", "port_unload_container", failed=lambda result: result is None)
+registry.instrument(Ship, "load", "ship_load")
+registry.instrument(Ship, "un_load", "ship_unload")
+registry.instrument(Ship, "sail_to", "ship_sail")
+registry.instrument(Ship, "re_fuel", "ship_refuel")
+registry.instrument(LoadCommand, "execute", "command_load")
+registry.instrument(UnloadCommand, "execute", "command_unload")
+registry.instrument(SailCommand, "execute", "command_sail")
+registry.instrument(RefuelCommand, "execute", "command_refuel")
@@ -1,15 +1,16 @@
-from typing import Protocol, Any, Tuple, List, Self
+from typing import Protocol, Any, Tuple, List, Self, Dict, Optional, ValuesView, Iterable, Mapping
 
+from Lab2.src.berths import BerthScheduler
 from Lab2.src.conteiners import Container
-
-from geopy import distance
+from Lab2.src.distance import distance_cache
+from Lab2.src.totals import ContainerTotals
 
 
 class IPort(Protocol):
-    def incoming_ship(self, ship: Any)-> None:
+    def incoming_ship(self, ship: Any)-> bool:
         ...
 
-    def outgoing_ship(self, ship: Any)-> None:
+    def outgoing_ship(self, ship: Any)-> List[Any]:
         ...
 
 
@@ -23,59 +24,202 @@ class Port:
         Attributes:
             id (int): Unique identifier for the port.
             coordinates (Tuple[float, float]): Geographic coordinates of the port (latitude, longitude).
-            containers (List[Container]): List of containers currently at the port.
+            containers (ValuesView[Container]): Read-only view of the containers currently at the port.
+            total_weight (float): Total weight of the containers at the port.
+            total_consumption (float): Total consumption of the containers at the port.
+            count_by_type (Mapping[str, int]): Number of containers at the port per type name.
+            weight_by_type (Mapping[str, float]): Weight of the containers at the port per type name.
             ship_history (List[int]): List of IDs of ships that have visited the port.
-            ships (List[Any]): List of ships currently docked at the port.
+            ships (Tuple[Any, ...]): Ships currently docked at the port, read-only; use
+                ``incoming_ship`` and ``outgoing_ship`` to change them.
+            journal (Optional[Journal]): Event journal the port reports its changes to, if any.
+            berths (Optional[BerthScheduler]): Berth and crane capacity of the port; None means unlimited.
 
         Methods:
             get_distance(port: Self) -> float:
                 Calculates the distance between this port and another port.
 
-            incoming_ship(ship: Any) -> None:
-                Registers a ship as having arrived at the port.
+            get_container(container_id: Any) -> Optional[Container]:
+                Finds a container stored in the port by its ID.
+
+            load_container(container: Container) -> bool:
+                Stores a container in the port.
+
+            unload_container(container_id: Any) -> Optional[Container]:
+                Removes a container from the port.
 
-            outgoing_ship(ship: Any) -> None:
-                Registers a ship as having departed from the port.
+            incoming_ship(ship: Any, now: float = 0.0, ...) -> bool:
+                Docks an arriving ship, or queues it for a berth.
+
+            outgoing_ship(ship: Any, now: float = 0.0) -> List[Any]:
+                Registers a ship as having departed from the port and docks the ships waiting for its berth.
         """
     def __init__(self, id: int, coordinates: Tuple[float, float])-> None:
         self.id: int = id
-        self.coordinates: Tuple[float, float] = coordinates
-        self.containers: List[Container] = []
+        self._coordinates: Tuple[float, float] = tuple(coordinates)
+        self._containers: Dict[Any, Container] = {}
+        self._totals = ContainerTotals()
         self.ship_history: List[int] = []
-        self.ships: List[Any] = []
+        self._ships: Dict[Any, Any] = {}
+        self.journal = None
+        self.berths: Optional[BerthScheduler] = None
+
+    @property
+    def coordinates(self) -> Tuple[float, float]:
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates: Tuple[float, float]) -> None:
+        coordinates = tuple(coordinates)
+        if coordinates != self._coordinates:
+            distance_cache.invalidate(self._coordinates)
+            self._coordinates = coordinates
+
+    @property
+    def ships(self) -> Tuple[Any, ...]:
+        return tuple(self._ships.values())
+
+    @ships.setter
+    def ships(self, ships: Iterable[Any]) -> None:
+        self._ships = {ship.id: ship for ship in ships}
+
+    def is_docked(self, ship: Any) -> bool:
+        return ship.id in self._ships
+
+    @property
+    def containers(self) -> ValuesView[Container]:
+        return self._containers.values()
+
+    @property
+    def total_weight(self) -> float:
+        return self._totals.weight
+
+    @property
+    def total_consumption(self) -> float:
+        return self._totals.consumption
+
+    @property
+    def count_by_type(self) -> Mapping[str, int]:
+        return self._totals.count_by_type
+
+    @property
+    def weight_by_type(self) -> Mapping[str, float]:
+        return self._totals.weight_by_type
+
+    def get_container(self, container_id: Any) -> Optional[Container]:
+        """
+               Find a container stored in the port.
+
+               Args:
+                   container_id (Any): The ID of the container.
+
+               Returns:
+                   Optional[Container]: The container, or None if it is not in the port.
+               """
+        return self._containers.get(container_id)
+
+    def load_container(self, container: Container) -> bool:
+        """
+               Store a container in the port.
+
+               Args:
+                   container (Container): The container to store.
+
+               Returns:
+                   bool: True if the container was stored, False if a container with the same ID is already there.
+               """
+        if container.id in self._containers:
+            return False
+        self._containers[container.id] = container
+        self._totals.add(container)
+        if self.journal is not None:
+            self.journal.record("port_container_loaded", port=self.id, container=container.to_dict())
+        return True
+
+    def unload_container(self, container_id: Any) -> Optional[Container]:
+        """
+               Remove a container from the port.
+
+               Args:
+                   container_id (Any): The ID of the container to remove.
+
+               Returns:
+                   Optional[Container]: The removed container, or None if it was not in the port.
+               """
+        container = self._containers.pop(container_id, None)
+        if container is not None:
+            self._totals.remove(container)
+            if self.journal is not None:
+                self.journal.record("port_container_unloaded", port=self.id, container=container_id)
+        return container
 
     def get_distance(self, port: Self)-> float:
         """
                Calculate the distance between this port and another port.
 
+               Distances are memoized in the shared distance cache, so repeated
+               trips between the same ports compute the distance only once. The
+               cache uses the fast haversine backend unless ``use_backend("geodesic")``
+               asks for the precise one.
+
                Args:
                    port (Port): The other port to calculate the distance to.
 
                Returns:
                    float: The distance in kilometers between the two ports.
                """
-        return distance.geodesic(port.coordinates, self.coordinates).km
+        return distance_cache.get(port.coordinates, self.coordinates)
 
-    def incoming_ship(self, ship: Any) -> None:
+    def incoming_ship(self, ship: Any, now: float = 0.0, service_hours: float = 0.0,
+                      deadline: Optional[float] = None, cranes: int = 1) -> bool:
         """
                Register a ship as having arrived at the port.
 
-               If the ship is not already in the port's list of ships, it is added.
+               Docked ships are indexed by ID, so checking for an already docked ship
+               takes constant time. Without a berth scheduler every ship docks at once;
+               with one the ship docks only if a berth and cranes are free and waits in
+               the queue of the scheduler otherwise, until ``outgoing_ship`` frees them.
 
                Args:
                    ship (Any): The ship that has arrived at the port.
-               """
-        if ship not in self.ships:
-            self.ships.append(ship)
+                   now (float): The current time in hours, for the berth scheduler.
+                   service_hours (float): Expected time at the berth, for the berth scheduler.
+                   deadline (Optional[float]): Time the ship should be done by, for the berth scheduler.
+                   cranes (int): Cranes the ship needs, for the berth scheduler.
 
-    def outgoing_ship(self, ship: Any) -> None:
+               Returns:
+                   bool: True if the ship is docked, False if it waits for a berth.
+               """
+        if ship.id in self._ships:
+            return True
+        if self.berths is not None and not self.berths.request(ship.id, ship, now, service_hours,
+                                                                deadline, cranes):
+            return False
+        self._dock(ship)
+        return True
+
+    def _dock(self, ship: Any) -> None:
+        self._ships[ship.id] = ship
+        if self.journal is not None:
+            self.journal.record("ship_arrived", port=self.id, ship=ship.id)
+
+    def outgoing_ship(self, ship: Any, now: float = 0.0) -> List[Any]:
         """
                Register a ship as having departed from the port.
 
-               If the ship is in the port's list of ships, it is removed.
+               If the ship is docked, it is removed and its berth goes to the next
+               waiting ships; a ship still waiting for a berth just leaves the queue.
 
                Args:
                    ship (Any): The ship that has departed from the port.
+                   now (float): The current time in hours, for the berth scheduler.
+
+               Returns:
+                   List[Any]: The waiting ships that got the freed berth and are now docked.
                """
-        if ship in self.ships:
-            self.ships.remove(ship)
\ No newline at end of file
+        admitted = self.berths.release(ship.id, now) if self.berths is not None else []
+        if self._ships.pop(ship.id, None) is not None and self.journal is not None:
+            self.journal.record("ship_left", port=self.id, ship=ship.id)
+        for waiting in admitted:
+            self._dock(waiting)
+        return admitted
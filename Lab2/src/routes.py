@@ -0,0 +1,210 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from Lab2.src.distance import EARTH_RADIUS_KM
+from Lab2.src.port import Port
+
+
+@dataclass
+class Route:
+    """
+        A planned voyage through a sequence of ports.
+
+        Attributes:
+            ports (List[Port]): Ports of the route, from the start to the destination.
+            legs (List[float]): Fuel needed for every leg, computed with ``Port.get_distance``.
+
+        Methods:
+            refuels(fuel: float) -> List[float]:
+                Returns how much fuel to take on before every leg, starting with ``fuel`` on board.
+        """
+    ports: List[Port]
+    legs: List[float] = field(default_factory=list)
+
+    @property
+    def hops(self) -> int:
+        return len(self.legs)
+
+    @property
+    def total_fuel(self) -> float:
+        return sum(self.legs)
+
+    def refuels(self, fuel: float) -> List[float]:
+        amounts = []
+        for leg in self.legs:
+            amount = max(0.0, leg - fuel)
+            # Rounding must not leave the ship a hair short of the leg.
+            while fuel + amount < leg:
+                amount = math.nextafter(amount, math.inf)
+            amounts.append(amount)
+            fuel += amount - leg
+        return amounts
+
+
+class RoutePlanner:
+    """
+        Finds multi-hop routes between ports for ships that can refuel on the way.
+
+        Ports are the nodes of a complete graph; a leg between two ports is usable
+        when its fuel cost, distance times ``fuel_consumption_per_km``, fits in the
+        tank. The search runs on great-circle distances computed with numpy for a
+        whole row of ports at once: minimum-fuel routes use A* with the distance
+        to the destination as the heuristic, minimum-hop routes a breadth-first
+        search that breaks ties by fuel. The legs of the found route are then
+        costed with ``Port.get_distance`` and the shared distance cache.
+
+        Great-circle and geodesic distances differ by up to about half a percent,
+        so the range of a leg is shrunk by ``tolerance`` to keep every planned leg
+        within the tank when the distance cache uses the geodesic backend as well.
+
+        Attributes:
+            ports (List[Port]): The ports the planner routes between.
+            tolerance (float): Relative safety margin on the range of a leg.
+
+        Methods:
+            precompute() -> None:
+                Computes the full distance matrix, so that later queries reuse it.
+
+            route(source: Port, target: Port, fuel_per_km: float, tank: float, objective: str) -> Optional[Route]:
+                Finds the route with the least fuel or the fewest hops.
+
+            plan(ship: Ship, target: Port, tank: Optional[float], objective: str) -> Optional[Route]:
+                Finds a route for a ship from its current port.
+        """
+    def __init__(self, ports: Iterable[Port], tolerance: float = 0.006) -> None:
+        self.ports: List[Port] = list(ports)
+        self.tolerance = tolerance
+        self._index: Dict[int, int] = {id(port): i for i, port in enumerate(self.ports)}
+        lat, lon = np.radians(np.array([port.coordinates for port in self.ports], dtype=np.float64).reshape(-1, 2)).T
+        # Unit vectors: the cosine of the central angle between two ports is a dot product.
+        self._xyz = np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+        self._matrix: Optional[np.ndarray] = None
+
+    def _km(self, cosines: np.ndarray) -> np.ndarray:
+        return EARTH_RADIUS_KM * np.arccos(np.clip(cosines, -1.0, 1.0))
+
+    def _row(self, i: int) -> np.ndarray:
+        if self._matrix is not None:
+            return self._matrix[i]
+        return self._km(self._xyz @ self._xyz[i])
+
+    def _legs(self, sources: np.ndarray, max_km: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+               Find every usable leg out of the given ports.
+
+               Returns:
+                   Tuple[np.ndarray, np.ndarray, np.ndarray]: Positions in ``sources``,
+                   destination ports and lengths in kilometers of the legs.
+               """
+        if self._matrix is not None:
+            km = self._matrix[sources]
+            rows, targets = np.nonzero(km <= max_km)
+            return rows, targets, km[rows, targets]
+        cosines = self._xyz[sources] @ self._xyz.T
+        rows, targets = np.nonzero(cosines >= math.cos(min(max_km / EARTH_RADIUS_KM, math.pi)))
+        return rows, targets, self._km(cosines[rows, targets])
+
+    def precompute(self) -> None:
+        self._matrix = self._km(self._xyz @ self._xyz.T)
+
+    def route(self, source: Port, target: Port, fuel_per_km: float, tank: float,
+              objective: str = "fuel") -> Optional[Route]:
+        """
+               Find a route between two ports for a ship that refuels at every stop.
+
+               Args:
+                   source (Port): The port the ship starts from.
+                   target (Port): The destination port.
+                   fuel_per_km (float): Fuel the ship burns per kilometer.
+                   tank (float): The most fuel the ship can carry into a single leg.
+                   objective (str): ``"fuel"`` for the least total fuel or ``"hops"``
+                       for the fewest legs, ties broken by fuel.
+
+               Returns:
+                   Optional[Route]: The route, or None if the destination cannot be reached.
+
+               Raises:
+                   ValueError: If the objective is unknown.
+               """
+        if objective not in ("fuel", "hops"):
+            raise ValueError(f"Unknown route objective: {objective}")
+        start, goal = self._index[id(source)], self._index[id(target)]
+        max_km = tank / fuel_per_km / (1 + self.tolerance) if fuel_per_km > 0 else float("inf")
+        search = self._least_fuel if objective == "fuel" else self._fewest_hops
+        parents = search(start, goal, max_km)
+        if parents is None:
+            return None
+
+        path = [goal]
+        while path[-1] != start:
+            path.append(int(parents[path[-1]]))
+        ports = [self.ports[i] for i in reversed(path)]
+        legs = [a.get_distance(b) * fuel_per_km for a, b in zip(ports, ports[1:])]
+        return Route(ports, legs)
+
+    def _least_fuel(self, start: int, goal: int, max_km: float) -> Optional[np.ndarray]:
+        n = len(self.ports)
+        cost = np.full(n, np.inf)
+        parents = np.full(n, -1, dtype=np.int64)
+        done = np.zeros(n, dtype=bool)
+        heuristic = self._row(goal)
+        cost[start] = 0.0
+        while True:
+            estimate = np.where(done, np.inf, cost + heuristic)
+            current = int(np.argmin(estimate))
+            if not np.isfinite(estimate[current]):
+                return None
+            if current == goal:
+                return parents
+            done[current] = True
+            _, targets, km = self._legs(np.array([current]), max_km)
+            candidate = cost[current] + km
+            better = (candidate < cost[targets]) & ~done[targets]
+            cost[targets[better]] = candidate[better]
+            parents[targets[better]] = current
+
+    def _fewest_hops(self, start: int, goal: int, max_km: float) -> Optional[np.ndarray]:
+        n = len(self.ports)
+        cost = np.full(n, np.inf)
+        parents = np.full(n, -1, dtype=np.int64)
+        seen = np.zeros(n, dtype=bool)
+        cost[start] = 0.0
+        seen[start] = True
+        level = np.array([start])
+        while level.size and not seen[goal]:
+            for block in np.array_split(level, -(-level.size // 256)):
+                rows, targets, km = self._legs(block, max_km)
+                keep = ~seen[targets]
+                rows, targets = rows[keep], targets[keep]
+                candidate = cost[block[rows]] + km[keep]
+                # The cheapest leg into every newly reached port.
+                order = np.lexsort((candidate, targets))
+                targets, first = np.unique(targets[order], return_index=True)
+                candidate, sources = candidate[order][first], block[rows[order][first]]
+                better = candidate < cost[targets]
+                cost[targets[better]] = candidate[better]
+                parents[targets[better]] = sources[better]
+            reached = ~seen & np.isfinite(cost)
+            seen |= reached
+            level = np.flatnonzero(reached)
+        return parents if seen[goal] else None
+
+    def plan(self, ship: 'Ship', target: Port, tank: Optional[float] = None,
+             objective: str = "fuel") -> Optional[Route]:
+        """
+               Find a route for a ship from its current port.
+
+               Args:
+                   ship (Ship): The ship to plan for.
+                   target (Port): The destination port.
+                   tank (Optional[float]): Tank capacity of the ship; defaults to the fuel it has now.
+                   objective (str): ``"fuel"`` or ``"hops"``, see ``route``.
+
+               Returns:
+                   Optional[Route]: The route, or None if the destination cannot be reached.
+               """
+        return self.route(ship.current_port, target, ship.fuel_consumption_per_km,
+                          ship.fuel if tank is None else tank, objective)
@@ -1,11 +1,15 @@
-from typing import List
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, ValuesView
 
 from dataclasses import dataclass
+from operator import attrgetter
 
-from Lab2.src.conteiners import Container
+from Lab2.src.conteiners import Container, HeavyContainer, RefrigeratedContainer, LiquidContainer
+from Lab2.src.totals import ContainerTotals
 
 
 class IShip:
+    __slots__ = ()
+
     def sail_to(self, port: 'port') -> bool:
         ...
 
@@ -22,7 +26,7 @@ class IShip:
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerLimits:
     max_all_containers: int
     max_heavy_containers: int
@@ -30,6 +34,31 @@ class ContainerLimits:
     max_liquid_containers: int
 
 
+_KINDS: Dict[type, Tuple[int, int, int]] = {}
+
+
+def container_kinds(container: Container) -> Tuple[int, int, int]:
+    """
+       Classify a container for the per-type limits of a ship.
+
+       Refrigerated and liquid containers are heavy containers too, so they
+       count against ``max_heavy_containers`` as well as their own limit.
+
+       Args:
+           container (Container): The container to classify.
+
+       Returns:
+           Tuple[int, int, int]: 1 or 0 for heavy, refrigerated and liquid.
+       """
+    cls = type(container)
+    kinds = _KINDS.get(cls)
+    if kinds is None:
+        kinds = _KINDS[cls] = (int(issubclass(cls, HeavyContainer)),
+                               int(issubclass(cls, RefrigeratedContainer)),
+                               int(issubclass(cls, LiquidContainer)))
+    return kinds
+
+
 class Ship(IShip):
     """
        Represents a ship that can transport containers between ports.
@@ -44,7 +73,13 @@ class Ship(IShip):
            total_weight_capacity (int): Maximum weight the ship can carry.
            fuel_consumption_per_km (float): Amount of fuel consumed per kilometer traveled.
            container_limits (ContainerLimits): Limits for different types of containers.
-           containers (List[Container]): List of containers currently loaded on the ship.
+           containers (ValuesView[Container]): Read-only view of the containers currently loaded on the ship.
+           current_weight (float): Total weight of the loaded containers.
+           total_weight (float): Same as ``current_weight``.
+           total_consumption (float): Total consumption of the loaded containers.
+           count_by_type (Mapping[str, int]): Number of loaded containers per type name.
+           weight_by_type (Mapping[str, float]): Weight of the loaded containers per type name.
+           journal (Optional[Journal]): Event journal the ship reports its changes to, if any.
 
        Methods:
            get_current_containers() -> List[Container]:
@@ -53,15 +88,33 @@ class Ship(IShip):
            sail_to(port: Port) -> bool:
                Attempts to sail the ship to the given port, consuming fuel in the process.
 
+           sail_route(route: Route) -> bool:
+               Sails a planned multi-hop route, refueling at the stops where the route needs it.
+
            re_fuel(amount: float) -> None:
                Adds the specified amount of fuel to the ship.
 
+           can_load(container: Container) -> bool:
+               Checks in O(1) whether a container fits within every limit of the ship.
+
+           remaining_capacity() -> Tuple[float, int, int, int, int]:
+               Returns the room left under the weight limit and every container limit.
+
            load(container: Container) -> bool:
                Attempts to load a container onto the ship.
 
+           plan_load(containers: Iterable[Container]) -> List[Container]:
+               Chooses which of the given containers fit on the ship, without loading them.
+
+           load_many(containers: Iterable[Container]) -> List[Container]:
+               Loads as many of the given containers as the limits allow.
+
            un_load(container: Container) -> bool:
                Attempts to unload a container from the ship.
        """
+    __slots__ = ("id", "fuel", "current_port", "total_weight_capacity",
+                 "fuel_consumption_per_km", "container_limits", "_containers",
+                 "current_weight", "_heavy", "_refrigerated", "_liquid", "_totals", "journal")
 
     def __init__(self,
                  id: int,
@@ -76,7 +129,33 @@ class Ship(IShip):
         self.total_weight_capacity = total_weight_capacity
         self.fuel_consumption_per_km = fuel_consumption_per_km
         self.container_limits = container_limits
-        self.containers: List[Container] = []
+        self._containers: Dict[Any, Container] = {}
+        self.current_weight = 0.0
+        self._heavy = 0
+        self._refrigerated = 0
+        self._liquid = 0
+        self._totals = ContainerTotals()
+        self.journal = None
+
+    @property
+    def containers(self) -> ValuesView[Container]:
+        return self._containers.values()
+
+    @property
+    def total_weight(self) -> float:
+        return self.current_weight
+
+    @property
+    def total_consumption(self) -> float:
+        return self._totals.consumption
+
+    @property
+    def count_by_type(self) -> Mapping[str, int]:
+        return self._totals.count_by_type
+
+    @property
+    def weight_by_type(self) -> Mapping[str, float]:
+        return self._totals.weight_by_type
 
     def get_current_containers(self) -> List[Container]:
         return sorted(self.containers, key=lambda x: x.id)
@@ -88,20 +167,151 @@ class Ship(IShip):
         if self.fuel >= required_fuel:
             self.fuel -= required_fuel
             self.current_port = port
+            if self.journal is not None:
+                self.journal.record("ship_sailed", ship=self.id, port=port.id, fuel=self.fuel)
             return True
         return False
 
+    def sail_route(self, route: 'Route') -> bool:
+        """
+               Sail a route found by ``RoutePlanner`` leg by leg.
+
+               Before every leg the ship takes on just enough fuel for it, if what
+               it has is not enough. Sailing stops at the first leg that fails.
+
+               Args:
+                   route (Route): The route; it must start at the current port of the ship.
+
+               Returns:
+                   bool: True if the ship reached the last port of the route, False otherwise.
+               """
+        if not route.ports or route.ports[0] is not self.current_port:
+            return False
+        for port, amount in zip(route.ports[1:], route.refuels(self.fuel)):
+            if amount:
+                self.re_fuel(amount)
+            if not self.sail_to(port):
+                return False
+        return True
+
     def re_fuel(self, amount: float) -> None:
         self.fuel += amount
+        if self.journal is not None:
+            self.journal.record("ship_refueled", ship=self.id, amount=amount)
+
+    def can_load(self, container: Container) -> bool:
+        # Only real containers: container_kinds classifies by class, so anything else would count as basic.
+        if not isinstance(container, Container) or container.id in self._containers:
+            return False
+        return self._fits(container, len(self._containers), self.current_weight,
+                          self._heavy, self._refrigerated, self._liquid)
+
+    def remaining_capacity(self) -> Tuple[float, int, int, int, int]:
+        """
+               Measure how much more the ship can take under each of its limits.
+
+               Returns:
+                   Tuple[float, int, int, int, int]: Free weight, free container places and
+                   free heavy, refrigerated and liquid container places.
+               """
+        limits = self.container_limits
+        return (self.total_weight_capacity - self.current_weight,
+                limits.max_all_containers - len(self._containers),
+                limits.max_heavy_containers - self._heavy,
+                limits.max_refrigerated_containers - self._refrigerated,
+                limits.max_liquid_containers - self._liquid)
+
+    def _fits(self, container: Container, count: int, weight: float,
+              heavy: int, refrigerated: int, liquid: int) -> bool:
+        limits = self.container_limits
+        is_heavy, is_refrigerated, is_liquid = container_kinds(container)
+        return (count < limits.max_all_containers
+                and weight + container.weight <= self.total_weight_capacity
+                and heavy + is_heavy <= limits.max_heavy_containers
+                and refrigerated + is_refrigerated <= limits.max_refrigerated_containers
+                and liquid + is_liquid <= limits.max_liquid_containers)
+
+    def _add(self, container: Container) -> None:
+        is_heavy, is_refrigerated, is_liquid = container_kinds(container)
+        self._containers[container.id] = container
+        self.current_weight += container.weight
+        self._heavy += is_heavy
+        self._refrigerated += is_refrigerated
+        self._liquid += is_liquid
+        self._totals.add(container)
+        if self.journal is not None:
+            self.journal.record("ship_container_loaded", ship=self.id, container=container.to_dict())
 
     def load(self, container: Container) -> bool:
-        if len(self.containers) < self.container_limits.max_all_containers:
-            self.containers.append(container)
+        if self.can_load(container):
+            self._add(container)
             return True
         return False
 
+    def plan_load(self, containers: Iterable[Container]) -> List[Container]:
+        """
+               Choose which containers to load, heaviest first (first-fit decreasing).
+
+               Every limit of the ship is honored: the total number of containers,
+               the number of heavy, refrigerated and liquid containers and the total
+               weight. Running counters make each check O(1), so planning costs
+               O(n log n) for the sort. The ship itself is not changed.
+
+               Args:
+                   containers (Iterable[Container]): Candidate containers, e.g. ``port.containers``.
+
+               Returns:
+                   List[Container]: The containers that fit, heaviest first.
+               """
+        count = len(self._containers)
+        weight = self.current_weight
+        heavy, refrigerated, liquid = self._heavy, self._refrigerated, self._liquid
+        max_count = self.container_limits.max_all_containers
+        planned: List[Container] = []
+        seen = set(self._containers)
+
+        for container in sorted(containers, key=attrgetter("weight"), reverse=True):
+            if count >= max_count:
+                break
+            if (container.id in seen or not isinstance(container, Container)
+                    or not self._fits(container, count, weight, heavy, refrigerated, liquid)):
+                continue
+            is_heavy, is_refrigerated, is_liquid = container_kinds(container)
+            seen.add(container.id)
+            planned.append(container)
+            count += 1
+            weight += container.weight
+            heavy += is_heavy
+            refrigerated += is_refrigerated
+            liquid += is_liquid
+        return planned
+
+    def load_many(self, containers: Iterable[Container]) -> List[Container]:
+        """
+               Load as many of the given containers as the limits of the ship allow.
+
+               Args:
+                   containers (Iterable[Container]): Candidate containers, e.g. ``port.containers``.
+
+               Returns:
+                   List[Container]: The containers that were loaded. The caller is
+                   responsible for removing them from wherever they came from.
+               """
+        planned = self.plan_load(containers)
+        for container in planned:
+            self._add(container)
+        return planned
+
     def un_load(self, container: Container) -> bool:
-        if container in self.containers:
-            self.containers.remove(container)
+        if self._containers.get(container.id) is container:
+            del self._containers[container.id]
+            is_heavy, is_refrigerated, is_liquid = container_kinds(container)
+            self.current_weight -= container.weight
+            self._heavy -= is_heavy
+            self._refrigerated -= is_refrigerated
+            self._liquid -= is_liquid
+            self._totals.remove(container)
+            if self.journal is not None:
+                self.journal.record("ship_container_unloaded", ship=self.id, container=container.id)
             return True
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,186 @@
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from Lab2.src.commands import Command, LoadCommand, UnloadCommand, SailCommand, RefuelCommand
+
+
+class Simulation:
+    """
+        Discrete-event engine driven by a priority-queue clock.
+
+        Events are (time, sequence, action, arguments) entries of a binary heap,
+        so scheduling and taking the next event cost O(log n). Events at the same
+        time run in the order they were scheduled.
+
+        Attributes:
+            now (float): Current simulated time in hours.
+            processed (int): Number of events run so far.
+
+        Methods:
+            schedule(delay: float, action: Callable, *args: Any) -> None:
+                Runs ``action(*args)`` after ``delay`` hours of simulated time.
+
+            run(until: Optional[float] = None, max_events: Optional[int] = None) -> int:
+                Runs events in time order and returns how many were run.
+        """
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.processed = 0
+        self._queue: List[Tuple[float, int, Callable[..., Any], Tuple[Any, ...]]] = []
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def schedule(self, delay: float, action: Callable[..., Any], *args: Any) -> None:
+        if delay < 0:
+            raise ValueError("Events cannot be scheduled in the past")
+        heapq.heappush(self._queue, (self.now + delay, next(self._sequence), action, args))
+
+    def run(self, until: Optional[float] = None, max_events: Optional[int] = None) -> int:
+        """
+               Run events in time order.
+
+               Args:
+                   until (Optional[float]): Stop before the first event later than this time.
+                   max_events (Optional[int]): Stop after this many events.
+
+               Returns:
+                   int: The number of events run by this call.
+               """
+        queue = self._queue
+        pop = heapq.heappop
+        processed = 0
+        while queue and (max_events is None or processed < max_events):
+            if until is not None and queue[0][0] > until:
+                self.now = until
+                break
+            self.now, _, action, args = pop(queue)
+            action(*args)
+            processed += 1
+        self.processed += processed
+        return processed
+
+
+@dataclass(slots=True)
+class Timing:
+    """
+        How long the operations of a ship take, in hours.
+
+        Attributes:
+            speed_km_per_hour (float): Cruising speed of every ship.
+            handling_hours (float): Time to load or unload one container.
+            refuel_per_hour (float): Fuel units taken on per hour.
+        """
+    speed_km_per_hour: float = 35.0
+    handling_hours: float = 0.05
+    refuel_per_hour: float = 5000.0
+
+
+class FleetSimulation(Simulation):
+    """
+        Runs the commands of many ships concurrently in simulated time.
+
+        Every ship works through its own commands in order, one at a time, while
+        all ships progress in parallel on the shared clock. A voyage leaves the
+        port with ``Port.outgoing_ship``, lasts the distance divided by the speed
+        and ends with ``Ship.sail_to`` and ``Port.incoming_ship`` at the
+        destination (or back at the origin if the ship lacked fuel). Loading,
+        unloading and refueling take ``Timing`` hours and then run their command.
+
+        A port with a berth scheduler may have no free berth for an arriving ship;
+        the ship then waits, with the time its next operations at the port will
+        take as its expected service time, and carries on once a departing ship
+        hands it the berth.
+
+        Attributes:
+            timing (Timing): Durations of the operations.
+            succeeded (int): Number of commands that succeeded.
+            failed (int): Number of commands that failed.
+
+        Methods:
+            submit(commands: Iterable[Command]) -> FleetSimulation:
+                Queues commands behind the ones their ship already has.
+        """
+    def __init__(self, timing: Optional[Timing] = None) -> None:
+        super().__init__()
+        self.timing = timing or Timing()
+        self.succeeded = 0
+        self.failed = 0
+        self._pending: Dict[int, Deque[Command]] = {}
+        self._waiting: Dict[int, Tuple[Any, Deque[Command]]] = {}
+        self._durations: Dict[type, Callable[[Any], float]] = {
+            LoadCommand: self._handling,
+            UnloadCommand: self._handling,
+            RefuelCommand: self._refueling,
+        }
+
+    def _handling(self, command: Any) -> float:
+        return self.timing.handling_hours
+
+    def _refueling(self, command: RefuelCommand) -> float:
+        return command.amount / self.timing.refuel_per_hour
+
+    def submit(self, commands: Iterable[Command]) -> 'FleetSimulation':
+        for command in commands:
+            ship = command.ship
+            queue = self._pending.get(id(ship))
+            if queue is None:
+                queue = self._pending[id(ship)] = deque()
+                self.schedule(0.0, self._next, ship, queue)
+            queue.append(command)
+        return self
+
+    def _next(self, ship: Any, queue: Deque[Command]) -> None:
+        if not queue:
+            del self._pending[id(ship)]
+            return
+        command = queue.popleft()
+        if isinstance(command, SailCommand):
+            self._depart(ship, queue, command)
+        else:
+            self.schedule(self._durations[type(command)](command), self._finish, ship, queue, command)
+
+    def _finish(self, ship: Any, queue: Deque[Command], command: Command) -> None:
+        if command.execute():
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self._next(ship, queue)
+
+    def _depart(self, ship: Any, queue: Deque[Command], command: SailCommand) -> None:
+        destination = command.destination_port
+        origin = ship.current_port
+        if destination is None:
+            self._finish(ship, queue, command)
+            return
+        self._berthed(origin.outgoing_ship(ship, self.now))
+        hours = origin.get_distance(destination) / self.timing.speed_km_per_hour
+        self.schedule(hours, self._arrive, ship, queue, command)
+
+    def _arrive(self, ship: Any, queue: Deque[Command], command: SailCommand) -> None:
+        if command.execute():
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        if ship.current_port.incoming_ship(ship, self.now, self._service_hours(queue)):
+            self._next(ship, queue)
+        else:
+            self._waiting[id(ship)] = (ship, queue)
+
+    def _service_hours(self, queue: Deque[Command]) -> float:
+        hours = 0.0
+        for command in queue:
+            if isinstance(command, SailCommand):
+                break
+            hours += self._durations[type(command)](command)
+        return hours
+
+    def _berthed(self, ships: List[Any]) -> None:
+        for ship in ships:
+            waiting = self._waiting.pop(id(ship), None)
+            if waiting is not None:
+                self.schedule(0.0, self._next, *waiting)
@@ -0,0 +1,196 @@
+import heapq
+import math
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+from Lab2.src.distance import EARTH_RADIUS_KM, haversine_km
+
+T = TypeVar("T")
+Cell = Tuple[int, int]
+
+
+class SpatialIndex(Generic[T]):
+    """
+        Grid index over latitude and longitude for nearest and radius queries.
+
+        The globe is cut into square cells of ``cell_degrees``; every item lives
+        in the cell of its coordinates. A radius query only looks at the cells the
+        circle can touch, and a k-nearest query searches rings of cells around the
+        query point until no unsearched cell can hold anything closer, so both cost
+        about the number of items near the point instead of the size of the set.
+        Longitudes wrap around the antimeridian and queries near the poles widen
+        to every longitude. Distances are great-circle kilometers.
+
+        Items are stored by identity, so any object works as long as ``location``
+        returns its (latitude, longitude). When the coordinates of an indexed item
+        change, call ``update``.
+
+        Attributes:
+            cell_degrees (float): Size of a cell in degrees.
+            location (Callable[[T], Tuple[float, float]]): Returns the coordinates of an item.
+
+        Methods:
+            insert(item: T) -> None:
+                Adds an item, or moves it if it is already indexed.
+
+            remove(item: T) -> bool:
+                Removes an item.
+
+            update(item: T) -> None:
+                Moves an item to the cell of its current coordinates.
+
+            nearest(latitude: float, longitude: float, k: int = 1) -> List[Tuple[float, T]]:
+                Returns the k closest items with their distances, closest first.
+
+            within(latitude: float, longitude: float, radius_km: float) -> List[Tuple[float, T]]:
+                Returns every item within the radius with its distance, closest first.
+        """
+    def __init__(self,
+                 items: Iterable[T] = (),
+                 cell_degrees: float = 1.0,
+                 location: Callable[[T], Tuple[float, float]] = lambda port: port.coordinates) -> None:
+        if cell_degrees <= 0:
+            raise ValueError("cell_degrees must be positive")
+        self.cell_degrees = cell_degrees
+        self.location = location
+        self._rows = math.ceil(180 / cell_degrees)
+        self._columns = math.ceil(360 / cell_degrees)
+        self._cells: Dict[Cell, Dict[int, Tuple[float, float, T]]] = {}
+        self._cell_of: Dict[int, Cell] = {}
+        for item in items:
+            self.insert(item)
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self._cell_of
+
+    def __iter__(self) -> Iterator[T]:
+        for cell in self._cells.values():
+            for _, _, item in cell.values():
+                yield item
+
+    def _cell(self, latitude: float, longitude: float) -> Cell:
+        row = min(int((latitude + 90) // self.cell_degrees), self._rows - 1)
+        column = int((longitude + 180) // self.cell_degrees) % self._columns
+        return row, column
+
+    def insert(self, item: T) -> None:
+        if id(item) in self._cell_of:
+            self.remove(item)
+        latitude, longitude = self.location(item)
+        cell = self._cell(latitude, longitude)
+        self._cells.setdefault(cell, {})[id(item)] = (latitude, longitude, item)
+        self._cell_of[id(item)] = cell
+
+    def remove(self, item: T) -> bool:
+        cell = self._cell_of.pop(id(item), None)
+        if cell is None:
+            return False
+        entries = self._cells[cell]
+        del entries[id(item)]
+        if not entries:
+            del self._cells[cell]
+        return True
+
+    def update(self, item: T) -> None:
+        self.insert(item)
+
+    def _scan(self, cells: Iterable[Cell], latitude: float, longitude: float) -> Iterator[Tuple[float, T]]:
+        for cell in cells:
+            entries = self._cells.get(cell)
+            if entries:
+                for lat, lon, item in entries.values():
+                    yield haversine_km((latitude, longitude), (lat, lon)), item
+
+    def within(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[float, T]]:
+        """
+               Find every item within a radius of a point.
+
+               Args:
+                   latitude (float): Latitude of the point.
+                   longitude (float): Longitude of the point.
+                   radius_km (float): The radius in kilometers.
+
+               Returns:
+                   List[Tuple[float, T]]: Distances and items, closest first.
+               """
+        if radius_km < 0 or not self._cell_of:
+            return []
+        longitude = (longitude + 180) % 360 - 180
+        angle = radius_km / EARTH_RADIUS_KM
+        spread = math.degrees(angle)
+        row_low = max(0, int((latitude - spread + 90) // self.cell_degrees))
+        row_high = min(self._rows - 1, int((latitude + spread + 90) // self.cell_degrees))
+
+        cos_latitude = math.cos(math.radians(latitude))
+        if latitude - spread <= -90 or latitude + spread >= 90 or math.sin(angle) >= cos_latitude:
+            columns = range(self._columns)
+        else:
+            # Widest longitude difference of a circle of this radius.
+            half_width = math.degrees(math.asin(math.sin(angle) / cos_latitude))
+            first = int((longitude - half_width + 180) // self.cell_degrees)
+            last = int((longitude + half_width + 180) // self.cell_degrees)
+            columns = range(first, last + 1) if last - first + 1 < self._columns else range(self._columns)
+
+        cells = {(row, column % self._columns) for row in range(row_low, row_high + 1) for column in columns}
+        found = [(km, item) for km, item in self._scan(cells, latitude, longitude) if km <= radius_km]
+        found.sort(key=lambda pair: pair[0])
+        return found
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1) -> List[Tuple[float, T]]:
+        """
+               Find the k items closest to a point.
+
+               Args:
+                   latitude (float): Latitude of the point.
+                   longitude (float): Longitude of the point.
+                   k (int): How many items to return.
+
+               Returns:
+                   List[Tuple[float, T]]: Up to k distances and items, closest first.
+               """
+        k = min(k, len(self._cell_of))
+        if k <= 0:
+            return []
+        longitude = (longitude + 180) % 360 - 180
+        row, column = self._cell(latitude, longitude)
+        cos_latitude = math.cos(math.radians(latitude))
+        best: List[Tuple[float, int, T]] = []  # max-heap of the k closest, by negated distance
+        seen = set()
+        ring = 0
+        while True:
+            cells = set()
+            for r in range(row - ring, row + ring + 1):
+                if 0 <= r < self._rows:
+                    step = 1 if abs(r - row) == ring else 2 * ring
+                    for c in range(column - ring, column + ring + 1, max(step, 1)):
+                        cell = (r, c % self._columns)
+                        if cell not in seen:
+                            seen.add(cell)
+                            cells.add(cell)
+            for km, item in self._scan(cells, latitude, longitude):
+                if len(best) < k:
+                    heapq.heappush(best, (-km, id(item), item))
+                elif km < -best[0][0]:
+                    heapq.heapreplace(best, (-km, id(item), item))
+
+            # Anything not searched yet lies outside the searched latitudes or longitudes.
+            lat_low = (row - ring) * self.cell_degrees - 90
+            lat_high = (row + ring + 1) * self.cell_degrees - 90
+            bound = math.inf
+            if lat_low > -90:
+                bound = min(bound, math.radians(latitude - lat_low) * EARTH_RADIUS_KM)
+            if lat_high < 90:
+                bound = min(bound, math.radians(lat_high - latitude) * EARTH_RADIUS_KM)
+            if 2 * ring + 1 < self._columns:
+                west = (column - ring) * self.cell_degrees - 180
+                east = (column + ring + 1) * self.cell_degrees - 180
+                gap = math.radians(min(longitude - west, east - longitude, 90))
+                bound = min(bound, math.asin(min(1.0, cos_latitude * math.sin(gap))) * EARTH_RADIUS_KM)
+
+            if (len(best) == k and -best[0][0] <= bound) or bound == math.inf:
+                break
+            ring += 1
+
+        return [(-negated, item) for negated, _, item in sorted(best, key=lambda entry: -entry[0])]
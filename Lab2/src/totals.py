@@ -0,0 +1,73 @@
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping
+
+from Lab2.src.conteiners import Container
+
+
+class ContainerTotals:
+    """
+        Running totals over a changing set of containers.
+
+        Every ``add`` and ``remove`` updates the totals in O(1), so reading them
+        never loops over the containers. A container must keep its weight while
+        it is counted. Totals of a type are dropped, and the overall sums reset to
+        zero, when its last container is removed, so floating-point drift from
+        long add/remove sequences cannot outlive the containers that caused it.
+
+        Attributes:
+            count (int): Number of containers.
+            weight (float): Total weight of the containers.
+            consumption (float): Sum of ``consumption()`` of the containers.
+            count_by_type (Mapping[str, int]): Read-only number of containers per type name.
+            weight_by_type (Mapping[str, float]): Read-only weight of the containers per type name.
+
+        Methods:
+            add(container: Container) -> None:
+                Counts a container in.
+
+            remove(container: Container) -> None:
+                Counts a container out.
+        """
+    __slots__ = ("count", "weight", "consumption", "_count_by_type", "_weight_by_type")
+
+    def __init__(self, containers: Iterable[Container] = ()) -> None:
+        self.count = 0
+        self.weight = 0.0
+        self.consumption = 0.0
+        self._count_by_type: Dict[str, int] = {}
+        self._weight_by_type: Dict[str, float] = {}
+        for container in containers:
+            self.add(container)
+
+    @property
+    def count_by_type(self) -> Mapping[str, int]:
+        return MappingProxyType(self._count_by_type)
+
+    @property
+    def weight_by_type(self) -> Mapping[str, float]:
+        return MappingProxyType(self._weight_by_type)
+
+    def add(self, container: Container) -> None:
+        kind = container.__class__.__name__
+        self.count += 1
+        self.weight += container.weight
+        self.consumption += container.consumption()
+        self._count_by_type[kind] = self._count_by_type.get(kind, 0) + 1
+        self._weight_by_type[kind] = self._weight_by_type.get(kind, 0.0) + container.weight
+
+    def remove(self, container: Container) -> None:
+        kind = container.__class__.__name__
+        self.count -= 1
+        if self.count:
+            self.weight -= container.weight
+            self.consumption -= container.consumption()
+        else:
+            self.weight = 0.0
+            self.consumption = 0.0
+        left = self._count_by_type[kind] - 1
+        if left:
+            self._count_by_type[kind] = left
+            self._weight_by_type[kind] -= container.weight
+        else:
+            del self._count_by_type[kind]
+            del self._weight_by_type[kind]
@@ -0,0 +1,128 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from Lab2.src.distance import BACKENDS, DistanceCache, distance_cache, haversine_km, register_backend, use_backend
+from Lab2.src.main import main
+
+ODESA = (46.4825, 30.7326)
+VARNA = (43.2141, 27.9147)
+ISTANBUL = (41.0082, 28.9784)
+
+
+class TestDistanceCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def counting(a, b):
+            self.calls.append((a, b))
+            return haversine_km(a, b)
+
+        register_backend("counting", counting)
+
+    def tearDown(self):
+        del BACKENDS["counting"]
+
+    def test_pairs_are_symmetric_and_computed_once(self):
+        cache = DistanceCache(backend="counting")
+        km = cache.get(ODESA, VARNA)
+        self.assertAlmostEqual(km, haversine_km(ODESA, VARNA))
+        self.assertEqual(cache.get(VARNA, ODESA), km)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+
+    def test_least_recently_used_pair_is_evicted(self):
+        cache = DistanceCache(maxsize=2, backend="counting")
+        cache.get(ODESA, VARNA)
+        cache.get(ODESA, ISTANBUL)
+        cache.get(VARNA, ODESA)
+        cache.get(VARNA, ISTANBUL)
+        self.assertEqual(len(cache), 2)
+        cache.get(ODESA, VARNA)
+        self.assertEqual(len(self.calls), 3)
+        cache.get(ODESA, ISTANBUL)
+        self.assertEqual(len(self.calls), 4)
+
+    def test_precompute_refreshes_cached_pairs(self):
+        cache = DistanceCache(maxsize=2, backend="counting")
+        cache.get(ODESA, VARNA)
+        cache.get(ODESA, ISTANBUL)
+        cache.precompute([VARNA, ODESA])
+        cache.get(VARNA, ISTANBUL)
+        self.assertEqual(len(self.calls), 3)
+        cache.get(ODESA, VARNA)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_invalidate_drops_every_pair_of_a_point(self):
+        cache = DistanceCache(backend="counting")
+        cache.precompute([ODESA, VARNA, ISTANBUL])
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.invalidate(ODESA), 2)
+        self.assertEqual(len(cache), 1)
+        cache.get(VARNA, ISTANBUL)
+        self.assertEqual(cache.hits, 1)
+
+    def test_switching_backend_drops_old_distances(self):
+        cache = DistanceCache(backend="counting")
+        cache.get(ODESA, VARNA)
+        cache.set_backend("haversine")
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(KeyError):
+            cache.set_backend("flat-earth")
+
+    def test_distance_of_a_replaced_backend_is_not_cached(self):
+        cache = DistanceCache(backend="counting")
+        register_backend("switching", lambda a, b: cache.set_backend("counting") or 1.0)
+        try:
+            cache.set_backend("switching")
+            self.assertEqual(cache.get(ODESA, VARNA), 1.0)
+        finally:
+            del BACKENDS["switching"]
+        self.assertEqual((cache.backend, len(cache)), ("counting", 0))
+
+    def test_saved_cache_is_loaded_for_its_backend_only(self):
+        cache = DistanceCache(backend="counting")
+        cache.precompute([ODESA, VARNA, ISTANBUL])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "distances.json")
+            cache.save(path)
+            self.assertEqual(len(DistanceCache(path=path, backend="counting")), 3)
+            self.assertEqual(len(DistanceCache(path=path)), 0)
+
+
+class TestGeodesicBackend(unittest.TestCase):
+    def tearDown(self):
+        use_backend("haversine")
+
+    def test_geopy_is_not_imported_by_default(self):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        code = "import sys, Lab2.src.main, Lab2.src.routes; print('geopy' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_main_keeps_the_chosen_backend(self):
+        use_backend("geodesic")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.json")
+            with open(path, "w") as f:
+                f.write("[]")
+            with contextlib.redirect_stdout(io.StringIO()):
+                main(path)
+        self.assertEqual(distance_cache.backend, "geodesic")
+
+    def test_missing_geopy_fails_only_the_geodesic_backend(self):
+        with mock.patch.dict(sys.modules, {"geopy": None, "geopy.distance": None}):
+            use_backend("geodesic")
+            with self.assertRaises(ImportError):
+                distance_cache.get(ODESA, VARNA)
+            self.assertEqual(len(distance_cache), 0)
+            use_backend("haversine")
+            self.assertAlmostEqual(distance_cache.get(ODESA, VARNA), haversine_km(ODESA, VARNA))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import contextlib
+import io
+import random
+import unittest
+from Lab2.src.commands import run_commands
+from Lab2.src.conteiners import container_factory
+from Lab2.src.loadplan import assign, plan_fleet, plan_port
+from Lab2.src.port import Port
+from Lab2.src.ship import ContainerLimits, Ship
+
+
+def build_port(port_id, seed, containers=60, ships=3):
+    rng = random.Random(seed)
+    port = Port(port_id, (rng.uniform(-60, 60), rng.uniform(-170, 170)))
+    for i in range(containers):
+        port.load_container(container_factory(f"{port_id}-{i}", rng.randint(100, 6000),
+                                              rng.choice((None, "R", "L"))))
+    for s in range(ships):
+        port.incoming_ship(Ship(f"{port_id}-{s}", 1000, port, rng.randint(10_000, 40_000), 1.0,
+                                ContainerLimits(rng.randint(5, 20), rng.randint(2, 10),
+                                                rng.randint(0, 3), rng.randint(0, 3))))
+    return port
+
+
+class TestAssign(unittest.TestCase):
+    def assertFeasible(self, weights, kinds, rooms, placement):
+        for number, room in enumerate(rooms):
+            chosen = [index for index, ship in enumerate(placement) if ship == number]
+            self.assertLessEqual(sum(weights[index] for index in chosen), room[0])
+            self.assertLessEqual(len(chosen), room[1])
+            for kind in range(3):
+                self.assertLessEqual(sum(kinds[index][kind] for index in chosen), room[2 + kind])
+
+    def test_refinement_moves_a_container_to_make_room(self):
+        weights, kinds = [7, 4], [(0, 0, 0), (1, 0, 0)]
+        rooms = [(12, 1, 0, 1, 1), (8, 1, 2, 0, 1)]
+        self.assertEqual(assign(weights, kinds, rooms, refine=False), [1, -1])
+        self.assertEqual(assign(weights, kinds, rooms), [0, 1])
+
+    def test_plans_honor_every_limit_and_never_load_less(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            weights = [rng.randint(1, 20) for _ in range(rng.randint(1, 12))]
+            kinds = [rng.choice(((0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 0, 1))) for _ in weights]
+            rooms = [(rng.randint(0, 40), rng.randint(0, 4), rng.randint(0, 3), rng.randint(0, 2), rng.randint(0, 2))
+                     for _ in range(rng.randint(1, 3))]
+            greedy = assign(weights, kinds, rooms, refine=False)
+            refined = assign(weights, kinds, rooms)
+            self.assertFeasible(weights, kinds, rooms, greedy)
+            self.assertFeasible(weights, kinds, rooms, refined)
+            self.assertGreaterEqual(sum(w for w, ship in zip(weights, refined) if ship >= 0),
+                                    sum(w for w, ship in zip(weights, greedy) if ship >= 0))
+
+
+class TestPlanPort(unittest.TestCase):
+    def test_planned_commands_all_succeed(self):
+        port = build_port(1, seed=1)
+        commands = plan_port(port)
+        self.assertTrue(commands)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(run_commands(commands), len(commands))
+        for ship in port.ships:
+            self.assertGreaterEqual(min(ship.remaining_capacity()), 0)
+        self.assertEqual(sum(len(ship.containers) for ship in port.ships), len(commands))
+        self.assertEqual(len(port.containers), 60 - len(commands))
+
+    def test_ships_at_sea_and_empty_ports_get_nothing(self):
+        port = build_port(1, seed=2)
+        for ship in port.ships:
+            ship.current_port = None
+        self.assertEqual(plan_port(port), [])
+        self.assertEqual(plan_port(Port(2, (0.0, 0.0))), [])
+
+    def test_fleet_plan_is_the_same_in_a_process_pool(self):
+        def plan(max_workers):
+            return [(command.ship.id, command.container_id)
+                    for command in plan_fleet([build_port(p, seed=p) for p in range(3)], max_workers=max_workers)]
+
+        self.assertEqual(plan(2), plan(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from Lab2.src.port import Port
+from Lab2.src.routes import RoutePlanner
+from Lab2.src.ship import ContainerLimits, Ship
+
+
+class TestRoutePlanner(unittest.TestCase):
+    def setUp(self):
+        # One degree of longitude apart on the equator, about 111 km, and one far port.
+        self.ports = [Port(i, (0.0, float(i))) for i in range(4)] + [Port(9, (0.0, 10.0))]
+        self.planner = RoutePlanner(self.ports)
+        self.leg = self.ports[0].get_distance(self.ports[1])
+
+    def ship(self, fuel):
+        return Ship("s1", fuel, self.ports[0], 10_000, 1.0, ContainerLimits(10, 10, 10, 10))
+
+    def test_least_fuel_route_refuels_at_every_stop(self):
+        route = self.planner.route(self.ports[0], self.ports[3], 1.0, 150.0)
+        self.assertEqual([port.id for port in route.ports], [0, 1, 2, 3])
+        self.assertAlmostEqual(route.total_fuel, 3 * self.leg, places=6)
+        self.assertEqual(route.refuels(0.0), route.legs)
+
+    def test_fewest_hops_takes_the_longest_usable_legs(self):
+        route = self.planner.route(self.ports[0], self.ports[3], 1.0, 250.0, objective="hops")
+        self.assertEqual(route.hops, 2)
+        self.assertEqual(route.ports[-1], self.ports[3])
+        with self.assertRaises(ValueError):
+            self.planner.route(self.ports[0], self.ports[3], 1.0, 250.0, objective="scenic")
+
+    def test_unreachable_port_has_no_route(self):
+        self.assertIsNone(self.planner.route(self.ports[0], self.ports[4], 1.0, 150.0))
+        self.assertIsNone(self.planner.route(self.ports[0], self.ports[4], 1.0, 150.0, objective="hops"))
+        self.planner.precompute()
+        self.assertIsNone(self.planner.route(self.ports[0], self.ports[4], 1.0, 150.0))
+
+    def test_insufficient_fuel(self):
+        ship = self.ship(fuel=self.leg / 2)
+        self.assertIsNone(self.planner.plan(ship, self.ports[1]))
+        self.assertFalse(ship.sail_to(self.ports[1]))
+        self.assertEqual((ship.fuel, ship.current_port), (self.leg / 2, self.ports[0]))
+
+    def test_ship_sails_a_route_taking_fuel_on_the_way(self):
+        ship = self.ship(fuel=self.leg / 2)
+        route = self.planner.plan(ship, self.ports[3], tank=150.0)
+        self.assertTrue(ship.sail_route(route))
+        self.assertIs(ship.current_port, self.ports[3])
+        self.assertGreaterEqual(ship.fuel, 0.0)
+        self.assertFalse(ship.sail_route(route))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from Lab2.src.columnar import ContainerTable
+from Lab2.src.conteiners import BasicContainer, HeavyContainer, LiquidContainer, RefrigeratedContainer
+from Lab2.src.port import Port
+from Lab2.src.ship import ContainerLimits, Ship
+
+
+class TestBulkLoading(unittest.TestCase):
+    def ship(self, capacity=100_000, limits=ContainerLimits(10, 10, 10, 10)):
+        return Ship("s1", 1000, Port(1, (46.48, 30.73)), capacity, 1.0, limits)
+
+    def test_plan_is_heaviest_first_and_leaves_the_ship_unchanged(self):
+        ship = self.ship(capacity=9000)
+        containers = [BasicContainer(1, 1000), HeavyContainer(2, 5000), HeavyContainer(3, 4000),
+                      BasicContainer(4, 2500)]
+        planned = ship.plan_load(containers)
+        self.assertEqual([container.id for container in planned], [2, 3])
+        self.assertEqual((len(ship.containers), ship.current_weight), (0, 0.0))
+
+    def test_every_limit_is_honored(self):
+        ship = self.ship(limits=ContainerLimits(4, 3, 1, 1))
+        containers = [RefrigeratedContainer(1, 6000), RefrigeratedContainer(2, 5900), LiquidContainer(3, 5800),
+                      LiquidContainer(4, 5700), HeavyContainer(5, 5600), HeavyContainer(6, 5500),
+                      BasicContainer(7, 100), BasicContainer(8, 90)]
+        loaded = ship.load_many(containers)
+        self.assertEqual([container.id for container in loaded], [1, 3, 5, 7])
+        self.assertEqual(ship.remaining_capacity(), (100_000 - 17_500, 0, 0, 0, 0))
+        self.assertFalse(ship.load(BasicContainer(9, 1)))
+
+    def test_weight_limit_skips_to_lighter_containers(self):
+        ship = self.ship(capacity=3000)
+        ship.load(BasicContainer(1, 1000))
+        loaded = ship.load_many([HeavyContainer(2, 3500), BasicContainer(3, 2000), BasicContainer(4, 10)])
+        self.assertEqual([container.id for container in loaded], [3])
+        self.assertEqual(ship.current_weight, 3000)
+
+    def test_loaded_and_duplicate_containers_are_skipped(self):
+        ship = self.ship()
+        first = BasicContainer(1, 100)
+        ship.load(first)
+        loaded = ship.load_many([first, BasicContainer(2, 200), BasicContainer(2, 300)])
+        self.assertEqual([(container.id, container.weight) for container in loaded], [(2, 300)])
+
+    def test_table_rows_are_not_containers(self):
+        table = ContainerTable.from_containers([RefrigeratedContainer(1, 5000)])
+        ship = self.ship(limits=ContainerLimits(10, 0, 0, 0))
+        self.assertEqual(ship.plan_load(table), [])
+        self.assertFalse(ship.load(table.get(1)))
+        self.assertFalse(ship.load(table.get(1).to_container()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+    Compare summing consumption() over Container objects with the vectorized
+    reductions of ContainerTable. Run from the Lab3 directory:
+
+        python -m benchmarks.bench_consumption --containers 1000000
+    """
+import argparse
+import random
+import time
+
+from src.columnar import CONTAINER_TYPES, ContainerTable
+
+
+def best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--containers", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    containers = [rng.choice(CONTAINER_TYPES)(i, rng.uniform(500, 30000)) for i in range(args.containers)]
+    table = ContainerTable.from_containers(containers)
+
+    objects = sum(c.consumption() for c in containers)
+    columns = table.total_consumption()
+    assert abs(objects - columns) <= 1e-9 * abs(objects), (objects, columns)
+
+    object_time = best_of(args.repeat, lambda: sum(c.consumption() for c in containers))
+    column_time = best_of(args.repeat, table.total_consumption)
+    by_type_time = best_of(args.repeat, table.consumption_by_type)
+
+    print(f"{args.containers} containers")
+    print(f"objects   total consumption: {object_time * 1000:10.2f} ms")
+    print(f"columnar  total consumption: {column_time * 1000:10.2f} ms  ({object_time / column_time:,.0f}x)")
+    print(f"columnar  per-type totals:   {by_type_time * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+    Report bytes per object of the slotted model classes against equivalent
+    classes that keep a per-instance __dict__. Run from the Lab3 directory:
+
+        python -m benchmarks.bench_memory --count 1000000
+    """
+import argparse
+import gc
+import tracemalloc
+
+from src.containers import HeavyContainer
+from src.item import HeavyItem
+from src.ship import MediumShip
+
+
+def with_dict(cls: type) -> type:
+    # A subclass without __slots__ gets a __dict__, like the classes had before.
+    return type(f"Dict{cls.__name__}", (cls,), {})
+
+
+def bytes_per_object(factory, count: int) -> float:
+    objects = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        objects[i] = factory(i)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # Attribute values are shared so that only the objects themselves are measured.
+    weight = 1500.0
+    item_fields = (weight, 3, "container")
+    cases = [
+        ("Container", HeavyContainer, lambda cls: lambda i: cls(i, weight), args.count),
+        ("Item", HeavyItem, lambda cls: lambda i: cls(i, *item_fields), args.count),
+        ("Ship", MediumShip, lambda cls: lambda i: cls(), min(args.count, 100_000)),
+    ]
+
+    print(f"{'class':<10} {'count':>9} {'__dict__':>10} {'__slots__':>10} {'saved':>7}")
+    for name, cls, make, count in cases:
+        before = bytes_per_object(make(with_dict(cls)), count)
+        after = bytes_per_object(make(cls), count)
+        print(f"{name:<10} {count:>9} {before:>9.1f}B {after:>9.1f}B {1 - after / before:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
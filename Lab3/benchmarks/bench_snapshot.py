@@ -0,0 +1,75 @@
+"""
+    Compare the binary snapshot format of a port with its JSON file: size on
+    disk, time to save, time to open and time to get every container back.
+    Run from the Lab3 directory:
+
+        python -m benchmarks.bench_snapshot --containers 1000000
+    """
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.columnar import CONTAINER_TYPES
+from src.port import Port, Ship
+from src.snapshot import PortSnapshot, load_snapshot, save_snapshot
+
+
+def best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build_port(containers: int) -> Port:
+    rng = random.Random(42)
+    port = Port("port0", 46.48, 30.73)
+    for i in range(containers):
+        container = rng.choice(CONTAINER_TYPES)(f"container{i}", rng.randint(500, 30000))
+        port._containers[container.id] = container
+    port.ships = [Ship(f"ship{i}") for i in range(100)]
+    port.history = [Ship(f"ship{i}") for i in range(1000)]
+    return port
+
+
+def open_snapshot(filename: str) -> None:
+    with PortSnapshot(filename) as snapshot:
+        snapshot[len(snapshot) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--containers", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    port = build_port(args.containers)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_file = os.path.join(tmp, "port.json")
+        snapshot_file = os.path.join(tmp, "port.snap")
+
+        json_save = best_of(args.repeat, lambda: port.save_to_json(json_file))
+        snapshot_save = best_of(args.repeat, lambda: save_snapshot(port, snapshot_file))
+        assert load_snapshot(snapshot_file).to_dict() == port.to_dict()
+        assert Port.load_from_json(json_file).to_dict() == port.to_dict()
+
+        json_load = best_of(args.repeat, lambda: Port.load_from_json(json_file))
+        snapshot_open = best_of(args.repeat, lambda: open_snapshot(snapshot_file))
+        snapshot_load = best_of(args.repeat, lambda: load_snapshot(snapshot_file))
+
+        json_size = os.path.getsize(json_file) / (1024 * 1024)
+        snapshot_size = os.path.getsize(snapshot_file) / (1024 * 1024)
+
+    print(f"{args.containers} containers")
+    print(f"json      size {json_size:8.1f} MB  save {json_save:8.3f} s  load {json_load:8.3f} s")
+    print(f"snapshot  size {snapshot_size:8.1f} MB  save {snapshot_save:8.3f} s  load {snapshot_load:8.3f} s  "
+          f"({json_load / snapshot_load:.1f}x)")
+    print(f"snapshot  open and read one row: {snapshot_open * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
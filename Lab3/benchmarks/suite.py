@@ -0,0 +1,158 @@
+"""
+    Time the hot paths of the Lab3 model at several scales and write the
+    results to a JSON file that later runs can be compared against.
+    Run from the Lab3 directory:
+
+        python -m benchmarks.suite --scales 1000,10000,100000,1000000 --output lab3.json
+    """
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.synthetic import scaled, write_input
+from src.containers import SmallContainer, HeavyContainer
+from src.port import Port
+from src.ship import Ship, HeavyShip
+
+
+def _containers(n: int) -> List[Any]:
+    rng = random.Random(n)
+    return [(SmallContainer if i % 2 else HeavyContainer)(f"C{i}", rng.randint(100, 2000)) for i in range(n)]
+
+
+def _ship() -> Ship:
+    ship = HeavyShip()
+    ship.max_weight = float("inf")
+    return ship
+
+
+def _port(n: int) -> Port:
+    port = Port("port0", 45.0, 30.0)
+    for container in _containers(n):
+        port.load_container(container)
+    return port
+
+
+def bench_port_load(n: int) -> float:
+    port, containers = Port("port0", 45.0, 30.0), _containers(n)
+    start = time.perf_counter()
+    for container in containers:
+        port.load_container(container)
+    return time.perf_counter() - start
+
+
+def bench_port_unload(n: int) -> float:
+    port, containers = Port("port0", 45.0, 30.0), _containers(n)
+    for container in containers:
+        port.load_container(container)
+    start = time.perf_counter()
+    for container in containers:
+        port.unload_container(container.id)
+    return time.perf_counter() - start
+
+
+def bench_ship_load(n: int) -> float:
+    ship, containers = _ship(), _containers(n)
+    start = time.perf_counter()
+    for container in containers:
+        ship.load(container)
+    return time.perf_counter() - start
+
+
+def bench_ship_unload(n: int) -> float:
+    ship, containers = _ship(), _containers(n)
+    for container in containers:
+        ship.load(container)
+    start = time.perf_counter()
+    for container in containers:
+        ship.unload(container)
+    return time.perf_counter() - start
+
+
+def bench_calculate_distance(n: int) -> float:
+    rng = random.Random(n)
+    ports = [Port(f"port{i}", rng.uniform(-60, 60), rng.uniform(-180, 180)) for i in range(100)]
+    pairs = [(rng.choice(ports), rng.choice(ports)) for _ in range(n)]
+    start = time.perf_counter()
+    for a, b in pairs:
+        a.calculate_distance(b)
+    return time.perf_counter() - start
+
+
+def bench_to_dict(n: int) -> float:
+    port = _port(n)
+    start = time.perf_counter()
+    port.to_dict()
+    return time.perf_counter() - start
+
+
+def bench_save_to_json(n: int) -> float:
+    port = _port(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        port.save_to_json(os.path.join(tmp, "port.json"))
+        return time.perf_counter() - start
+
+
+def bench_main(n: int) -> float:
+    from src.main import main
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "input.json")
+        write_input(filename, scaled(n))
+        start = time.perf_counter()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            main(filename)
+        return time.perf_counter() - start
+
+
+BENCHMARKS: Dict[str, Callable[[int], float]] = {
+    "Port.load_container": bench_port_load,
+    "Port.unload_container": bench_port_unload,
+    "Ship.load": bench_ship_load,
+    "Ship.unload": bench_ship_unload,
+    "Port.calculate_distance": bench_calculate_distance,
+    "Port.to_dict": bench_to_dict,
+    "Port.save_to_json": bench_save_to_json,
+    "main": bench_main,
+}
+
+
+def run(scales: List[int], names: List[str], repeat: int) -> Dict[str, Any]:
+    results = []
+    for name in names:
+        for n in scales:
+            seconds = min(BENCHMARKS[name](n) for _ in range(repeat))
+            results.append({"benchmark": name, "n": n, "seconds": seconds, "ops_per_second": n / seconds})
+            print(f"{name:<24} n={n:<9} {seconds:10.4f} s  {n / seconds:14,.0f} ops/s", file=sys.stderr)
+    return {
+        "lab": "Lab3",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", default="1000,10000,100000")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    report = run([int(float(n)) for n in args.scales.split(",")], args.benchmarks.split(","), args.repeat)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import csv
+import json
+import os
+from typing import Any, Dict, Iterable, Optional
+import numpy as np
+from src.columnar import ItemStore, VoyageLog
+from src.port import Port
+
+MANIFEST = "tables.json"
+VERSION = 1
+FORMATS = ("npy", "csv")
+
+Columns = Dict[str, np.ndarray]
+
+
+def _text(values: Iterable[Any]) -> np.ndarray:
+    """Returns values as a fixed-width Unicode array, e.g. IDs that may be ints or strings."""
+    return np.array([str(value) for value in values], dtype=str)
+
+
+def container_columns(ports: Iterable[Port]) -> Columns:
+    """Collects the inventory of ports into columns.
+
+    Args:
+        ports (Iterable[Port]): The ports.
+
+    Returns:
+        Columns: ``container_id``, ``type``, ``weight`` and ``port_id``, one row per container.
+    """
+    ids, types, weights, port_ids, counts = [], [], [], [], []
+    for port in ports:
+        containers = port.containers
+        ids.extend(container.id for container in containers)
+        types.extend(container.__class__.__name__ for container in containers)
+        weights.extend(container.weight for container in containers)
+        port_ids.append(port.port_id)
+        counts.append(len(containers))
+    return {
+        "container_id": _text(ids),
+        "type": _text(types),
+        "weight": np.array(weights, dtype=np.float64),
+        "port_id": np.repeat(_text(port_ids), counts),
+    }
+
+
+def item_columns(store: ItemStore) -> Columns:
+    """Copies the rows of an item store into columns.
+
+    Args:
+        store (ItemStore): The items.
+
+    Returns:
+        Columns: ``item_id``, ``type``, ``weight``, ``count`` and ``container_id``, one row per item.
+    """
+    ids = store.ids
+    return {
+        "item_id": _text(ids),
+        "type": _text(store.get(item_id).__class__.__name__ for item_id in ids),
+        "weight": store.weights.copy(),
+        "count": store.counts.copy(),
+        "container_id": _text(store.container_ids),
+    }
+
+
+def voyage_columns(log: VoyageLog) -> Columns:
+    """Copies a voyage log into columns.
+
+    Args:
+        log (VoyageLog): The voyages.
+
+    Returns:
+        Columns: ``ship``, ``origin``, ``destination``, ``distance_km`` and ``fuel``, one row per voyage.
+    """
+    return {
+        "ship": _text(log.ships),
+        "origin": _text(log.origins),
+        "destination": _text(log.destinations),
+        "distance_km": log.distances.copy(),
+        "fuel": log.fuel.copy(),
+    }
+
+
+def _write_csv(path: str, columns: Columns) -> None:
+    """Writes columns to one CSV file with a header row."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(*(column.tolist() for column in columns.values())))
+
+
+def export_analytics(directory: str, ports: Iterable[Port] = (), items: Optional[ItemStore] = None,
+                     voyages: Optional[VoyageLog] = None, fmt: str = "npy") -> Dict[str, Any]:
+    """Writes containers, items and voyages as typed columns for analysis.
+
+    With ``npy`` every column is a NumPy file ``<table>/<column>.npy``, which
+    ``load_table`` can map into memory without parsing. With ``csv`` every
+    table is one CSV file with a header row. IDs are written as text, numbers
+    keep their dtype. A manifest lists the tables with their row counts and
+    column dtypes.
+
+    Args:
+        directory (str): Output directory; created if missing.
+        ports (Iterable[Port], optional): Ports whose containers make the ``containers`` table.
+        items (Optional[ItemStore], optional): Items for the ``items`` table.
+        voyages (Optional[VoyageLog], optional): Voyages for the ``voyages`` table.
+        fmt (str, optional): ``npy`` or ``csv``. Defaults to ``npy``.
+
+    Returns:
+        Dict[str, Any]: The manifest.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt}")
+    tables = {"containers": container_columns(ports)}
+    if items is not None:
+        tables["items"] = item_columns(items)
+    if voyages is not None:
+        tables["voyages"] = voyage_columns(voyages)
+
+    os.makedirs(directory, exist_ok=True)
+    manifest = {"version": VERSION, "format": fmt, "tables": {}}
+    for name, columns in tables.items():
+        if fmt == "npy":
+            os.makedirs(os.path.join(directory, name), exist_ok=True)
+            for column, values in columns.items():
+                np.save(os.path.join(directory, name, column + ".npy"), values, allow_pickle=False)
+        else:
+            _write_csv(os.path.join(directory, name + ".csv"), columns)
+        manifest["tables"][name] = {
+            "rows": len(next(iter(columns.values()))),
+            "columns": {column: values.dtype.str for column, values in columns.items()},
+        }
+    with open(os.path.join(directory, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+def read_tables(directory: str) -> Dict[str, Any]:
+    """Reads the manifest of an analytics export.
+
+    Args:
+        directory (str): The directory written by ``export_analytics``.
+
+    Returns:
+        Dict[str, Any]: The manifest.
+
+    Raises:
+        ValueError: If the manifest has an unsupported version.
+    """
+    with open(os.path.join(directory, MANIFEST)) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != VERSION:
+        raise ValueError(f"Unsupported manifest version: {manifest.get('version')}")
+    return manifest
+
+
+def load_table(directory: str, table: str, mmap: bool = True,
+               manifest: Optional[Dict[str, Any]] = None) -> Columns:
+    """Loads one table of an analytics export as columns.
+
+    Args:
+        directory (str): The directory written by ``export_analytics``.
+        table (str): ``containers``, ``items`` or ``voyages``.
+        mmap (bool, optional): Map ``npy`` columns into memory read-only instead of
+            reading them. Defaults to True.
+        manifest (Optional[Dict[str, Any]], optional): The manifest, if already read.
+
+    Returns:
+        Columns: The columns with the dtypes they were written with.
+
+    Raises:
+        KeyError: If the export has no such table.
+    """
+    manifest = read_tables(directory) if manifest is None else manifest
+    dtypes = manifest["tables"][table]["columns"]
+    if manifest["format"] == "npy":
+        return {column: np.load(os.path.join(directory, table, column + ".npy"),
+                                mmap_mode="r" if mmap else None, allow_pickle=False)
+                for column in dtypes}
+    with open(os.path.join(directory, table + ".csv"), newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    return {column: np.array([row[index] for row in rows], dtype=dtypes[column]) if rows
+            else np.empty(0, dtype=dtypes[column])
+            for index, column in enumerate(header)}
+
+
+def load_analytics(directory: str, mmap: bool = True) -> Dict[str, Columns]:
+    """Loads every table of an analytics export.
+
+    Args:
+        directory (str): The directory written by ``export_analytics``.
+        mmap (bool, optional): Map ``npy`` columns into memory read-only. Defaults to True.
+
+    Returns:
+        Dict[str, Columns]: The columns of every table, by table name.
+    """
+    manifest = read_tables(directory)
+    return {table: load_table(directory, table, mmap, manifest) for table in manifest["tables"]}
@@ -0,0 +1,222 @@
+import heapq
+import math
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class BerthRequest:
+    """A ship asking a port for a berth.
+
+    Attributes:
+        ship (Any): The ship, handed back when it gets a berth.
+        arrived (float): Time the ship arrived at the port, in hours.
+        service_hours (float): Expected time the ship will stay at the berth.
+        deadline (float): Time the ship should be done by.
+        cranes (int): Cranes the ship needs while it is at the berth.
+    """
+
+    ship: Any
+    arrived: float
+    service_hours: float
+    deadline: float
+    cranes: int
+
+
+POLICIES: Dict[str, Callable[[BerthRequest], float]] = {
+    "fifo": lambda request: request.arrived,
+    "sjf": lambda request: request.service_hours,
+    "edf": lambda request: request.deadline,
+}
+
+
+class BerthScheduler:
+    """Limits how many ships a port serves at once and queues the rest.
+
+    A port has ``berths`` berths and ``cranes`` cranes. A ship gets a berth when
+    one is free and enough cranes are free for it; otherwise it waits in a
+    priority queue ordered by the policy: ``"fifo"`` by arrival, ``"sjf"`` by
+    the shortest expected service and ``"edf"`` by the earliest deadline, ties
+    broken by arrival order. The queue is a binary heap, so queueing a ship and
+    handing a freed berth to the next one cost O(log n). The ship at the head
+    of the queue is never overtaken, so a ship that needs many cranes cannot
+    starve.
+
+    Times are hours on whatever clock the caller uses, e.g. the one of a
+    ``FleetSimulation``. The scheduler accumulates the waiting time of every
+    ship and the busy hours of the berths and cranes for ``stats``.
+
+    Attributes:
+        berths (int): Number of berths.
+        cranes (int): Number of cranes.
+        policy (str): Name of the queueing policy.
+        served (int): Number of ships that got a berth.
+        total_wait_hours (float): Sum of the waiting times of the served ships.
+        max_wait_hours (float): Longest waiting time of a served ship.
+
+    """
+
+    def __init__(self, berths: int = 1, cranes: Optional[int] = None, policy: str = "fifo") -> None:
+        """Initializes a scheduler with every berth and crane free.
+
+        Args:
+            berths (int, optional): Number of berths. Defaults to 1.
+            cranes (Optional[int], optional): Number of cranes. Defaults to one per berth.
+            policy (str, optional): ``"fifo"``, ``"sjf"`` or ``"edf"``. Defaults to ``"fifo"``.
+
+        Raises:
+            ValueError: If there are no berths or cranes, or the policy is unknown.
+        """
+        if berths < 1:
+            raise ValueError("A port needs at least one berth")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown berth policy: {policy}")
+        self.berths = berths
+        self.cranes = berths if cranes is None else cranes
+        if self.cranes < 1:
+            raise ValueError("A port needs at least one crane")
+        self.policy = policy
+        self._priority = POLICIES[policy]
+        self._queue: List[Tuple[float, int, Hashable]] = []
+        self._sequence = count()
+        self._waiting: Dict[Hashable, BerthRequest] = {}
+        self._tickets: Dict[Hashable, int] = {}
+        self._berthed: Dict[Hashable, BerthRequest] = {}
+        self._free_cranes = self.cranes
+        self.served = 0
+        self.total_wait_hours = 0.0
+        self.max_wait_hours = 0.0
+        self._start: Optional[float] = None
+        self._last = 0.0
+        self._berth_hours = 0.0
+        self._crane_hours = 0.0
+
+    @property
+    def waiting(self) -> int:
+        """Returns the number of ships waiting for a berth."""
+        return len(self._waiting)
+
+    @property
+    def occupied(self) -> int:
+        """Returns the number of occupied berths."""
+        return len(self._berthed)
+
+    def is_berthed(self, ship_id: Hashable) -> bool:
+        """Checks whether a ship has a berth."""
+        return ship_id in self._berthed
+
+    def is_waiting(self, ship_id: Hashable) -> bool:
+        """Checks whether a ship waits for a berth."""
+        return ship_id in self._waiting
+
+    def _advance(self, now: float) -> None:
+        """Adds the busy berth and crane hours since the last change."""
+        if self._start is None:
+            self._start = self._last = now
+        elif now > self._last:
+            elapsed = now - self._last
+            self._berth_hours += len(self._berthed) * elapsed
+            self._crane_hours += (self.cranes - self._free_cranes) * elapsed
+            self._last = now
+
+    def _admit(self, ship_id: Hashable, request: BerthRequest, now: float) -> None:
+        """Gives a ship a berth and records how long it waited."""
+        self._berthed[ship_id] = request
+        self._free_cranes -= request.cranes
+        wait = now - request.arrived
+        self.served += 1
+        self.total_wait_hours += wait
+        self.max_wait_hours = max(self.max_wait_hours, wait)
+
+    def _fits(self, request: BerthRequest) -> bool:
+        """Checks whether a berth and enough cranes are free for a request."""
+        return len(self._berthed) < self.berths and request.cranes <= self._free_cranes
+
+    def _head(self) -> Optional[Hashable]:
+        """Returns the ID of the next waiting ship, or None if none waits."""
+        queue = self._queue
+        # Entries of ships that left the queue, or queued again since, are dropped
+        # lazily when they reach its head.
+        while queue and self._tickets.get(queue[0][2]) != queue[0][1]:
+            heapq.heappop(queue)
+        return queue[0][2] if queue else None
+
+    def request(self, ship_id: Hashable, ship: Any, now: float, service_hours: float = 0.0,
+                deadline: Optional[float] = None, cranes: int = 1) -> bool:
+        """Gives a ship a berth, or queues it if none can be given now.
+
+        Args:
+            ship_id (Hashable): Unique ID of the ship.
+            ship (Any): The ship, returned by ``release`` once it gets a berth.
+            now (float): The current time.
+            service_hours (float, optional): Expected time at the berth, used by ``"sjf"``.
+            deadline (Optional[float], optional): Time to be done by, used by ``"edf"``; none means no deadline.
+            cranes (int, optional): Cranes the ship needs, at most the cranes of the port.
+
+        Returns:
+            bool: True if the ship got a berth, False if it waits.
+        """
+        if ship_id in self._berthed:
+            return True
+        if ship_id in self._waiting:
+            return False
+        self._advance(now)
+        request = BerthRequest(ship, now, service_hours, math.inf if deadline is None else deadline,
+                               max(1, min(cranes, self.cranes)))
+        if self._head() is None and self._fits(request):
+            self._admit(ship_id, request, now)
+            return True
+        ticket = next(self._sequence)
+        self._waiting[ship_id] = request
+        self._tickets[ship_id] = ticket
+        heapq.heappush(self._queue, (self._priority(request), ticket, ship_id))
+        return False
+
+    def release(self, ship_id: Hashable, now: float) -> List[Any]:
+        """Frees the berth of a ship, or takes it out of the queue if it is waiting.
+
+        Args:
+            ship_id (Hashable): Unique ID of the ship.
+            now (float): The current time.
+
+        Returns:
+            List[Any]: The waiting ships that got a berth, in the order they got it.
+        """
+        self._tickets.pop(ship_id, None)
+        if self._waiting.pop(ship_id, None) is None:
+            if ship_id not in self._berthed:
+                return []
+            self._advance(now)
+            self._free_cranes += self._berthed.pop(ship_id).cranes
+        else:
+            self._advance(now)
+        admitted = []
+        while (head := self._head()) is not None and self._fits(self._waiting[head]):
+            heapq.heappop(self._queue)
+            del self._tickets[head]
+            request = self._waiting.pop(head)
+            self._admit(head, request, now)
+            admitted.append(request.ship)
+        return admitted
+
+    def stats(self, now: float) -> Dict[str, float]:
+        """Summarizes waiting times and how busy the berths and cranes were.
+
+        Args:
+            now (float): The current time; utilization is measured from the first request to it.
+
+        Returns:
+            Dict[str, float]: Served and waiting ships, mean and longest wait, and
+            berth and crane utilization between 0 and 1.
+        """
+        self._advance(now)
+        elapsed = now - self._start if self._start is not None else 0.0
+        return {
+            "served": self.served,
+            "waiting": len(self._waiting),
+            "mean_wait_hours": self.total_wait_hours / self.served if self.served else 0.0,
+            "max_wait_hours": self.max_wait_hours,
+            "berth_utilization": self._berth_hours / (self.berths * elapsed) if elapsed > 0 else 0.0,
+            "crane_utilization": self._crane_hours / (self.cranes * elapsed) if elapsed > 0 else 0.0,
+        }
@@ -0,0 +1,662 @@
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, ValuesView
+import numpy as np
+from src.containers import Container, SmallContainer, HeavyContainer, RefrigeratedContainer, LiquidContainer
+from src.item import Item
+
+CONTAINER_TYPES: Tuple[Type[Container], ...] = (
+    SmallContainer,
+    HeavyContainer,
+    RefrigeratedContainer,
+    LiquidContainer,
+)
+TYPE_CODES: Dict[Type[Container], int] = {cls: code for code, cls in enumerate(CONTAINER_TYPES)}
+UNIT_CONSUMPTION = np.array([cls.UNIT_CONSUMPTION for cls in CONTAINER_TYPES], dtype=np.float64)
+
+
+class ContainerView:
+    """Lightweight view of one row of a ContainerTable.
+
+    It exposes the same ``id``, ``weight`` and ``consumption()`` as a regular
+    Container, reading them from the table instead of storing them. A view is
+    not a Container: it has no ``to_dict()`` and its class says nothing about
+    its type, so hand ``to_container()`` to ports and ships instead.
+
+    Attributes:
+        id (Any): Unique identifier for the container.
+        weight (float): Weight of the container, written through to the table.
+        container_type (Type[Container]): The container class this row stands for.
+    """
+    __slots__ = ("_table", "_id")
+
+    def __init__(self, table: "ContainerTable", id: Any) -> None:
+        """Initializes a view of the row holding the given container.
+
+        Args:
+            table (ContainerTable): The table the row belongs to.
+            id (Any): The ID of the container.
+        """
+        self._table = table
+        self._id = id
+
+    @property
+    def id(self) -> Any:
+        return self._id
+
+    @property
+    def weight(self) -> float:
+        return float(self._table.weights[self._table.row(self._id)])
+
+    @weight.setter
+    def weight(self, weight: float) -> None:
+        self._table.weights[self._table.row(self._id)] = weight
+
+    @property
+    def container_type(self) -> Type[Container]:
+        return CONTAINER_TYPES[self._table.codes[self._table.row(self._id)]]
+
+    def consumption(self) -> float:
+        """Calculates fuel consumption of the container in this row.
+
+        Returns:
+            float: The fuel consumption of the container.
+        """
+        row = self._table.row(self._id)
+        return float(UNIT_CONSUMPTION[self._table.codes[row]] * self._table.weights[row])
+
+    def to_container(self) -> Container:
+        """Creates a regular Container object with the data of this row."""
+        return self.container_type(self._id, self.weight)
+
+    def __repr__(self) -> str:
+        return f"ContainerView({self.container_type.__name__}, id={self._id!r}, weight={self.weight})"
+
+
+class ContainerTable:
+    """Columnar store of containers for a port or a ship.
+
+    Containers are kept as parallel NumPy arrays of id, type code and weight,
+    so totals over the whole inventory are single vectorized reductions
+    instead of one ``consumption()`` call per object. The unit consumption
+    of every row is kept in its own column so the total consumption is a
+    single dot product. Removing a container moves the last row into its
+    place, so row order is not preserved.
+
+    Attributes:
+        ids (np.ndarray): Container IDs, one per row.
+        codes (np.ndarray): Index of the container class in CONTAINER_TYPES, one per row.
+        weights (np.ndarray): Container weights, one per row.
+
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initializes an empty table.
+
+        Args:
+            capacity (int, optional): Number of rows to preallocate. Defaults to 1024.
+        """
+        capacity = max(1, capacity)
+        self._ids = np.empty(capacity, dtype=object)
+        self._codes = np.empty(capacity, dtype=np.int8)
+        self._weights = np.empty(capacity, dtype=np.float64)
+        self._rates = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+        self._rows: Dict[Any, int] = {}
+
+    @classmethod
+    def from_containers(cls, containers: Iterable[Container]) -> "ContainerTable":
+        """Creates a table holding the given containers.
+
+        Args:
+            containers (Iterable[Container]): The containers to store.
+
+        Returns:
+            ContainerTable: A new table sized for the containers.
+        """
+        containers = list(containers)
+        table = cls(capacity=len(containers))
+        table.extend(containers)
+        return table
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self._codes[:self._size]
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, container_id: Any) -> bool:
+        return container_id in self._rows
+
+    def __iter__(self) -> Iterator[ContainerView]:
+        for container_id in self._ids[:self._size]:
+            yield ContainerView(self, container_id)
+
+    def row(self, container_id: Any) -> int:
+        """Returns the row index of a container, raising KeyError if it is not stored."""
+        return self._rows[container_id]
+
+    def get(self, container_id: Any) -> Optional[ContainerView]:
+        """Returns a view of a container, or None if it is not stored."""
+        if container_id in self._rows:
+            return ContainerView(self, container_id)
+        return None
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_ids", "_codes", "_weights", "_rates"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def add(self, container: Container) -> None:
+        """Appends one container to the table.
+
+        Args:
+            container (Container): The container to store.
+
+        Raises:
+            ValueError: If the ID is already stored or the container type is unknown.
+        """
+        self.extend((container,))
+
+    def extend(self, containers: Iterable[Container]) -> None:
+        """Appends many containers to the table at once.
+
+        Args:
+            containers (Iterable[Container]): The containers to store.
+
+        Raises:
+            ValueError: If an ID is already stored or a container type is unknown.
+        """
+        containers: List[Container] = list(containers)
+        codes = []
+        batch = set()
+        for container in containers:
+            code = TYPE_CODES.get(type(container))
+            if code is None:
+                raise ValueError(f"Unknown container type: {type(container).__name__}")
+            if container.id in self._rows or container.id in batch:
+                raise ValueError(f"Container {container.id} is already stored")
+            batch.add(container.id)
+            codes.append(code)
+
+        self._reserve(len(containers))
+        start, end = self._size, self._size + len(containers)
+        self._ids[start:end] = [container.id for container in containers]
+        self._codes[start:end] = codes
+        self._weights[start:end] = [container.weight for container in containers]
+        self._rates[start:end] = UNIT_CONSUMPTION[codes]
+        self._rows.update(zip(self._ids[start:end].tolist(), range(start, end)))
+        self._size = end
+
+    def remove(self, container_id: Any) -> bool:
+        """Removes a container from the table.
+
+        Args:
+            container_id (Any): The ID of the container to remove.
+
+        Returns:
+            bool: True if the container was removed, False if it was not stored.
+        """
+        row = self._rows.pop(container_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._codes[row] = self._codes[last]
+            self._weights[row] = self._weights[last]
+            self._rates[row] = self._rates[last]
+            self._rows[moved_id] = row
+        self._ids[last] = None
+        self._size = last
+        return True
+
+    def to_containers(self) -> List[Container]:
+        """Materializes every row as a regular Container object.
+
+        Returns:
+            List[Container]: The containers, in row order.
+        """
+        return [CONTAINER_TYPES[code](container_id, float(weight))
+                for container_id, code, weight in zip(self.ids, self.codes, self.weights)]
+
+    def total_weight(self) -> float:
+        """Returns the sum of the weights of all containers."""
+        return float(self.weights.sum())
+
+    def total_consumption(self) -> float:
+        """Returns the sum of the fuel consumption of all containers."""
+        return float(np.dot(self._rates[:self._size], self.weights))
+
+    def _by_type(self, values: np.ndarray) -> Dict[str, float]:
+        return {cls.__name__: float(value) for cls, value in zip(CONTAINER_TYPES, values)}
+
+    def count_by_type(self) -> Dict[str, int]:
+        """Returns the number of containers of every type."""
+        counts = np.bincount(self.codes, minlength=len(CONTAINER_TYPES))
+        return {cls.__name__: int(count) for cls, count in zip(CONTAINER_TYPES, counts)}
+
+    def weight_by_type(self) -> Dict[str, float]:
+        """Returns the total weight of every container type."""
+        return self._by_type(np.bincount(self.codes, weights=self.weights, minlength=len(CONTAINER_TYPES)))
+
+    def consumption_by_type(self) -> Dict[str, float]:
+        """Returns the total fuel consumption of every container type."""
+        weights = np.bincount(self.codes, weights=self.weights, minlength=len(CONTAINER_TYPES))
+        return self._by_type(weights * UNIT_CONSUMPTION)
+
+
+class ItemStore:
+    """Columnar store of items, indexed by the container holding them.
+
+    Items are kept as parallel NumPy arrays of weight, count and container
+    slot, next to a dictionary of the items of every container. Listing the
+    contents of a container or reading its item weight is O(1): the weight of
+    every container is a running total, updated as items are added, moved or
+    removed. Rollups over many containers, e.g. every container of a port or a
+    ship, are vectorized sums over those totals. Removing an item moves the
+    last row into its place, so row order is not preserved.
+
+    The weight and count of an item are read when it is added; change them
+    through ``set_count`` or by removing and adding the item again.
+
+    Attributes:
+        ids (np.ndarray): Item IDs, one per row.
+        weights (np.ndarray): Weight of a single item, one per row.
+        counts (np.ndarray): Number of items, one per row.
+        container_ids (np.ndarray): ID of the container holding the item, one per row.
+
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initializes an empty store.
+
+        Args:
+            capacity (int, optional): Number of rows to preallocate. Defaults to 1024.
+        """
+        capacity = max(1, capacity)
+        self._weights = np.empty(capacity, dtype=np.float64)
+        self._counts = np.empty(capacity, dtype=np.int64)
+        self._slots = np.empty(capacity, dtype=np.int64)
+        self._ids = np.empty(capacity, dtype=object)
+        self._size = 0
+        self._rows: Dict[Any, int] = {}
+        # One slot per container ever seen: its ID, its items by ID and their total weight.
+        self._slot_of: Dict[Any, int] = {}
+        self._container_ids: List[Any] = []
+        self._contents: List[Dict[Any, Item]] = []
+        self._slot_weights = np.zeros(16, dtype=np.float64)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> "ItemStore":
+        """Creates a store holding the given items.
+
+        Args:
+            items (Iterable[Item]): The items to store.
+
+        Returns:
+            ItemStore: A new store sized for the items.
+        """
+        items = list(items)
+        store = cls(capacity=len(items))
+        store.extend(items)
+        return store
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights[:self._size]
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._counts[:self._size]
+
+    @property
+    def container_ids(self) -> np.ndarray:
+        ids = np.fromiter(self._container_ids, dtype=object, count=len(self._container_ids))
+        return ids[self._slots[:self._size]]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item_id: Any) -> bool:
+        return item_id in self._rows
+
+    def get(self, item_id: Any) -> Optional[Item]:
+        """Returns the item with the given ID, or None if it is not stored."""
+        row = self._rows.get(item_id)
+        return None if row is None else self._contents[self._slots[row]][item_id]
+
+    def _slot(self, container_id: Any) -> int:
+        """Returns the slot of a container, creating it on first use."""
+        slot = self._slot_of.get(container_id)
+        if slot is None:
+            slot = self._slot_of[container_id] = len(self._container_ids)
+            self._container_ids.append(container_id)
+            self._contents.append({})
+            if slot == len(self._slot_weights):
+                self._slot_weights = np.concatenate((self._slot_weights, np.zeros(slot)))
+        return slot
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_weights", "_counts", "_slots", "_ids"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def add(self, item: Item) -> None:
+        """Stores one item in the container named by its ``containerID``.
+
+        Args:
+            item (Item): The item to store.
+
+        Raises:
+            ValueError: If an item with the same ID is already stored.
+        """
+        self.extend((item,))
+
+    def extend(self, items: Iterable[Item]) -> None:
+        """Stores many items at once.
+
+        Args:
+            items (Iterable[Item]): The items to store.
+
+        Raises:
+            ValueError: If an ID is already stored or appears twice.
+        """
+        items: List[Item] = list(items)
+        batch = set()
+        for item in items:
+            if item.ID in self._rows or item.ID in batch:
+                raise ValueError(f"Item {item.ID} is already stored")
+            batch.add(item.ID)
+
+        slots = [self._slot(item.containerID) for item in items]
+        self._reserve(len(items))
+        start, end = self._size, self._size + len(items)
+        self._weights[start:end] = [item.weight for item in items]
+        self._counts[start:end] = [item.count for item in items]
+        self._slots[start:end] = slots
+        self._ids[start:end] = [item.ID for item in items]
+        for row, (item, slot) in enumerate(zip(items, slots), start):
+            self._rows[item.ID] = row
+            self._contents[slot][item.ID] = item
+        np.add.at(self._slot_weights, self._slots[start:end], self._weights[start:end] * self._counts[start:end])
+        self._size = end
+
+    def remove(self, item_id: Any) -> bool:
+        """Removes an item from the store.
+
+        Args:
+            item_id (Any): The ID of the item.
+
+        Returns:
+            bool: True if the item was removed, False if it was not stored.
+        """
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+        slot = self._slots[row]
+        del self._contents[slot][item_id]
+        self._slot_weights[slot] = (self._slot_weights[slot] - self._weights[row] * self._counts[row]
+                                    if self._contents[slot] else 0.0)
+        last = self._size - 1
+        if row != last:
+            moved_id = self._ids[last]
+            for name in ("_weights", "_counts", "_slots", "_ids"):
+                column = getattr(self, name)
+                column[row] = column[last]
+            self._rows[moved_id] = row
+        self._ids[last] = None
+        self._size = last
+        return True
+
+    def move(self, item_id: Any, container_id: Any) -> bool:
+        """Moves an item to another container and updates its ``containerID``.
+
+        Args:
+            item_id (Any): The ID of the item.
+            container_id (Any): The ID of the container receiving it.
+
+        Returns:
+            bool: True if the item was moved, False if it is not stored.
+        """
+        row = self._rows.get(item_id)
+        if row is None:
+            return False
+        source, target = self._slots[row], self._slot(container_id)
+        if source == target:
+            return True
+        item = self._contents[source].pop(item_id)
+        weight = self._weights[row] * self._counts[row]
+        self._slot_weights[source] = self._slot_weights[source] - weight if self._contents[source] else 0.0
+        self._slot_weights[target] += weight
+        self._contents[target][item_id] = item
+        self._slots[row] = target
+        item.containerID = container_id
+        return True
+
+    def set_count(self, item_id: Any, count: int) -> bool:
+        """Changes the number of items in a row and updates the totals.
+
+        Args:
+            item_id (Any): The ID of the item.
+            count (int): The new number of items.
+
+        Returns:
+            bool: True if the count was changed, False if the item is not stored.
+        """
+        row = self._rows.get(item_id)
+        if row is None:
+            return False
+        slot = self._slots[row]
+        self._slot_weights[slot] += self._weights[row] * (count - self._counts[row])
+        self._counts[row] = count
+        self._contents[slot][item_id].count = count
+        return True
+
+    def contents(self, container_id: Any) -> ValuesView[Item]:
+        """Returns a read-only view of the items in a container, empty if it has none."""
+        slot = self._slot_of.get(container_id)
+        return (self._contents[slot] if slot is not None else {}).values()
+
+    def container_weight(self, container_id: Any) -> float:
+        """Returns the total weight of the items in a container, 0 if it has none."""
+        slot = self._slot_of.get(container_id)
+        return 0.0 if slot is None else float(self._slot_weights[slot])
+
+    def _slots_of(self, container_ids: Iterable[Any]) -> np.ndarray:
+        """Returns the slots of the containers that hold items, skipping the others."""
+        slot_of = self._slot_of
+        return np.fromiter((slot_of[c] for c in container_ids if c in slot_of), dtype=np.int64)
+
+    def container_weights(self, container_ids: Iterable[Any]) -> np.ndarray:
+        """Returns the item weight of every given container, in order, 0 for unknown ones."""
+        slot_of = self._slot_of
+        slots = np.fromiter((slot_of.get(c, -1) for c in container_ids), dtype=np.int64)
+        return np.where(slots >= 0, self._slot_weights[slots], 0.0)
+
+    def total_weight(self, container_ids: Optional[Iterable[Any]] = None) -> float:
+        """Returns the total item weight of the given containers, or of the whole store.
+
+        Args:
+            container_ids (Optional[Iterable[Any]], optional): Container IDs. Defaults to every container.
+
+        Returns:
+            float: The summed weight.
+        """
+        if container_ids is None:
+            return float(self._slot_weights[:len(self._container_ids)].sum())
+        return float(self._slot_weights[self._slots_of(container_ids)].sum())
+
+    def holder_weight(self, holder: Any) -> float:
+        """Returns the total item weight of the containers of a port or a ship.
+
+        Args:
+            holder (Any): Anything with a ``containers`` collection, e.g. a Port or a Ship.
+
+        Returns:
+            float: The summed weight.
+        """
+        return self.total_weight(container.id for container in holder.containers)
+
+    def rollup(self, groups: Dict[Any, Iterable[Any]]) -> Dict[Any, float]:
+        """Sums the item weight of many groups of containers at once.
+
+        Args:
+            groups (Dict[Any, Iterable[Any]]): Container IDs by group key, e.g. by port ID.
+
+        Returns:
+            Dict[Any, float]: The total item weight of every group.
+        """
+        keys = list(groups)
+        slots, codes = [], []
+        for code, key in enumerate(keys):
+            group = self._slots_of(groups[key])
+            slots.append(group)
+            codes.append(np.full(len(group), code, dtype=np.int64))
+        if not keys:
+            return {}
+        slots, codes = np.concatenate(slots), np.concatenate(codes)
+        totals = np.bincount(codes, weights=self._slot_weights[slots], minlength=len(keys))
+        return {key: float(total) for key, total in zip(keys, totals)}
+
+    def recompute(self) -> np.ndarray:
+        """Recomputes the weight of every container from the item rows in one vectorized pass.
+
+        The running totals are replaced by the result, which also clears any
+        floating-point drift accumulated by long sequences of updates.
+
+        Returns:
+            np.ndarray: The item weight of every container slot.
+        """
+        weights = np.bincount(self._slots[:self._size], weights=self.weights * self.counts,
+                              minlength=len(self._container_ids))
+        self._slot_weights[:len(weights)] = weights
+        return weights
+
+
+class VoyageLog:
+    """Append-only columnar log of ship movements.
+
+    Every voyage is one row of parallel NumPy arrays: ship, origin and
+    destination port, great-circle distance and fuel. Ships with the log set
+    as their ``voyages`` attribute are recorded by ``SailCommand``; one log is
+    usually attached to every ship of a fleet. Appending takes a lock, so ships
+    sailing in different threads can share the log.
+
+    Attributes:
+        ships (np.ndarray): Ship names, one per voyage.
+        origins (np.ndarray): Origin port IDs, one per voyage.
+        destinations (np.ndarray): Destination port IDs, one per voyage.
+        distances (np.ndarray): Haversine distances in kilometers, one per voyage.
+        fuel (np.ndarray): Fuel burned on the voyage, one per voyage: the
+            ``total_consumption`` of the cargo per kilometer times the distance.
+
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initializes an empty log.
+
+        Args:
+            capacity (int, optional): Number of rows to preallocate. Defaults to 1024.
+        """
+        capacity = max(1, capacity)
+        self._ships = np.empty(capacity, dtype=object)
+        self._origins = np.empty(capacity, dtype=object)
+        self._destinations = np.empty(capacity, dtype=object)
+        self._distances = np.empty(capacity, dtype=np.float64)
+        self._fuel = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def ships(self) -> np.ndarray:
+        return self._ships[:self._size]
+
+    @property
+    def origins(self) -> np.ndarray:
+        return self._origins[:self._size]
+
+    @property
+    def destinations(self) -> np.ndarray:
+        return self._destinations[:self._size]
+
+    @property
+    def distances(self) -> np.ndarray:
+        return self._distances[:self._size]
+
+    @property
+    def fuel(self) -> np.ndarray:
+        return self._fuel[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def attach(self, ship: Any) -> None:
+        """Starts logging the voyages of a ship.
+
+        Args:
+            ship (Any): A Ship.
+        """
+        ship.voyages = self
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._ships)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_ships", "_origins", "_destinations", "_distances", "_fuel"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def record(self, ship: Any, origin: Any, destination: Any, distance: float, fuel: float) -> None:
+        """Appends one voyage.
+
+        Args:
+            ship (Any): Name of the ship.
+            origin (Any): ID of the port the ship left.
+            destination (Any): ID of the port the ship sailed to.
+            distance (float): Distance in kilometers.
+            fuel (float): Fuel burned on the voyage.
+        """
+        with self._lock:
+            self._reserve(1)
+            row = self._size
+            self._ships[row] = ship
+            self._origins[row] = origin
+            self._destinations[row] = destination
+            self._distances[row] = distance
+            self._fuel[row] = fuel
+            self._size = row + 1
@@ -0,0 +1,177 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from src.containers import Container
+from src.port import Port
+from src.ship import Ship
+
+
+class Command(ABC):
+    """Base class for a command whose IDs have been resolved to direct references."""
+
+    @abstractmethod
+    def execute(self) -> bool:
+        """Runs the command.
+
+        Returns:
+            bool: True if the command succeeded, False otherwise.
+        """
+        pass
+
+
+@dataclass
+class LoadCommand(Command):
+    """Moves a container from a port onto a ship."""
+
+    ship: Ship
+    port: Optional[Port]
+    container_id: str
+    container: Optional[Container]
+
+    def execute(self) -> bool:
+        container = self.container
+        if (self.port is None or container is None
+                or self.port.get_container(container.id) is not container):
+            print(f"Контейнер {self.container_id} не знайдено в порту")
+            return False
+        if not self.ship.load(container):
+            print(f"Контейнер {container.id} неможливо завантажити на корабель {self.ship.name}")
+            return False
+        self.port.unload_container(container.id)
+        print(f"Контейнер {container.id} завантажено на корабель {self.ship.name}")
+        return True
+
+
+@dataclass
+class UnloadCommand(Command):
+    """Moves a container from a ship into a port."""
+
+    ship: Ship
+    port: Optional[Port]
+    container_id: str
+    container: Optional[Container]
+
+    def execute(self) -> bool:
+        container = self.container
+        if self.port is None or container is None or not self.ship.unload(container):
+            print(f"Контейнер {self.container_id} не знайдено на кораблі {self.ship.name}")
+            return False
+        if not self.port.load_container(container):
+            self.ship.load(container)
+            print(f"Контейнер {container.id} неможливо розвантажити в порт {self.port.port_id}")
+            return False
+        print(f"Контейнер {container.id} розвантажено з корабля {self.ship.name}")
+        return True
+
+
+@dataclass
+class SailCommand(Command):
+    """Sails a ship from one port to another."""
+
+    ship: Ship
+    port: Optional[Port]
+    destination_port_id: str
+    destination_port: Optional[Port]
+
+    def execute(self) -> bool:
+        if self.port is None or self.destination_port is None:
+            print(f"Порт {self.destination_port_id} не знайдено")
+            return False
+        distance = self.port.calculate_distance(self.destination_port)
+        self.ship.sail_to(self.destination_port)
+        if self.ship.voyages is not None:
+            # The consumption of the cargo is taken as fuel per kilometer.
+            km = self.port.calculate_distance(self.destination_port, method="haversine")
+            self.ship.voyages.record(self.ship.name, self.port.port_id, self.destination_port.port_id,
+                                     km, km * self.ship.total_consumption)
+        print(f"Корабель {self.ship.name} вирушив до порту {self.destination_port.port_id} "
+              f"(відстань {distance:.2f})")
+        return True
+
+
+@dataclass
+class RefuelCommand(Command):
+    """Refuels a ship."""
+
+    ship: Ship
+    amount: float
+
+    def execute(self) -> bool:
+        self.ship.re_fuel(self.amount)
+        print(f"Корабель {self.ship.name} заправлено на {self.amount} одиниць")
+        return True
+
+
+def _load(command: Dict[str, Any], ship: Ship, ports: Dict[str, Port],
+          containers: Dict[str, Container]) -> Command:
+    return LoadCommand(ship, ports.get(command["port_id"]), command["container_id"],
+                       containers.get(command["container_id"]))
+
+
+def _unload(command: Dict[str, Any], ship: Ship, ports: Dict[str, Port],
+            containers: Dict[str, Container]) -> Command:
+    return UnloadCommand(ship, ports.get(command["port_id"]), command["container_id"],
+                         containers.get(command["container_id"]))
+
+
+def _sail(command: Dict[str, Any], ship: Ship, ports: Dict[str, Port],
+          containers: Dict[str, Container]) -> Command:
+    return SailCommand(ship, ports.get(command["port_id"]), command["destination_port_id"],
+                       ports.get(command["destination_port_id"]))
+
+
+def _refuel(command: Dict[str, Any], ship: Ship, ports: Dict[str, Port],
+            containers: Dict[str, Container]) -> Command:
+    return RefuelCommand(ship, command["amount"])
+
+
+COMPILERS: Dict[str, Callable[..., Command]] = {
+    "load": _load,
+    "unload": _unload,
+    "sail": _sail,
+    "refuel": _refuel,
+}
+
+
+def compile_command(command: Dict[str, Any],
+                    ports: Dict[str, Port],
+                    ships: Dict[str, Ship],
+                    containers: Dict[str, Container]) -> Optional[Command]:
+    """Resolves the IDs referenced by a raw command record.
+
+    Args:
+        command (Dict[str, Any]): The raw command record.
+        ports (Dict[str, Port]): Ports by ID.
+        ships (Dict[str, Ship]): Ships by ID.
+        containers (Dict[str, Container]): Every known container by ID.
+
+    Returns:
+        Optional[Command]: The resolved command, or None if its ship or action is unknown.
+    """
+    ship = ships.get(command["ship_id"])
+    compiler = COMPILERS.get(command["action"])
+    if ship is None or compiler is None:
+        return None
+    return compiler(command, ship, ports, containers)
+
+
+def compile_commands(commands: Iterable[Dict[str, Any]],
+                     ports: Dict[str, Port],
+                     ships: Dict[str, Ship],
+                     containers: Dict[str, Container]) -> List[Command]:
+    """Resolves a batch of raw command records, dropping the ones that cannot run.
+
+    Returns:
+        List[Command]: The resolved commands in their original order.
+    """
+    compiled = (compile_command(command, ports, ships, containers) for command in commands)
+    return [command for command in compiled if command is not None]
+
+
+def run_commands(commands: Iterable[Command]) -> int:
+    """Executes resolved commands one after another.
+
+    Returns:
+        int: The number of commands that succeeded.
+    """
+    return sum(1 for command in commands if command.execute())
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Self
+from typing import Dict, Optional, Self, Type
 
 class Container(ABC):
     """Abstract base class for containers.
@@ -9,6 +9,8 @@ class Container(ABC):
         weight (float): The weight of the container.
     """
 
+    __slots__ = ("id", "weight")
+
     def __init__(self, id: int, weight: float) -> None:
         """Initializes a Container instance.
 
@@ -68,16 +70,10 @@ class Container(ABC):
         Raises:
             ValueError: If the container type is unknown.
         """
-        if data["type"] == "BasicContainer":
-            return BasicContainer(data['id'], data['weight'])
-        elif data["type"] == "HeavyContainer":
-            return HeavyContainer(data['id'], data['weight'])
-        elif data["type"] == "RefrigeratedContainer":
-            return RefrigeratedContainer(data['id'], data['weight'])
-        elif data["type"] == "LiquidContainer":
-            return LiquidContainer(data['id'], data['weight'])
-        else:
+        cls = CONTAINER_CLASSES.get(data["type"])
+        if cls is None:
             raise ValueError("Unknown container type")
+        return cls(data['id'], data['weight'])
 
 
 class SmallContainer(Container):
@@ -87,6 +83,8 @@ class SmallContainer(Container):
         UNIT_CONSUMPTION (float): Unit consumption rate for basic containers.
     """
 
+    __slots__ = ()
+
     UNIT_CONSUMPTION = 2.5
 
     def consumption(self) -> float:
@@ -105,6 +103,8 @@ class HeavyContainer(Container):
         UNIT_CONSUMPTION (float): Unit consumption rate for heavy containers.
     """
 
+    __slots__ = ()
+
     UNIT_CONSUMPTION = 3.0
 
     def consumption(self) -> float:
@@ -123,6 +123,8 @@ class RefrigeratedContainer(Container):
         UNIT_CONSUMPTION (float): Unit consumption rate for refrigerated containers.
     """
 
+    __slots__ = ()
+
     UNIT_CONSUMPTION = 3.5
 
     def consumption(self) -> float:
@@ -141,6 +143,8 @@ class LiquidContainer(Container):
         UNIT_CONSUMPTION (float): Unit consumption rate for liquid containers.
     """
 
+    __slots__ = ()
+
     UNIT_CONSUMPTION = 4.0
 
     def consumption(self) -> float:
@@ -152,23 +156,51 @@ class LiquidContainer(Container):
         return LiquidContainer.UNIT_CONSUMPTION * self.weight
 
 
+SMALL_WEIGHT_LIMIT = 300
+
+# Container classes by class name, as written by ``to_dict``.
+CONTAINER_CLASSES: Dict[str, Type[Container]] = {
+    cls.__name__: cls for cls in (SmallContainer, HeavyContainer, RefrigeratedContainer, LiquidContainer)
+}
+# Container classes by the type names accepted by ``container_factory``.
+CONTAINER_KINDS: Dict[str, Type[Container]] = {
+    'refrigerated': RefrigeratedContainer,
+    'liquid': LiquidContainer,
+}
+
+
+def register_container(cls: Type[Container], kind: Optional[str] = None) -> Type[Container]:
+    """Makes a container class known to ``from_dict`` and, with a kind, to ``container_factory``.
+
+    Args:
+        cls (Type[Container]): The container class.
+        kind (Optional[str], optional): Type name that selects the class in ``container_factory``.
+
+    Returns:
+        Type[Container]: The class itself, so this can be used as a decorator.
+    """
+    CONTAINER_CLASSES[cls.__name__] = cls
+    if kind is not None:
+        CONTAINER_KINDS[kind] = cls
+    return cls
+
+
 def container_factory(id: int, weight: float, type_: str = 'basic') -> Container:
     """Factory function to create a container based on its weight and type.
 
+    The type is looked up in ``CONTAINER_KINDS``; any other type gives a basic
+    container, small up to ``SMALL_WEIGHT_LIMIT`` and heavy above it.
+
     Args:
         id (int): The unique identifier for the container.
         weight (float): The weight of the container.
         type_ (str, optional): The type of the container ('basic', 'refrigerated', 'liquid'). Defaults to 'basic'.
 
     Returns:
-        Container: An instance of a BasicContainer, HeavyContainer, RefrigeratedContainer, or LiquidContainer
+        Container: An instance of a SmallContainer, HeavyContainer, RefrigeratedContainer, or LiquidContainer
         based on the provided weight and type.
     """
-    if type_ == 'refrigerated':
-        return RefrigeratedContainer(id, weight)
-    elif type_ == 'liquid':
-        return LiquidContainer(id, weight)
-    elif weight <= 300:
-        return BasicContainer(id, weight)
-    else:
-        return HeavyContainer(id, weight)
+    cls = CONTAINER_KINDS.get(type_)
+    if cls is not None:
+        return cls(id, weight)
+    return SmallContainer(id, weight) if weight <= SMALL_WEIGHT_LIMIT else HeavyContainer(id, weight)
@@ -0,0 +1,100 @@
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
+from src.port import Port, EARTH_RADIUS_KM
+
+PortsOrCoordinates = Union[Sequence[Port], np.ndarray]
+
+
+def coordinates(ports: PortsOrCoordinates) -> np.ndarray:
+    """Collects the coordinates of ports into an array.
+
+    Args:
+        ports (PortsOrCoordinates): Ports, or an array of (latitude, longitude) rows.
+
+    Returns:
+        np.ndarray: A float array of shape (N, 2) with latitude and longitude in degrees.
+    """
+    if isinstance(ports, np.ndarray):
+        return np.asarray(ports, dtype=float).reshape(-1, 2)
+    coords = np.empty((len(ports), 2), dtype=float)
+    for i, port in enumerate(ports):
+        coords[i, 0] = port.latitude
+        coords[i, 1] = port.longitude
+    return coords
+
+
+def distance_matrix(ports_a: PortsOrCoordinates,
+                    ports_b: Optional[PortsOrCoordinates] = None,
+                    method: str = "planar") -> np.ndarray:
+    """Calculates the distances between every port of one set and every port of another.
+
+    ``planar`` is the Euclidean distance on raw degrees used by
+    ``Port.calculate_distance``; ``haversine`` is the great-circle distance in
+    kilometers.
+
+    Args:
+        ports_a (PortsOrCoordinates): N source ports.
+        ports_b (PortsOrCoordinates, optional): M target ports. Defaults to ``ports_a``.
+        method (str, optional): ``planar`` or ``haversine``. Defaults to ``planar``.
+
+    Returns:
+        np.ndarray: An (N, M) array of distances.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    a = coordinates(ports_a)
+    b = a if ports_b is None else coordinates(ports_b)
+
+    if method == "planar":
+        d_lat = a[:, None, 0] - b[None, :, 0]
+        d_lon = a[:, None, 1] - b[None, :, 1]
+        return np.hypot(d_lat, d_lon)
+
+    if method == "haversine":
+        a = np.radians(a)
+        b = np.radians(b)
+        d_lat = a[:, None, 0] - b[None, :, 0]
+        d_lon = a[:, None, 1] - b[None, :, 1]
+        h = np.sin(d_lat / 2) ** 2 + np.cos(a[:, None, 0]) * np.cos(b[None, :, 0]) * np.sin(d_lon / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+    raise ValueError(f"Unknown distance method: {method}")
+
+
+def distances_from(port: Port, ports: PortsOrCoordinates, method: str = "planar") -> np.ndarray:
+    """Calculates the distances from one port to N ports.
+
+    Args:
+        port (Port): The source port.
+        ports (PortsOrCoordinates): The N target ports.
+        method (str, optional): ``planar`` or ``haversine``. Defaults to ``planar``.
+
+    Returns:
+        np.ndarray: An array of N distances.
+    """
+    return distance_matrix([port], ports, method)[0]
+
+
+def nearest(port: Port, ports: Sequence[Port], method: str = "planar",
+            cost_per_unit: Union[float, np.ndarray] = 1.0) -> Tuple[int, float]:
+    """Finds the closest or cheapest port to reach from a given port.
+
+    Args:
+        port (Port): The source port.
+        ports (Sequence[Port]): Candidate destination ports.
+        method (str, optional): ``planar`` or ``haversine``. Defaults to ``planar``.
+        cost_per_unit (Union[float, np.ndarray], optional): Cost of a unit of distance,
+            either shared or one per candidate. Defaults to 1.0.
+
+    Returns:
+        Tuple[int, float]: The index of the best candidate and its cost.
+
+    Raises:
+        ValueError: If there are no candidates.
+    """
+    if len(ports) == 0:
+        raise ValueError("No ports to choose from")
+    costs = distances_from(port, ports, method) * cost_per_unit
+    best = int(np.argmin(costs))
+    return best, float(costs[best])
@@ -0,0 +1,161 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from src.port import Port
+
+MANIFEST = "manifest.json"
+VERSION = 1
+
+
+def _shard_name(number: int) -> str:
+    """Returns the file name of a shard."""
+    return f"ports-{number:05d}.json"
+
+
+def _write_shard(directory: str, name: str, ports: Sequence[Port]) -> List[Dict[str, Any]]:
+    """Writes ports to one shard file and returns their manifest entries.
+
+    The shard is a JSON array of the ports as ``Port.save_to_json`` writes
+    them. It is written to a temporary file first and renamed when complete.
+    """
+    entries = []
+    chunks = [b"[\n"]
+    offset = len(chunks[0])
+    for number, port in enumerate(ports):
+        if number:
+            chunks.append(b",\n")
+            offset += 2
+        text = port.to_json(indent=4).encode()
+        chunks.append(text)
+        entries.append({"port_id": port.port_id, "shard": name, "offset": offset, "length": len(text)})
+        offset += len(text)
+    chunks.append(b"\n]\n")
+    path = os.path.join(directory, name)
+    with open(path + ".tmp", "wb") as f:
+        f.writelines(chunks)
+    os.replace(path + ".tmp", path)
+    return entries
+
+
+def export_ports(ports: Iterable[Port], directory: str, ports_per_shard: int = 64,
+                 max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """Saves many ports into sharded JSON files with a worker pool.
+
+    The ports are cut into shards of ``ports_per_shard`` in their given order,
+    and every shard is encoded and written by a thread of the pool. The
+    manifest, written last, lists for every port its shard and the byte range
+    of its JSON text, so ``load_port`` reads one port without parsing the
+    others, and a directory with a manifest always has complete shards.
+
+    Ports keep their serialization caches between calls, so exporting the
+    same ports again only encodes what changed. Encoding holds the GIL, so
+    the pool mostly overlaps the file writes with the encoding of other shards.
+
+    Args:
+        ports (Iterable[Port]): The ports to save.
+        directory (str): Output directory; created if missing.
+        ports_per_shard (int, optional): Number of ports per shard file. Defaults to 64.
+        max_workers (Optional[int], optional): Size of the thread pool. Defaults to the
+            ThreadPoolExecutor default.
+
+    Returns:
+        Dict[str, Any]: The manifest, with an ``index`` of its port entries by port ID.
+
+    Raises:
+        ValueError: If two ports have the same ID or ``ports_per_shard`` is not positive.
+    """
+    if ports_per_shard < 1:
+        raise ValueError("ports_per_shard must be positive")
+    ports = list(ports)
+    if len({port.port_id for port in ports}) != len(ports):
+        raise ValueError("Port IDs must be unique")
+    os.makedirs(directory, exist_ok=True)
+    shards = [ports[start:start + ports_per_shard] for start in range(0, len(ports), ports_per_shard)]
+    names = [_shard_name(number) for number in range(len(shards))]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        entries = [entry for shard in pool.map(_write_shard, [directory] * len(shards), names, shards)
+                   for entry in shard]
+    manifest = {"version": VERSION, "shards": names, "ports": entries}
+    path = os.path.join(directory, MANIFEST)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(path + ".tmp", path)
+    _port_index(manifest)
+    return manifest
+
+
+def _port_index(manifest: Dict[str, Any]) -> Dict[Any, Dict[str, Any]]:
+    """Returns the manifest entries by port ID, building the index once per manifest."""
+    index = manifest.get("index")
+    if index is None:
+        index = manifest["index"] = {entry["port_id"]: entry for entry in manifest["ports"]}
+    return index
+
+
+def read_manifest(directory: str) -> Dict[str, Any]:
+    """Reads the manifest of an export directory.
+
+    Args:
+        directory (str): The directory written by ``export_ports``.
+
+    Returns:
+        Dict[str, Any]: The manifest, with an ``index`` of its port entries by port ID.
+
+    Raises:
+        ValueError: If the manifest has an unsupported version.
+    """
+    with open(os.path.join(directory, MANIFEST)) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != VERSION:
+        raise ValueError(f"Unsupported manifest version: {manifest.get('version')}")
+    _port_index(manifest)
+    return manifest
+
+
+def load_port(directory: str, port_id: Any, manifest: Optional[Dict[str, Any]] = None) -> Port:
+    """Loads one port of an export, reading only its bytes of its shard.
+
+    Args:
+        directory (str): The directory written by ``export_ports``.
+        port_id (Any): The ID of the port.
+        manifest (Optional[Dict[str, Any]], optional): The manifest, if already read. Passing
+            it when loading many ports reads it and builds its port index only once.
+
+    Returns:
+        Port: A new Port instance equal to the saved one.
+
+    Raises:
+        KeyError: If the export has no port with this ID.
+    """
+    manifest = read_manifest(directory) if manifest is None else manifest
+    entry = _port_index(manifest).get(port_id)
+    if entry is None:
+        raise KeyError(port_id)
+    with open(os.path.join(directory, entry["shard"]), "rb") as f:
+        f.seek(entry["offset"])
+        return Port.from_dict(json.loads(f.read(entry["length"])))
+
+
+def _read_shard(directory: str, name: str) -> List[Port]:
+    """Loads every port of one shard file."""
+    with open(os.path.join(directory, name), "rb") as f:
+        return [Port.from_dict(data) for data in json.load(f)]
+
+
+def load_ports(directory: str, max_workers: Optional[int] = None) -> Dict[Any, Port]:
+    """Loads every port of an export, one shard per task of a thread pool.
+
+    Args:
+        directory (str): The directory written by ``export_ports``.
+        max_workers (Optional[int], optional): Size of the thread pool. Defaults to the
+            ThreadPoolExecutor default.
+
+    Returns:
+        Dict[Any, Port]: The ports by ID, in the order they were exported.
+    """
+    names = read_manifest(directory)["shards"]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return {port.port_id: port
+                for shard in pool.map(_read_shard, [directory] * len(names), names)
+                for port in shard}
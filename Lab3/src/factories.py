@@ -0,0 +1,130 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from src.containers import Container, SmallContainer, HeavyContainer, CONTAINER_KINDS, SMALL_WEIGHT_LIMIT
+from src.item import Item, ITEM_TYPES
+from src.ship import Ship, SHIP_TYPES
+
+
+def build_containers(records: Iterable[Dict[str, Any]]) -> List[Container]:
+    """Builds containers from input records in one pass.
+
+    Every record needs ``id`` and ``weight`` and may name its type in
+    ``special``; the class is chosen like ``container_factory`` does, through
+    the ``CONTAINER_KINDS`` table, so registered types are built too.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Container records, e.g. from the input file.
+
+    Returns:
+        List[Container]: The containers, in the order of the records.
+    """
+    limit, small, heavy, kinds = SMALL_WEIGHT_LIMIT, SmallContainer, HeavyContainer, CONTAINER_KINDS
+    return [(kinds.get(record.get("special")) or (small if record["weight"] <= limit else heavy))(
+                record["id"], record["weight"])
+            for record in records]
+
+
+def containers_from_columns(ids: Sequence[Any], weights: Sequence[float],
+                            kinds: Optional[Sequence[Optional[str]]] = None) -> List[Container]:
+    """Builds containers from parallel columns of IDs, weights and type names.
+
+    Args:
+        ids (Sequence[Any]): Container IDs.
+        weights (Sequence[float]): Container weights.
+        kinds (Optional[Sequence[Optional[str]]], optional): Type names; none means basic containers only.
+
+    Returns:
+        List[Container]: One container per row.
+
+    Raises:
+        ValueError: If the columns differ in length.
+    """
+    if len(ids) != len(weights) or (kinds is not None and len(kinds) != len(ids)):
+        raise ValueError("Container columns must have the same length")
+    limit, small, heavy, table = SMALL_WEIGHT_LIMIT, SmallContainer, HeavyContainer, CONTAINER_KINDS
+    if kinds is None:
+        return [small(id, weight) if weight <= limit else heavy(id, weight) for id, weight in zip(ids, weights)]
+    return [(table.get(kind) or (small if weight <= limit else heavy))(id, weight)
+            for id, weight, kind in zip(ids, weights, kinds)]
+
+
+def build_items(records: Iterable[Dict[str, Any]]) -> List[Item]:
+    """Builds items from records in one pass.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Records with ``item_type``, ``item_id``,
+            ``weight``, ``count`` and ``container_id``.
+
+    Returns:
+        List[Item]: The items, in the order of the records.
+
+    Raises:
+        ValueError: If a record has an unknown item type.
+    """
+    items = []
+    for record in records:
+        cls = ITEM_TYPES.get(record["item_type"])
+        if cls is None:
+            raise ValueError(f"Unknown item type: {record['item_type']}")
+        items.append(cls(record["item_id"], record["weight"], record["count"], record["container_id"]))
+    return items
+
+
+def items_from_columns(item_types: Sequence[str], item_ids: Sequence[Any], weights: Sequence[float],
+                       counts: Sequence[int], container_ids: Sequence[Any]) -> List[Item]:
+    """Builds items from parallel columns.
+
+    Every distinct type name is looked up in ``ITEM_TYPES`` once.
+
+    Args:
+        item_types (Sequence[str]): Item type names, e.g. "small".
+        item_ids (Sequence[Any]): Item IDs.
+        weights (Sequence[float]): Weights of a single item.
+        counts (Sequence[int]): Numbers of items.
+        container_ids (Sequence[Any]): IDs of the containers holding the items.
+
+    Returns:
+        List[Item]: One item per row.
+
+    Raises:
+        ValueError: If the columns differ in length or a type name is unknown.
+    """
+    if not len(item_types) == len(item_ids) == len(weights) == len(counts) == len(container_ids):
+        raise ValueError("Item columns must have the same length")
+    classes = {}
+    for item_type in set(item_types):
+        classes[item_type] = ITEM_TYPES.get(item_type)
+        if classes[item_type] is None:
+            raise ValueError(f"Unknown item type: {item_type}")
+    return [classes[item_type](item_id, weight, count, container_id)
+            for item_type, item_id, weight, count, container_id
+            in zip(item_types, item_ids, weights, counts, container_ids)]
+
+
+def build_ships(records: Iterable[Dict[str, Any]]) -> List[Ship]:
+    """Builds ships from input records in one pass.
+
+    Each ship is created by the constructor of its registered type, like
+    ``ShipBuilder`` does, and given its name and capacities, without a builder
+    and a method call per field.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Records with ``id``, ``ship_type``,
+            ``max_weight`` and ``fuel_capacity``, as in the input file.
+
+    Returns:
+        List[Ship]: The ships, in the order of the records.
+
+    Raises:
+        ValueError: If a record has an unknown ship type.
+    """
+    ships = []
+    for record in records:
+        cls = SHIP_TYPES.get(record["ship_type"])
+        if cls is None:
+            raise ValueError(f"Unknown ship type: {record['ship_type']}")
+        ship = cls()
+        ship.name = record["id"]
+        ship.max_weight = record["max_weight"]
+        ship.fuel_capacity = record["fuel_capacity"]
+        ships.append(ship)
+    return ships
@@ -0,0 +1,103 @@
+import json
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+
+
+class FragmentCache:
+    """Serialized forms of objects, reused until the objects change.
+
+    For every object the cache keeps its ``to_dict()`` result and, once asked
+    for, that dict encoded as JSON text. An entry is valid while the same
+    object is passed in again and its state key (e.g. type, ID and weight of a
+    container) is unchanged, so changed objects are re-encoded on the next
+    call and all others are served from the cache. Entries of objects that are
+    no longer passed in are dropped.
+
+    The dicts are shared between calls and must be treated as read-only.
+    Changes the state key does not see have to be announced with
+    ``invalidate``.
+    """
+
+    __slots__ = ("_state", "_entries", "_layout")
+
+    def __init__(self, state: Callable[[Any], Hashable]) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            state (Callable[[Any], Hashable]): Returns a key that changes whenever the
+                serialized form of an object changes.
+        """
+        self._state = state
+        self._entries: Dict[int, list] = {}
+        self._layout = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, obj: Any = None) -> None:
+        """Forgets the serialized form of one object, or of every object.
+
+        Args:
+            obj (Any, optional): The object. Defaults to every object.
+        """
+        if obj is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(id(obj), None)
+
+    def _refresh(self, objects: Iterable[Any]) -> List[list]:
+        """Returns the valid entry of every object, re-serializing the changed ones."""
+        state, old, entries = self._state, self._entries, {}
+        ordered = []
+        for obj in objects:
+            key = id(obj)
+            entry = entries.get(key)
+            if entry is None:
+                entry = old.get(key)
+                current = state(obj)
+                # The entry holds the object, so its id cannot be reused while the entry exists.
+                if entry is None or entry[0] is not obj or entry[1] != current:
+                    entry = [obj, current, obj.to_dict(), None]
+                entries[key] = entry
+            ordered.append(entry)
+        self._entries = entries
+        return ordered
+
+    def dicts(self, objects: Iterable[Any]) -> List[Dict]:
+        """Returns the ``to_dict()`` form of every object, in order.
+
+        Args:
+            objects (Iterable[Any]): The objects, e.g. the containers of a port.
+
+        Returns:
+            List[Dict]: The shared, read-only dicts.
+        """
+        return [entry[2] for entry in self._refresh(objects)]
+
+    def json_items(self, objects: Iterable[Any], indent: int, level: int) -> List[str]:
+        """Returns every object encoded as a JSON list item, in order.
+
+        The text is what ``json.dump`` with the same ``indent`` writes for the
+        object when the list holding it is nested ``level`` levels deep, without
+        the leading indentation of its first line.
+
+        Args:
+            objects (Iterable[Any]): The objects.
+            indent (int): Spaces per nesting level.
+            level (int): Nesting level of the list items. Texts cached for another
+                ``indent`` or ``level`` are encoded again.
+
+        Returns:
+            List[str]: The encoded objects.
+        """
+        if self._layout != (indent, level):
+            self._layout = (indent, level)
+            for entry in self._entries.values():
+                entry[3] = None
+        newline = "\n" + " " * (indent * level)
+        encode = json.JSONEncoder(indent=indent).encode
+        texts = []
+        for entry in self._refresh(objects):
+            if entry[3] is None:
+                entry[3] = encode(entry[2]).replace("\n", newline)
+            texts.append(entry[3])
+        return texts
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, Type
 
 class Item(ABC):
     """
@@ -11,6 +12,8 @@ class Item(ABC):
         containerID (int): Identifier for the container holding the item.
     """
 
+    __slots__ = ("ID", "weight", "count", "containerID")
+
     def __init__(self, item_id: int, weight: float, count: int, container_id: int):
         """
         Initialize an Item object.
@@ -39,6 +42,8 @@ class Item(ABC):
 class SmallItem(Item):
     """Class representing a small item."""
 
+    __slots__ = ()
+
     def get_total_weight(self) -> float:
         """
         Calculate and return the total weight of all small items.
@@ -51,6 +56,8 @@ class SmallItem(Item):
 class HeavyItem(Item):
     """Class representing a heavy item."""
 
+    __slots__ = ()
+
     def get_total_weight(self) -> float:
         """
         Calculate and return the total weight of all heavy items.
@@ -63,6 +70,8 @@ class HeavyItem(Item):
 class RefrigeratedItem(Item):
     """Class representing a refrigerated item."""
 
+    __slots__ = ()
+
     def get_total_weight(self) -> float:
         """
         Calculate and return the total weight of all refrigerated items.
@@ -75,6 +84,8 @@ class RefrigeratedItem(Item):
 class LiquidItem(Item):
     """Class representing a liquid item."""
 
+    __slots__ = ()
+
     def get_total_weight(self) -> float:
         """
         Calculate and return the total weight of all liquid items.
@@ -93,7 +104,8 @@ class ItemFactory:
         Create and return an item of the specified type.
 
         Args:
-            item_type (str): Type of the item to create ("small", "heavy", "refrigerated", or "liquid").
+            item_type (str): Type of the item to create ("small", "heavy", "refrigerated", "liquid"
+                or a type added with ``register_item_type``).
             item_id (int): Unique identifier for the item.
             weight (float): Weight of a single item.
             count (int): Number of items.
@@ -105,13 +117,31 @@ class ItemFactory:
         Raises:
             ValueError: If an unknown item type is provided.
         """
-        if item_type == "small":
-            return SmallItem(item_id, weight, count, container_id)
-        elif item_type == "heavy":
-            return HeavyItem(item_id, weight, count, container_id)
-        elif item_type == "refrigerated":
-            return RefrigeratedItem(item_id, weight, count, container_id)
-        elif item_type == "liquid":
-            return LiquidItem(item_id, weight, count, container_id)
-        else:
-            raise ValueError(f"Unknown item type: {item_type}")
\ No newline at end of file
+        cls = ITEM_TYPES.get(item_type)
+        if cls is None:
+            raise ValueError(f"Unknown item type: {item_type}")
+        return cls(item_id, weight, count, container_id)
+
+
+# Item classes by the type names accepted by ``ItemFactory.create_item``.
+ITEM_TYPES: Dict[str, Type[Item]] = {
+    "small": SmallItem,
+    "heavy": HeavyItem,
+    "refrigerated": RefrigeratedItem,
+    "liquid": LiquidItem,
+}
+
+
+def register_item_type(item_type: str, cls: Type[Item]) -> Type[Item]:
+    """
+    Make an item class available to ``ItemFactory`` under a type name.
+
+    Args:
+        item_type (str): The type name, e.g. "fragile".
+        cls (Type[Item]): The item class.
+
+    Returns:
+        Type[Item]: The class itself.
+    """
+    ITEM_TYPES[item_type] = cls
+    return cls
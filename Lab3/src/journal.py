@@ -0,0 +1,284 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from src.containers import Container
+from src.port import Port, Ship as DockedShip
+from src.ship import Ship, SHIP_CLASSES
+
+
+def ship_state(ship: Ship) -> Dict[str, Any]:
+    """Converts a ship to a dictionary with everything needed to rebuild it.
+
+    Args:
+        ship (Ship): The ship to convert.
+
+    Returns:
+        Dict[str, Any]: The type, name, limits and containers of the ship.
+    """
+    return {
+        "type": ship.__class__.__name__,
+        "name": ship.name,
+        "max_weight": ship.max_weight,
+        "fuel_capacity": ship.fuel_capacity,
+        "containers": [container.to_dict() for container in ship.containers],
+    }
+
+
+def ship_from_state(state: Dict[str, Any]) -> Ship:
+    """Rebuilds a ship from a dictionary made by ``ship_state``.
+
+    Args:
+        state (Dict[str, Any]): The saved state of the ship.
+
+    Returns:
+        Ship: A new ship of the saved type with the saved containers.
+    """
+    cls = SHIP_CLASSES[state["type"]]
+    ship = cls.__new__(cls)
+    Ship.__init__(ship, state["name"], state["max_weight"], state["fuel_capacity"])
+    for data in state["containers"]:
+        ship.load(Container.from_dict(data))
+    return ship
+
+
+class Journal:
+    """Append-only journal of the domain events of ports and ships.
+
+    Every change of an attached port or ship is appended to the journal file as
+    one JSON line with an increasing sequence number, so a checkpoint costs
+    O(changes) instead of rewriting the whole world with ``save_to_json``.
+    ``compact`` folds the journal into a snapshot of the world and starts a new,
+    empty journal; ``replay`` rebuilds the world from the snapshot and the
+    events after it.
+
+    Compact only while no commands are running, e.g. between two batches of
+    commands: an event recorded by another thread during compaction could
+    otherwise be applied twice on replay.
+
+    Attributes:
+        path (str): Path to the journal file.
+        seq (int): Sequence number of the last recorded event.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Opens a journal file for appending, creating it if needed.
+
+        Args:
+            path (str): Path to the journal file.
+        """
+        self.path = path
+        self.seq = 0
+        _drop_torn_tail(path)
+        for event in read_events(path):
+            self.seq = event["seq"]
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+
+    def record(self, event: str, **fields: Any) -> None:
+        """Appends an event to the journal.
+
+        Args:
+            event (str): Name of the event, e.g. ``port_container_loaded``.
+            **fields (Any): JSON-serializable details of the event.
+        """
+        with self._lock:
+            self.seq += 1
+            fields["seq"] = self.seq
+            fields["event"] = event
+            self._file.write(json.dumps(fields) + "\n")
+
+    def attach(self, entity: Any) -> None:
+        """Records the full state of a port or ship and starts journaling its changes.
+
+        Args:
+            entity (Any): A Port or a Ship.
+        """
+        if isinstance(entity, Port):
+            self.record("port_added", state=entity.to_dict())
+        else:
+            self.record("ship_added", state=ship_state(entity))
+        entity.journal = self
+
+    def attach_world(self, ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+        """Attaches every port, then every ship.
+
+        Args:
+            ports (Dict[str, Port]): Ports by ID.
+            ships (Dict[str, Ship]): Ships by name.
+        """
+        for port in ports.values():
+            self.attach(port)
+        for ship in ships.values():
+            self.attach(ship)
+
+    def flush(self) -> None:
+        """Makes every recorded event durable on disk."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def compact(self, snapshot_path: str, ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+        """Folds the journal into a snapshot of the world.
+
+        The snapshot is written next to its final path and moved into place, so
+        a crash leaves either the old or the new snapshot. It remembers the
+        sequence number it covers, and replay skips older events, so a crash
+        before the journal is truncated loses nothing either.
+
+        Args:
+            snapshot_path (str): Path to the snapshot file.
+            ports (Dict[str, Port]): Every port of the world by ID.
+            ships (Dict[str, Ship]): Every ship of the world by name.
+        """
+        with self._lock:
+            self._file.flush()
+            snapshot = {
+                "seq": self.seq,
+                "ports": [port.to_dict() for port in ports.values()],
+                "ships": [ship_state(ship) for ship in ships.values()],
+            }
+            temporary = snapshot_path + ".tmp"
+            with open(temporary, "w") as f:
+                json.dump(snapshot, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, snapshot_path)
+            self._file.close()
+            self._file = open(self.path, "w")
+            # Keeps the sequence going when the journal is reopened later.
+            self._file.write(json.dumps({"seq": self.seq, "event": "compacted"}) + "\n")
+
+    def close(self) -> None:
+        """Closes the journal file."""
+        with self._lock:
+            self._file.close()
+
+
+def _drop_torn_tail(path: str) -> None:
+    """Cuts off a last line left unfinished by a crash, so new events start on a line of their own."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end != len(data):
+            f.truncate(end)
+
+
+def read_events(path: str) -> Iterator[Dict[str, Any]]:
+    """Reads the events of a journal file in the order they were recorded.
+
+    A torn last line, left by a crash in the middle of a write, is ignored.
+
+    Args:
+        path (str): Path to the journal file.
+
+    Yields:
+        Dict[str, Any]: One event at a time.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path) as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
+def _add_port(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Restores a port from its recorded state."""
+    port = Port.from_dict(event["state"])
+    ports[port.port_id] = port
+
+
+def _add_ship(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Restores a ship from its recorded state."""
+    ship = ship_from_state(event["state"])
+    ships[ship.name] = ship
+
+
+def _port_container_loaded(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Stores a container in a port."""
+    ports[event["port"]]._store(Container.from_dict(event["container"]))
+
+
+def _port_container_unloaded(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Removes a container from a port."""
+    ports[event["port"]]._discard(event["container"])
+
+
+def _ship_arrived(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Docks a ship at a port."""
+    ports[event["port"]]._ships[event["ship"]] = DockedShip(event["ship"])
+
+
+def _ship_left(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Moves a ship from the docked ships of a port to its history."""
+    port = ports[event["port"]]
+    docked = port._ships.pop(event["ship"], None)
+    if docked is not None:
+        port.history.append(docked)
+
+
+def _ship_container_loaded(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Loads a container onto a ship."""
+    ships[event["ship"]].load(Container.from_dict(event["container"]))
+
+
+def _ship_container_unloaded(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Unloads a container from a ship."""
+    ship = ships[event["ship"]]
+    ship.unload(ship.get_container(event["container"]))
+
+
+def _no_change(event: Dict[str, Any], ports: Dict[str, Port], ships: Dict[str, Ship]) -> None:
+    """Ignores an event that does not change the rebuilt world."""
+
+
+APPLY: Dict[str, Callable[[Dict[str, Any], Dict[str, Port], Dict[str, Ship]], None]] = {
+    "port_added": _add_port,
+    "ship_added": _add_ship,
+    "port_container_loaded": _port_container_loaded,
+    "port_container_unloaded": _port_container_unloaded,
+    "ship_arrived": _ship_arrived,
+    "ship_left": _ship_left,
+    "ship_container_loaded": _ship_container_loaded,
+    "ship_container_unloaded": _ship_container_unloaded,
+    # Ships do not keep a position or a fuel level yet, so these are only an audit trail.
+    "ship_sailed": _no_change,
+    "ship_refueled": _no_change,
+    "compacted": _no_change,
+}
+
+
+def replay(journal_path: str,
+           snapshot_path: Optional[str] = None) -> Tuple[Dict[str, Port], Dict[str, Ship]]:
+    """Rebuilds the world from a snapshot and the journal recorded after it.
+
+    The rebuilt ports and ships are not attached to any journal.
+
+    Args:
+        journal_path (str): Path to the journal file.
+        snapshot_path (Optional[str]): Path to the snapshot written by ``Journal.compact``, if any.
+
+    Returns:
+        Tuple[Dict[str, Port], Dict[str, Ship]]: Ports by ID and ships by name.
+    """
+    ports: Dict[str, Port] = {}
+    ships: Dict[str, Ship] = {}
+    seq = 0
+    if snapshot_path is not None and os.path.exists(snapshot_path):
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+        seq = snapshot["seq"]
+        for state in snapshot["ports"]:
+            _add_port({"state": state}, ports, ships)
+        for state in snapshot["ships"]:
+            _add_ship({"state": state}, ports, ships)
+
+    for event in read_events(journal_path):
+        if event["seq"] > seq:
+            APPLY[event["event"]](event, ports, ships)
+    return ports, ships
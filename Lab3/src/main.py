@@ -1,86 +1,109 @@
-from abc import ABC, abstractmethod
 import json
+from typing import Any, Dict, Optional
+from src.commands import compile_command, compile_commands, run_commands
+from src.metrics import registry
 from src.port import Port
-from src.ship import ShipBuilder, LightWeightShip, MediumShip, HeavyShip
-from src.containers import container_factory
+from src.reader import iter_records, load_records
+from src.ship import ShipBuilder, Ship
+from src.containers import Container, container_factory
 
 
-def main():
+def handle_entry(entry: Dict[str, Any],
+                 ports: Dict[str, Port],
+                 ships: Dict[str, Ship],
+                 containers: Dict[str, Container]) -> None:
     try:
-        with open("input.json") as f:
-            data = json.load(f)
+        if entry["type"] == "port":
+            port = Port(entry["id"], entry["latitude"], entry["longitude"])
+            ports[port.port_id] = port
+            print(f"Порт {port.port_id} створено")
+
+        elif entry["type"] == "ship":
+            if entry["port_id"] in ports:
+                port = ports[entry["port_id"]]
+                ship_builder = ShipBuilder().set_ship_type(entry["ship_type"]) \
+                    .set_name(entry["id"]) \
+                    .set_max_weight(entry["max_weight"]) \
+                    .set_fuel_capacity(entry["fuel_capacity"])
+                ship = ship_builder.build()
+                ships[ship.name] = ship
+                print(f"Корабель {ship.name} створено та додано до порту {port.port_id}")
+            else:
+                print(f"Порт з ID {entry['port_id']} не знайдено для корабля {entry['id']}")
+
+        elif entry["type"] == "container":
+            container = container_factory(entry["id"], entry["weight"], entry.get("special"))
+            if entry["port_id"] in ports:
+                port = ports[entry["port_id"]]
+                port.load_container(container)
+                containers[container.id] = container
+                print(f"Контейнер {container.id} додано до порту {port.port_id}")
+            else:
+                print(f"Порт з ID {entry['port_id']} не знайдено для контейнера {entry['id']}")
+
+    except KeyError as e:
+        print(f"Пропущено ключ: {e} в записі: {entry}")
+    except Exception as e:
+        print(f"Помилка при обробці запису: {entry}. Помилка: {e}")
+
+
+def main(filename: str = "input.json", stream: bool = False,
+         metrics_file: Optional[str] = None) -> None:
+    """Builds the world described by an input file and runs its commands.
+
+    By default the whole file is parsed first, every entity is created and only
+    then the commands are executed. With ``stream=True`` the records are parsed
+    one by one and each of them is handled as soon as it arrives, so memory use
+    stays flat no matter how large the file is. Commands then see only the
+    entities declared before them in the file.
+
+    Commands are compiled first: their ship, port and container IDs are resolved
+    through hash indexes once, so running them involves no scans.
+
+    Args:
+        filename (str): Path to the input JSON file.
+        stream (bool): Handle records in a single streaming pass.
+        metrics_file (Optional[str]): Collects operation metrics during the run and
+            writes them here, as JSON for ``.json`` files and Prometheus text otherwise.
+    """
+    if metrics_file is not None:
+        registry.enable()
+        try:
+            main(filename, stream)
+        finally:
+            registry.save(metrics_file)
+            registry.disable()
+        return
+
+    ports = {}
+    ships = {}
+    containers = {}
+
+    try:
+        if stream:
+            for record in iter_records(filename):
+                if "action" in record:
+                    command = compile_command(record, ports, ships, containers)
+                    if command is not None:
+                        command.execute()
+                else:
+                    handle_entry(record, ports, ships, containers)
+            return
+
+        data = load_records(filename)
     except FileNotFoundError:
-        print("Файл 'input.json' не знайдено")
+        print(f"Файл '{filename}' не знайдено")
         return
     except json.JSONDecodeError:
         print("Помилка читання JSON-файлу")
         return
 
-    ports = {}
-    ships = {}
-
     for entry in data:
-        try:
-            if entry["type"] == "port":
-                port = Port(entry["id"], entry["latitude"], entry["longitude"])
-                ports[port.port_id] = port
-                print(f"Порт {port.port_id} створено")
-
-            elif entry["type"] == "ship":
-                if entry["port_id"] in ports:
-                    port = ports[entry["port_id"]]
-                    ship_builder = ShipBuilder().set_ship_type(entry["ship_type"]) \
-                        .set_max_weight(entry["max_weight"]) \
-                        .set_fuel_capacity(entry["fuel_capacity"])
-                    ship = ship_builder.build()
-                    ships[ship.name] = ship
-                    print(f"Корабель {ship.name} створено та додано до порту {port.port_id}")
-                else:
-                    print(f"Порт з ID {entry['port_id']} не знайдено для корабля {entry['id']}")
-
-            elif entry["type"] == "container":
-                container = container_factory(entry["id"], entry["weight"], entry.get("special"))
-                if entry["port_id"] in ports:
-                    port = ports[entry["port_id"]]
-                    port.load_container(container)
-                    print(f"Контейнер {container.id} додано до порту {port.port_id}")
-                else:
-                    print(f"Порт з ID {entry['port_id']} не знайдено для контейнера {entry['id']}")
-
-        except KeyError as e:
-            print(f"Пропущено ключ: {e} в записі: {entry}")
-        except Exception as e:
-            print(f"Помилка при обробці запису: {entry}. Помилка: {e}")
-
-    for command in data:
-        if "action" in command:
-            ship = ships.get(command["ship_id"])
-
-            if command["action"] == "load" and ship:
-                port = ports.get(command["port_id"])
-                container = next((c for c in port.containers if c.id == command["container_id"]), None)
-                if container:
-                    ship.load_item(container)
-                    port.unload_item(container.id)
-                    print(f"Контейнер {container.id} завантажено на корабель {ship.name}")
-
-            elif command["action"] == "unload" and ship:
-                container = next((c for c in ship.containers if c.id == command["container_id"]), None)
-                if container:
-                    port = ports.get(command["port_id"])
-                    port.load_container(container)
-                    ship.unload_item(container)
-                    print(f"Контейнер {container.id} розвантажено з корабля {ship.name}")
-
-            elif command["action"] == "sail" and ship:
-                destination_port = ports.get(command["destination_port_id"])
-                distance = ports[command["port_id"]].calculate_distance(destination_port)
-                ship.sail(distance)
-                print(f"Корабель {ship.name} вирушив до порту {destination_port.port_id}")
-
-            elif command["action"] == "refuel" and ship:
-                ship.refuel(command["amount"])
-                print(f"Корабель {ship.name} заправлено на {command['amount']} одиниць")
+        if "action" not in entry:
+            handle_entry(entry, ports, ships, containers)
+
+    commands = compile_commands((entry for entry in data if "action" in entry), ports, ships, containers)
+    run_commands(commands)
 
 if __name__ == "__main__":
     main()
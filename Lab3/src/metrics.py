@@ -0,0 +1,291 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.commands import LoadCommand, UnloadCommand, SailCommand, RefuelCommand
+from src.port import Port
+from src.ship import Ship
+
+LATENCY_BUCKETS: Tuple[float, ...] = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+
+class Counter:
+    """Monotonic counter.
+
+    Attributes:
+        name (str): Metric name.
+        help (str): One-line description.
+        value (int): Current value.
+    """
+
+    def __init__(self, name: str, help: str) -> None:
+        """Initializes a counter at zero.
+
+        Args:
+            name (str): Metric name.
+            help (str): One-line description.
+        """
+        self.name = name
+        self.help = help
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """Increases the counter.
+
+        Args:
+            amount (int): Value to add.
+        """
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """Histogram of observed values with fixed bucket upper bounds.
+
+    Attributes:
+        name (str): Metric name.
+        help (str): One-line description.
+        buckets (Tuple[float, ...]): Upper bounds of the buckets, ascending.
+        counts (List[int]): Number of observations per bucket, plus one for +Inf.
+        sum (float): Sum of all observations.
+        count (int): Number of observations.
+    """
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """Initializes an empty histogram.
+
+        Args:
+            name (str): Metric name.
+            help (str): One-line description.
+            buckets (Sequence[float]): Upper bounds of the buckets, ascending.
+        """
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Records one observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Calculates cumulative bucket counts.
+
+        Returns:
+            List[Tuple[str, int]]: Pairs of an upper bound label and the number of observations up to it.
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return result
+
+
+class MetricsRegistry:
+    """Opt-in registry of counters and latency histograms for model operations.
+
+    Operations are registered with ``instrument`` but left untouched until
+    ``enable`` swaps them for timed wrappers; ``disable`` puts the original
+    methods back. While metrics are disabled there is no wrapper at all, so the
+    overhead is zero.
+
+    For every instrumented operation ``<name>`` the registry keeps
+    ``<name>_total`` (calls), ``<name>_failures_total`` (calls that returned a
+    failure or raised) and ``<name>_seconds`` (latency histogram).
+
+    Attributes:
+        counters (Dict[str, Counter]): Counters by name.
+        histograms (Dict[str, Histogram]): Histograms by name.
+        enabled (bool): Whether the timed wrappers are installed.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty, disabled registry."""
+        self.counters: Dict[str, Counter] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.enabled = False
+        self._started: Optional[float] = None
+        self._instruments: List[Tuple[type, str, str, Callable[[Any], bool]]] = []
+        self._originals: Dict[Tuple[type, str], Callable] = {}
+
+    def counter(self, name: str, help: str) -> Counter:
+        """Returns the counter with the given name, creating it if needed.
+
+        Args:
+            name (str): Metric name.
+            help (str): One-line description.
+
+        Returns:
+            Counter: The counter.
+        """
+        if name not in self.counters:
+            self.counters[name] = Counter(name, help)
+        return self.counters[name]
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        """Returns the histogram with the given name, creating it if needed.
+
+        Args:
+            name (str): Metric name.
+            help (str): One-line description.
+            buckets (Sequence[float]): Upper bounds of the buckets, ascending.
+
+        Returns:
+            Histogram: The histogram.
+        """
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(name, help, buckets)
+        return self.histograms[name]
+
+    def instrument(self, cls: type, method: str, name: str,
+                   failed: Callable[[Any], bool] = lambda result: result is False) -> None:
+        """Registers a method to be timed while metrics are enabled.
+
+        Args:
+            cls (type): Class that defines the method.
+            method (str): Name of the method.
+            name (str): Prefix of the metric names.
+            failed (Callable[[Any], bool]): Tells whether a return value means failure.
+        """
+        self._instruments.append((cls, method, name, failed))
+        if self.enabled:
+            self._wrap(cls, method, name, failed)
+
+    def _wrap(self, cls: type, method: str, name: str, failed: Callable[[Any], bool]) -> None:
+        """Replaces a method with a wrapper that counts and times its calls."""
+        original = cls.__dict__[method]
+        calls = self.counter(f"{name}_total", f"Calls of {cls.__name__}.{method}")
+        failures = self.counter(f"{name}_failures_total", f"Failed calls of {cls.__name__}.{method}")
+        latency = self.histogram(f"{name}_seconds", f"Latency of {cls.__name__}.{method} in seconds")
+        clock = time.perf_counter
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                result = original(*args, **kwargs)
+            except BaseException:
+                latency.observe(clock() - start)
+                calls.inc()
+                failures.inc()
+                raise
+            latency.observe(clock() - start)
+            calls.inc()
+            if failed(result):
+                failures.inc()
+            return result
+
+        timed.__wrapped__ = original
+        timed.__name__ = original.__name__
+        timed.__doc__ = original.__doc__
+        self._originals[(cls, method)] = original
+        setattr(cls, method, timed)
+
+    def enable(self) -> None:
+        """Installs the timed wrappers around every registered method."""
+        if self.enabled:
+            return
+        for cls, method, name, failed in self._instruments:
+            self._wrap(cls, method, name, failed)
+        self.enabled = True
+        self._started = time.time()
+
+    def disable(self) -> None:
+        """Restores the original methods."""
+        for (cls, method), original in self._originals.items():
+            setattr(cls, method, original)
+        self._originals.clear()
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Drops every collected value."""
+        self.counters.clear()
+        self.histograms.clear()
+        self._started = time.time() if self.enabled else None
+        if self.enabled:
+            self.disable()
+            self.enable()
+
+    def to_prometheus(self) -> str:
+        """Renders all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The text snapshot.
+        """
+        lines = []
+        for counter in self.counters.values():
+            lines.append(f"# HELP {counter.name} {counter.help}")
+            lines.append(f"# TYPE {counter.name} counter")
+            lines.append(f"{counter.name} {counter.value}")
+        for histogram in self.histograms.values():
+            lines.append(f"# HELP {histogram.name} {histogram.help}")
+            lines.append(f"# TYPE {histogram.name} histogram")
+            for bound, count in histogram.cumulative():
+                lines.append(f'{histogram.name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f"{histogram.name}_sum {histogram.sum!r}")
+            lines.append(f"{histogram.name}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts all metrics to plain data.
+
+        Returns:
+            Dict[str, Any]: Counter values and histogram summaries with per-second rates.
+        """
+        elapsed = time.time() - self._started if self._started is not None else 0.0
+        return {
+            "elapsed_seconds": elapsed,
+            "counters": {name: counter.value for name, counter in self.counters.items()},
+            "histograms": {
+                name: {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+                    "per_second": histogram.count / elapsed if elapsed else 0.0,
+                    "buckets": dict(histogram.cumulative()),
+                }
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+    def save(self, filename: str) -> None:
+        """Writes a snapshot of all metrics to a file.
+
+        Files ending in ``.json`` get a JSON snapshot, anything else gets Prometheus text.
+
+        Args:
+            filename (str): Path to the output file.
+        """
+        with open(filename, "w") as f:
+            if filename.endswith(".json"):
+                json.dump(self.to_dict(), f, indent=4)
+            else:
+                f.write(self.to_prometheus())
+
+
+registry = MetricsRegistry()
+
+registry.instrument(Port, "load_container", "port_load_container")
+registry.instrument(Port, "unload_container", "port_unload_container")
+registry.instrument(Ship, "load", "ship_load")
+registry.instrument(Ship, "unload", "ship_unload")
+registry.instrument(Ship, "sail_to", "ship_sail")
+registry.instrument(Ship, "re_fuel", "ship_refuel")
+registry.instrument(LoadCommand, "execute", "command_load")
+registry.instrument(UnloadCommand, "execute", "command_unload")
+registry.instrument(SailCommand, "execute", "command_sail")
+registry.instrument(RefuelCommand, "execute", "command_refuel")
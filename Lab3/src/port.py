@@ -1,7 +1,21 @@
 import json
 import math
-from typing import List, Dict, Any
-from containers import Container
+from typing import List, Dict, Any, Iterable, Mapping, Optional, Tuple, ValuesView
+from src.berths import BerthScheduler
+from src.containers import Container
+from src.fragments import FragmentCache
+from src.totals import ContainerTotals
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat_a: float, lon_a: float, lat_b: float, lon_b: float) -> float:
+    """Calculates the great-circle distance between two points in kilometers."""
+    phi_a, phi_b = math.radians(lat_a), math.radians(lat_b)
+    h = (math.sin((phi_b - phi_a) / 2) ** 2
+         + math.cos(phi_a) * math.cos(phi_b) * math.sin(math.radians(lon_b - lon_a) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, h)))
+
 
 class Ship:
     """
@@ -10,6 +24,8 @@ class Ship:
     This class may be extended to include more functionality as needed.
     """
 
+    __slots__ = ("ship_id",)
+
     def __init__(self, ship_id: str):
         """
         Initialize a Ship object.
@@ -42,6 +58,14 @@ class Ship:
         return Ship(data['ship_id'])
 
 
+def _container_state(container: Container) -> tuple:
+    return container.__class__, container.id, container.weight
+
+
+def _ship_state(ship: Ship) -> tuple:
+    return ship.__class__, ship.ship_id
+
+
 class Port:
     """
     Represents a port with geographical coordinates, container, and ship management capabilities.
@@ -59,14 +83,153 @@ class Port:
         self.port_id = port_id
         self.latitude = latitude
         self.longitude = longitude
-        self.containers: List[Container] = []
-        self.ships: List[Ship] = []
+        self._containers: Dict[str, Container] = {}
+        self._totals = ContainerTotals()
+        self._ships: Dict[str, Ship] = {}
         self.history: List[Ship] = []
+        self.journal = None
+        self.berths: Optional[BerthScheduler] = None
+        self._container_fragments = FragmentCache(_container_state)
+        self._ship_fragments = FragmentCache(_ship_state)
+        self._history_fragments = FragmentCache(_ship_state)
+
+    @property
+    def ships(self) -> Tuple[Ship, ...]:
+        """
+        The ships docked at the port, in the order they docked.
+
+        Docked ships are indexed by ID, so docking and undocking take constant
+        time. The tuple is read-only: ships dock and leave through
+        ``incoming_ship`` and ``outgoing_ship``, or are all replaced by assigning
+        to ``ships``.
+
+        Returns:
+            Tuple[Ship, ...]: The docked ships.
+        """
+        return tuple(self._ships.values())
+
+    @ships.setter
+    def ships(self, ships: Iterable[Ship]) -> None:
+        """
+        Replace the docked ships.
+
+        Args:
+            ships (Iterable[Ship]): The ships docked at the port.
+        """
+        self._ships = {ship.ship_id: ship for ship in ships}
+
+    def is_docked(self, ship: Ship) -> bool:
+        """
+        Check whether a ship is docked at the port.
+
+        Args:
+            ship (Ship): The ship to check.
+
+        Returns:
+            bool: True if a ship with the same ID is docked.
+        """
+        return ship.ship_id in self._ships
+
+    @property
+    def containers(self) -> ValuesView[Container]:
+        """
+        Read-only view of the containers in the port, in the order they were loaded.
+
+        Returns:
+            ValuesView[Container]: The containers currently stored in the port.
+        """
+        return self._containers.values()
+
+    @property
+    def total_weight(self) -> float:
+        """
+        Total weight of the containers in the port, kept up to date on every load and unload.
+
+        Returns:
+            float: The total weight.
+        """
+        return self._totals.weight
+
+    @property
+    def total_consumption(self) -> float:
+        """
+        Total fuel consumption of the containers in the port, kept up to date on every load and unload.
+
+        Returns:
+            float: The sum of ``consumption()`` of the containers.
+        """
+        return self._totals.consumption
+
+    @property
+    def count_by_type(self) -> Mapping[str, int]:
+        """
+        Number of containers in the port per container type.
+
+        Returns:
+            Mapping[str, int]: Read-only counts by type name, e.g. ``HeavyContainer``.
+        """
+        return self._totals.count_by_type
+
+    @property
+    def weight_by_type(self) -> Mapping[str, float]:
+        """
+        Weight of the containers in the port per container type.
+
+        Returns:
+            Mapping[str, float]: Read-only weights by type name.
+        """
+        return self._totals.weight_by_type
+
+    def _store(self, container: Container) -> bool:
+        """
+        Store a container and count it in the totals, unless its ID is already in the port.
+
+        Args:
+            container (Container): The container to store.
+
+        Returns:
+            bool: True if the container was stored, False if its ID is taken.
+        """
+        if container.id in self._containers:
+            return False
+        self._containers[container.id] = container
+        self._totals.add(container)
+        return True
+
+    def _discard(self, container_id: str) -> Optional[Container]:
+        """
+        Remove a container and count it out of the totals, without any checks.
+
+        Args:
+            container_id (str): The ID of the container.
+
+        Returns:
+            Optional[Container]: The removed container, or None if it was not in the port.
+        """
+        container = self._containers.pop(container_id, None)
+        if container is not None:
+            self._totals.remove(container)
+        return container
+
+    def get_container(self, container_id: str) -> Optional[Container]:
+        """
+        Find a container in the port by its ID.
+
+        Args:
+            container_id (str): The ID of the container.
+
+        Returns:
+            Optional[Container]: The container, or None if it is not in the port.
+        """
+        return self._containers.get(container_id)
 
     def load_container(self, container: Container) -> bool:
         """
         Load a container into the port.
 
+        Containers are identified by their ID, so a container whose ID is
+        already stored in the port is rejected.
+
         Args:
             container (Container): The container to be loaded.
 
@@ -77,8 +240,9 @@ class Port:
             print("Cannot load a None container.")
             return False
 
-        if container not in self.containers:
-            self.containers.append(container)
+        if self._store(container):
+            if self.journal is not None:
+                self.journal.record("port_container_loaded", port=self.port_id, container=container.to_dict())
             return True
 
         print(f"Container {container.id} is already in the port.")
@@ -94,49 +258,104 @@ class Port:
         Returns:
             bool: True if the container was successfully unloaded, False otherwise.
         """
-        for container in self.containers:
-            if container.id == container_id:
-                self.containers.remove(container)
-                return True
+        if self._discard(container_id) is not None:
+            if self.journal is not None:
+                self.journal.record("port_container_unloaded", port=self.port_id, container=container_id)
+            return True
 
         print(f"Container with ID {container_id} not found in the port.")
         return False
 
-    def incoming_ship(self, ship: Ship) -> None:
+    def incoming_ship(self, ship: Ship, now: float = 0.0, service_hours: float = 0.0,
+                      deadline: Optional[float] = None, cranes: int = 1) -> bool:
         """
         Register an incoming ship at the port.
 
+        Without a berth scheduler every ship docks at once. With one, the ship
+        docks only if a berth and enough cranes are free; otherwise it waits in
+        the queue of the scheduler until ``outgoing_ship`` frees them.
+
         Args:
             ship (Ship): The ship that is arriving at the port.
+            now (float): The current time in hours, for the berth scheduler.
+            service_hours (float): Expected time at the berth, for the berth scheduler.
+            deadline (Optional[float]): Time the ship should be done by, for the berth scheduler.
+            cranes (int): Cranes the ship needs, for the berth scheduler.
+
+        Returns:
+            bool: True if the ship is docked, False if it waits for a berth.
+        """
+        if ship.ship_id in self._ships:
+            return True
+        if self.berths is not None and not self.berths.request(ship.ship_id, ship, now, service_hours,
+                                                                deadline, cranes):
+            print(f"Ship {ship.ship_id} is waiting for a berth at Port {self.port_id}.")
+            return False
+        self._dock(ship)
+        return True
+
+    def _dock(self, ship: Ship) -> None:
         """
-        self.ships.append(ship)
+        Dock a ship that has a berth.
+
+        Args:
+            ship (Ship): The ship to dock.
+        """
+        self._ships[ship.ship_id] = ship
+        if self.journal is not None:
+            self.journal.record("ship_arrived", port=self.port_id, ship=ship.ship_id)
         print(f"Ship {ship.ship_id} has arrived at Port {self.port_id}.")
 
-    def outgoing_ship(self, ship: Ship) -> None:
+    def outgoing_ship(self, ship: Ship, now: float = 0.0) -> List[Ship]:
         """
         Register an outgoing ship from the port.
 
+        The berth of a docked ship goes to the next waiting ships; a ship still
+        waiting for a berth just leaves the queue.
+
         Args:
             ship (Ship): The ship that is leaving the port.
+            now (float): The current time in hours, for the berth scheduler.
+
+        Returns:
+            List[Ship]: The waiting ships that got the freed berth and are now docked.
         """
-        if ship in self.ships:
-            self.ships.remove(ship)
-            self.history.append(ship)
+        admitted = self.berths.release(ship.ship_id, now) if self.berths is not None else []
+        docked = self._ships.pop(ship.ship_id, None)
+        if docked is not None:
+            self.history.append(docked)
+            if self.journal is not None:
+                self.journal.record("ship_left", port=self.port_id, ship=ship.ship_id)
             print(f"Ship {ship.ship_id} has left Port {self.port_id}.")
-        else:
+        elif not admitted:
             print(f"Ship {ship.ship_id} is not in Port {self.port_id}.")
+        for waiting in admitted:
+            self._dock(waiting)
+        return admitted
 
-    def calculate_distance(self, other_port: 'Port') -> float:
+    def calculate_distance(self, other_port: 'Port', method: str = "planar") -> float:
         """
         Calculate the distance between this port and another port.
 
+        ``planar`` is the Euclidean distance on raw degrees, ``haversine`` is the
+        great-circle distance in kilometers. See ``src.distances`` for computing
+        many distances at once.
+
         Args:
             other_port (Port): The other port to calculate the distance to.
+            method (str): ``planar`` or ``haversine``. Defaults to ``planar``.
 
         Returns:
             float: The calculated distance between the two ports.
+
+        Raises:
+            ValueError: If the method is unknown.
         """
-        return math.sqrt((self.latitude - other_port.latitude) ** 2 + (self.longitude - other_port.longitude) ** 2)
+        if method == "planar":
+            return math.sqrt((self.latitude - other_port.latitude) ** 2 + (self.longitude - other_port.longitude) ** 2)
+        if method == "haversine":
+            return haversine_km(self.latitude, self.longitude, other_port.latitude, other_port.longitude)
+        raise ValueError(f"Unknown distance method: {method}")
 
     def sail_to(self, destination_port: 'Port') -> None:
         """
@@ -151,6 +370,9 @@ class Port:
         """
         Convert the Port instance to a dictionary representation.
 
+        The dicts of containers and ships that have not changed since the
+        previous call are reused, so they must be treated as read-only.
+
         Returns:
             Dict: A dictionary containing the port's attributes.
         """
@@ -158,11 +380,50 @@ class Port:
             "port_id": self.port_id,
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "containers": [container.to_dict() for container in self.containers],
-            "ships": [ship.to_dict() for ship in self.ships],
-            "history": [ship.to_dict() for ship in self.history],
+            "containers": self._container_fragments.dicts(self.containers),
+            "ships": self._ship_fragments.dicts(self._ships.values()),
+            "history": self._history_fragments.dicts(self.history),
         }
 
+    def invalidate_cache(self) -> None:
+        """
+        Forget the cached serialized containers and ships.
+
+        Containers and ships are encoded again when their type, ID or weight
+        changes; call this after any other change to what they serialize.
+        """
+        self._container_fragments.invalidate()
+        self._ship_fragments.invalidate()
+        self._history_fragments.invalidate()
+
+    def to_json(self, indent: int = 4) -> str:
+        """
+        Encode the port as JSON text, the same as ``json.dumps(self.to_dict(), indent=indent)``.
+
+        Only containers and ships that changed since the previous call are
+        encoded again; the text of the others comes from the cache.
+
+        Args:
+            indent (int): Spaces per nesting level.
+
+        Returns:
+            str: The JSON text.
+        """
+        pad = " " * indent
+        parts = [f'{{\n{pad}"port_id": {json.dumps(self.port_id)},\n'
+                 f'{pad}"latitude": {json.dumps(self.latitude)},\n'
+                 f'{pad}"longitude": {json.dumps(self.longitude)}']
+        for key, cache, objects in (("containers", self._container_fragments, self.containers),
+                                    ("ships", self._ship_fragments, self._ships.values()),
+                                    ("history", self._history_fragments, self.history)):
+            items = cache.json_items(objects, indent, 2)
+            if items:
+                parts.append(f',\n{pad}"{key}": [\n{pad * 2}' + f',\n{pad * 2}'.join(items) + f'\n{pad}]')
+            else:
+                parts.append(f',\n{pad}"{key}": []')
+        parts.append("\n}")
+        return "".join(parts)
+
     @staticmethod
     def from_dict(data: Dict) -> 'Port':
         """
@@ -173,19 +434,31 @@ class Port:
 
         Returns:
             Port: A new Port instance populated with data from the dictionary.
+
+        Raises:
+            ValueError: If two containers have the same ID.
         """
         port = Port(data['port_id'], data['latitude'], data['longitude'])
+        for item in data.get('containers', []):
+            if not port._store(Container.from_dict(item)):
+                raise ValueError(f"Duplicate container ID: {item['id']}")
+        port.ships = [Ship.from_dict(item) for item in data.get('ships', [])]
+        port.history = [Ship.from_dict(item) for item in data.get('history', [])]
         return port
 
     def save_to_json(self, filename: str) -> None:
         """
         Save the port's data to a JSON file.
 
+        The file is the same as ``json.dump(self.to_dict(), f, indent=4)`` writes,
+        but only containers and ships that changed since the previous save are
+        encoded again.
+
         Args:
             filename (str): The name of the file where the port's data will be saved.
         """
         with open(filename, 'w') as f:
-            json.dump(self.to_dict(), f, indent=4)
+            f.write(self.to_json(indent=4))
 
     @staticmethod
     def load_from_json(filename: str) -> 'Port':
@@ -0,0 +1,92 @@
+import json
+import re
+from typing import Any, Dict, Iterator, List
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def load_records(filename: str) -> List[Dict[str, Any]]:
+    """Loads every record of an input file into memory at once.
+
+    Args:
+        filename (str): Path to a JSON file holding a list of records.
+
+    Returns:
+        List[Dict[str, Any]]: All records of the file.
+    """
+    with open(filename) as f:
+        return json.load(f)
+
+
+def iter_records(filename: str, chunk_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+    """Lazily yields the records of a top-level JSON array one by one.
+
+    The file is read in chunks of ``chunk_size`` characters and only the record
+    that is currently being decoded is kept in memory, so peak memory does not
+    depend on the size of the file.
+
+    Args:
+        filename (str): Path to a JSON file holding a list of records.
+        chunk_size (int): Number of characters read from the file at once.
+
+    Yields:
+        Dict[str, Any]: The next record of the array.
+
+    Raises:
+        json.JSONDecodeError: If the file is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename) as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_whitespace() -> None:
+            nonlocal pos
+            while True:
+                pos = _WHITESPACE.match(buffer, pos).end()
+                if pos < len(buffer) or not fill():
+                    return
+
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] != "[":
+            raise json.JSONDecodeError("Expecting '['", buffer, pos)
+        pos += 1
+
+        first = True
+        while True:
+            skip_whitespace()
+            if pos >= len(buffer):
+                raise json.JSONDecodeError("Unterminated array", buffer, pos)
+            if buffer[pos] == "]":
+                return
+            if not first:
+                if buffer[pos] != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                pos += 1
+                skip_whitespace()
+            first = False
+
+            while True:
+                try:
+                    record, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof or not fill():
+                        raise
+                    continue
+                # A value that ends exactly at the end of the buffer may have been cut in half.
+                if end == len(buffer) and not eof and fill():
+                    continue
+                break
+            pos = end
+            yield record
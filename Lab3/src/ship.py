@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
-from containers import Container
-from typing import List, Dict
+from src.containers import Container
+from typing import List, Dict, Mapping, Optional, Type, ValuesView
 from src.item import Item
+from src.totals import ContainerTotals
 
 
 class IShip(ABC):
     """Interface for ships."""
 
+    __slots__ = ()
+
     @abstractmethod
     def sail_to(self, port: 'Port') -> bool:
         """Moves the ship to a specified port."""
@@ -36,6 +39,9 @@ class IShip(ABC):
 class Ship(IShip):
     """Abstract class for various types of ships."""
 
+    __slots__ = ("name", "max_weight", "fuel_capacity", "current_weight", "_containers", "_totals", "journal",
+                 "voyages")
+
     def __init__(self, name: str, max_weight: float, fuel_capacity: float):
         """
         Initializes a Ship object.
@@ -49,42 +55,86 @@ class Ship(IShip):
         self.max_weight = max_weight
         self.fuel_capacity = fuel_capacity
         self.current_weight = 0
-        self.containers: List[Container] = []
+        self._containers: Dict[str, Container] = {}
+        self._totals = ContainerTotals()
+        self.journal = None
+        self.voyages = None
+
+    @property
+    def containers(self) -> ValuesView[Container]:
+        """Read-only view of the containers on the ship, in loading order."""
+        return self._containers.values()
+
+    @property
+    def total_weight(self) -> float:
+        """Total weight of the containers on the ship, same as ``current_weight``."""
+        return self.current_weight
+
+    @property
+    def total_consumption(self) -> float:
+        """Total fuel consumption of the containers on the ship, kept up to date on every load and unload."""
+        return self._totals.consumption
+
+    @property
+    def count_by_type(self) -> Mapping[str, int]:
+        """Read-only number of containers on the ship per type name."""
+        return self._totals.count_by_type
+
+    @property
+    def weight_by_type(self) -> Mapping[str, float]:
+        """Read-only weight of the containers on the ship per type name."""
+        return self._totals.weight_by_type
+
+    def get_container(self, container_id: str) -> Optional[Container]:
+        """Returns the container with the given ID, or None if it is not on the ship."""
+        return self._containers.get(container_id)
 
     def sail_to(self, port: 'Port') -> bool:
         """Sails the ship to a specified port."""
         # Logic for sailing the ship to a port goes here
-        pass
+        if self.journal is not None:
+            self.journal.record("ship_sailed", ship=self.name, port=port.port_id)
 
     def re_fuel(self, amount: float) -> None:
         """Refuels the ship with the specified amount of fuel."""
         # Logic for refueling the ship goes here
-        pass
+        if self.journal is not None:
+            self.journal.record("ship_refueled", ship=self.name, amount=amount)
 
     def load(self, container: Container) -> bool:
         """Loads a container onto the ship, checking weight limits."""
+        if container.id in self._containers:
+            return False
         if self.current_weight + container.weight <= self.max_weight:
-            self.containers.append(container)
+            self._containers[container.id] = container
             self.current_weight += container.weight
+            self._totals.add(container)
+            if self.journal is not None:
+                self.journal.record("ship_container_loaded", ship=self.name, container=container.to_dict())
             return True
         return False
 
     def unload(self, container: Container) -> bool:
         """Unloads a container from the ship."""
-        if container in self.containers:
-            self.containers.remove(container)
+        if self._containers.get(container.id) is container:
+            del self._containers[container.id]
             self.current_weight -= container.weight
+            self._totals.remove(container)
+            if self.journal is not None:
+                self.journal.record("ship_container_unloaded", ship=self.name, container=container.id)
             return True
         return False
 
     def get_current_containers(self) -> List[Container]:
         """Returns the list of containers currently on the ship."""
-        return self.containers
+        return list(self._containers.values())
 
 
 class LightWeightShip(Ship):
     """Represents a lightweight ship with smaller capacity."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initializes a lightweight ship with predefined attributes."""
         super().__init__(name="Lightweight Ship", max_weight=1000, fuel_capacity=500)
@@ -93,6 +143,8 @@ class LightWeightShip(Ship):
 class MediumShip(Ship):
     """Represents a medium-sized ship with moderate capacity."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initializes a medium ship with predefined attributes."""
         super().__init__(name="Medium Ship", max_weight=2000, fuel_capacity=1000)
@@ -101,11 +153,41 @@ class MediumShip(Ship):
 class HeavyShip(Ship):
     """Represents a heavy ship with large capacity."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initializes a heavy ship with predefined attributes."""
         super().__init__(name="Heavy Ship", max_weight=3000, fuel_capacity=1500)
 
 
+# Ship classes by the type names accepted by ``ShipBuilder.set_ship_type``.
+SHIP_TYPES: Dict[str, Type[Ship]] = {
+    "lightweight": LightWeightShip,
+    "medium": MediumShip,
+    "heavy": HeavyShip,
+}
+# Ship classes by class name, for restoring saved ships.
+SHIP_CLASSES: Dict[str, Type[Ship]] = {cls.__name__: cls for cls in (Ship, LightWeightShip, MediumShip, HeavyShip)}
+
+
+def register_ship_type(ship_type: str, cls: Type[Ship]) -> Type[Ship]:
+    """
+    Make a ship class available to ``ShipBuilder`` under a type name.
+
+    The class must be constructible without arguments, like the built-in ship types.
+
+    Args:
+        ship_type (str): The type name, e.g. "tanker".
+        cls (Type[Ship]): The ship class.
+
+    Returns:
+        Type[Ship]: The class itself.
+    """
+    SHIP_TYPES[ship_type] = cls
+    SHIP_CLASSES[cls.__name__] = cls
+    return cls
+
+
 class ShipBuilder:
     """Builder class for creating ships."""
 
@@ -118,17 +200,29 @@ class ShipBuilder:
         Sets the type of ship to build.
 
         Args:
-            ship_type (str): The type of ship to build ("lightweight", "medium", or "heavy").
+            ship_type (str): The type of ship to build ("lightweight", "medium", "heavy" or a type
+                added with ``register_ship_type``). An unknown type leaves the builder without a ship.
+
+        Returns:
+            ShipBuilder: The builder instance for method chaining.
+        """
+        cls = SHIP_TYPES.get(ship_type)
+        if cls is not None:
+            self.ship = cls()
+        return self
+
+    def set_name(self, name: str) -> 'ShipBuilder':
+        """
+        Sets the name the ship is identified by.
+
+        Args:
+            name (str): The name of the ship.
 
         Returns:
             ShipBuilder: The builder instance for method chaining.
         """
-        if ship_type == "lightweight":
-            self.ship = LightWeightShip()
-        elif ship_type == "medium":
-            self.ship = MediumShip()
-        elif ship_type == "heavy":
-            self.ship = HeavyShip()
+        if self.ship:
+            self.ship.name = name
         return self
 
     def set_max_weight(self, max_weight: float) -> 'ShipBuilder':
@@ -0,0 +1,214 @@
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from src.commands import Command, LoadCommand, UnloadCommand, SailCommand, RefuelCommand
+from src.port import Port, Ship as DockedShip
+from src.ship import Ship
+
+
+class Simulation:
+    """Discrete-event engine driven by a priority-queue clock.
+
+    Events are (time, sequence, action, arguments) entries of a binary heap, so
+    scheduling and taking the next event cost O(log n). Events at the same time
+    run in the order they were scheduled.
+
+    Attributes:
+        now (float): Current simulated time in hours.
+        processed (int): Number of events run so far.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty simulation at time zero."""
+        self.now = 0.0
+        self.processed = 0
+        self._queue: List[Tuple[float, int, Callable[..., Any], Tuple[Any, ...]]] = []
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        """Returns the number of pending events."""
+        return len(self._queue)
+
+    def schedule(self, delay: float, action: Callable[..., Any], *args: Any) -> None:
+        """Runs ``action(*args)`` after ``delay`` hours of simulated time.
+
+        Args:
+            delay (float): Hours from now.
+            action (Callable[..., Any]): The function to call.
+            *args (Any): Arguments for the function.
+
+        Raises:
+            ValueError: If the delay is negative.
+        """
+        if delay < 0:
+            raise ValueError("Events cannot be scheduled in the past")
+        heapq.heappush(self._queue, (self.now + delay, next(self._sequence), action, args))
+
+    def run(self, until: Optional[float] = None, max_events: Optional[int] = None) -> int:
+        """Runs events in time order.
+
+        Args:
+            until (Optional[float], optional): Stops before the first event later than this time.
+            max_events (Optional[int], optional): Stops after this many events.
+
+        Returns:
+            int: The number of events run by this call.
+        """
+        queue = self._queue
+        pop = heapq.heappop
+        processed = 0
+        while queue and (max_events is None or processed < max_events):
+            if until is not None and queue[0][0] > until:
+                self.now = until
+                break
+            self.now, _, action, args = pop(queue)
+            action(*args)
+            processed += 1
+        self.processed += processed
+        return processed
+
+
+@dataclass(slots=True)
+class Timing:
+    """How long the operations of a ship take, in hours.
+
+    Attributes:
+        speed_km_per_hour (float): Cruising speed of every ship.
+        handling_hours (float): Time to load or unload one container.
+        refuel_per_hour (float): Fuel units taken on per hour.
+    """
+
+    speed_km_per_hour: float = 35.0
+    handling_hours: float = 0.05
+    refuel_per_hour: float = 5000.0
+
+
+class FleetSimulation(Simulation):
+    """Runs the commands of many ships concurrently in simulated time.
+
+    Every ship works through its own commands in order, one at a time, while all
+    ships progress in parallel on the shared clock. A voyage leaves the origin
+    port with ``Port.outgoing_ship``, lasts the haversine distance divided by the
+    speed and ends with ``Ship.sail_to`` and ``Port.incoming_ship`` at the
+    destination. Loading, unloading and refueling take ``Timing`` hours and then
+    run their command.
+
+    A port with a berth scheduler may have no free berth for an arriving ship;
+    the ship then waits, with the time its next operations at the port will take
+    as its expected service time, and carries on once a departing ship hands it
+    the berth.
+
+    Attributes:
+        timing (Timing): Durations of the operations.
+        succeeded (int): Number of commands that succeeded.
+        failed (int): Number of commands that failed.
+    """
+
+    def __init__(self, timing: Optional[Timing] = None) -> None:
+        """Initializes a fleet simulation.
+
+        Args:
+            timing (Optional[Timing], optional): Durations of the operations. Defaults to ``Timing()``.
+        """
+        super().__init__()
+        self.timing = timing or Timing()
+        self.succeeded = 0
+        self.failed = 0
+        self._pending: Dict[int, Deque[Command]] = {}
+        self._docked: Dict[int, Tuple[Port, DockedShip]] = {}
+        self._waiting: Dict[int, Tuple[Ship, Deque[Command]]] = {}
+        self._durations: Dict[type, Callable[[Any], float]] = {
+            LoadCommand: self._handling,
+            UnloadCommand: self._handling,
+            RefuelCommand: self._refueling,
+        }
+
+    def _handling(self, command: Any) -> float:
+        """Returns the time to move one container."""
+        return self.timing.handling_hours
+
+    def _refueling(self, command: RefuelCommand) -> float:
+        """Returns the time to take on the fuel of a refuel command."""
+        return command.amount / self.timing.refuel_per_hour
+
+    def submit(self, commands: Iterable[Command]) -> 'FleetSimulation':
+        """Queues commands behind the ones their ship already has.
+
+        Args:
+            commands (Iterable[Command]): Compiled commands, in order for every ship.
+
+        Returns:
+            FleetSimulation: The simulation itself, so that ``run`` can be chained.
+        """
+        for command in commands:
+            ship = command.ship
+            queue = self._pending.get(id(ship))
+            if queue is None:
+                queue = self._pending[id(ship)] = deque()
+                self.schedule(0.0, self._next, ship, queue)
+            queue.append(command)
+        return self
+
+    def _next(self, ship: Ship, queue: Deque[Command]) -> None:
+        """Starts the next command of a ship, if it has one."""
+        if not queue:
+            del self._pending[id(ship)]
+            return
+        command = queue.popleft()
+        if isinstance(command, SailCommand):
+            self._depart(ship, queue, command)
+        else:
+            self.schedule(self._durations[type(command)](command), self._finish, ship, queue, command)
+
+    def _finish(self, ship: Ship, queue: Deque[Command], command: Command) -> None:
+        """Runs a command whose time is up and moves on to the next one."""
+        if command.execute():
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self._next(ship, queue)
+
+    def _depart(self, ship: Ship, queue: Deque[Command], command: SailCommand) -> None:
+        """Undocks a ship and schedules its arrival."""
+        if command.port is None or command.destination_port is None:
+            self._finish(ship, queue, command)
+            return
+        docked = self._docked.pop(id(ship), None)
+        if docked is not None:
+            port, record = docked
+            self._berthed(port.outgoing_ship(record, self.now))
+        hours = command.port.calculate_distance(command.destination_port, method="haversine") \
+            / self.timing.speed_km_per_hour
+        self.schedule(hours, self._arrive, ship, queue, command)
+
+    def _arrive(self, ship: Ship, queue: Deque[Command], command: SailCommand) -> None:
+        """Completes a voyage and docks the ship at its destination, or queues it for a berth."""
+        if command.execute():
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        destination = command.destination_port
+        record = DockedShip(ship.name)
+        self._docked[id(ship)] = (destination, record)
+        if destination.incoming_ship(record, self.now, self._service_hours(queue)):
+            self._next(ship, queue)
+        else:
+            self._waiting[id(record)] = (ship, queue)
+
+    def _service_hours(self, queue: Deque[Command]) -> float:
+        """Returns how long the commands of a ship before its next voyage will take."""
+        hours = 0.0
+        for command in queue:
+            if isinstance(command, SailCommand):
+                break
+            hours += self._durations[type(command)](command)
+        return hours
+
+    def _berthed(self, records: List[DockedShip]) -> None:
+        """Resumes the ships that got a berth."""
+        for record in records:
+            waiting = self._waiting.pop(id(record), None)
+            if waiting is not None:
+                self.schedule(0.0, self._next, *waiting)
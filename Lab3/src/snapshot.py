@@ -0,0 +1,233 @@
+import json
+import mmap
+import struct
+from typing import Any, Dict, Iterator, Optional, Union
+from src.containers import Container, CONTAINER_CLASSES
+from src.port import Port, Ship
+from src.totals import ContainerTotals
+
+MAGIC = b"PORTSNAP"
+VERSION = 1
+
+# magic, version, container count, offset of the ID blob, offset and length of the metadata
+HEADER = struct.Struct("<8sIIQQQ")
+# weight bits, ID offset in the blob, ID length, type code, flags
+RECORD = struct.Struct("<qQIBB2x")
+WEIGHT = struct.Struct("<d")
+
+FLAG_INT_WEIGHT = 1
+FLAG_INT_ID = 2
+
+ContainerId = Union[int, str]
+
+
+def save_snapshot(port: Port, filename: str) -> None:
+    """Writes the full state of a port to a binary snapshot file.
+
+    The file starts with a fixed header followed by one fixed-width record per
+    container (type code, weight and the position of its ID), a blob with the
+    UTF-8 encoded IDs and a small JSON block with the coordinates, ships, history
+    and the table of container type names. Integer and float weights and IDs
+    are flagged per record, so loading gives back exactly the saved values.
+
+    Args:
+        port (Port): The port to save.
+        filename (str): Path to the snapshot file.
+    """
+    types: Dict[str, int] = {}
+    records = bytearray()
+    ids = bytearray()
+    for container in port.containers:
+        type_name = container.__class__.__name__
+        code = types.setdefault(type_name, len(types))
+        flags = 0
+        if isinstance(container.weight, int):
+            flags |= FLAG_INT_WEIGHT
+            weight_bits = container.weight
+        else:
+            weight_bits = struct.unpack("<q", WEIGHT.pack(container.weight))[0]
+        if isinstance(container.id, int):
+            flags |= FLAG_INT_ID
+        encoded = str(container.id).encode()
+        records += RECORD.pack(weight_bits, len(ids), len(encoded), code, flags)
+        ids += encoded
+
+    meta = json.dumps({
+        "port_id": port.port_id,
+        "latitude": port.latitude,
+        "longitude": port.longitude,
+        "types": list(types),
+        "ships": [ship.to_dict() for ship in port.ships],
+        "history": [ship.to_dict() for ship in port.history],
+    }).encode()
+
+    count = len(records) // RECORD.size
+    ids_offset = HEADER.size + len(records)
+    meta_offset = ids_offset + len(ids)
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, count, ids_offset, meta_offset, len(meta)))
+        f.write(records)
+        f.write(ids)
+        f.write(meta)
+
+
+class PortSnapshot:
+    """Read-only view of a port snapshot file mapped into memory.
+
+    Opening a snapshot only parses its header and metadata; container records
+    are decoded when they are accessed, so even a very large yard opens almost
+    instantly. Use ``to_port`` to build a regular ``Port`` with every container.
+
+    Attributes:
+        port_id (str): Unique identifier of the port.
+        latitude (float): Latitude coordinate of the port.
+        longitude (float): Longitude coordinate of the port.
+        ships (List[Ship]): Ships docked at the port.
+        history (List[Ship]): Ships that have visited the port.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """Maps a snapshot file into memory and reads its metadata.
+
+        Args:
+            filename (str): Path to the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a port snapshot or has an unsupported version.
+        """
+        with open(filename, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < HEADER.size:
+            self._mm.close()
+            raise ValueError(f"{filename} is not a port snapshot")
+        magic, version, self._count, self._ids_offset, self._meta_offset, meta_length = HEADER.unpack_from(self._mm)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{filename} is not a port snapshot of version {VERSION}")
+
+        meta = json.loads(self._mm[self._meta_offset:self._meta_offset + meta_length])
+        self.port_id = meta["port_id"]
+        self.latitude = meta["latitude"]
+        self.longitude = meta["longitude"]
+        self.ships = [Ship.from_dict(item) for item in meta["ships"]]
+        self.history = [Ship.from_dict(item) for item in meta["history"]]
+        unknown = [name for name in meta["types"] if name not in CONTAINER_CLASSES]
+        if unknown:
+            self._mm.close()
+            raise ValueError(f"Unknown container type {unknown[0]}")
+        self._types = [CONTAINER_CLASSES[name] for name in meta["types"]]
+        self._rows: Optional[Dict[ContainerId, int]] = None
+
+    def __len__(self) -> int:
+        """Returns the number of containers in the snapshot."""
+        return self._count
+
+    def _id(self, row: int) -> ContainerId:
+        """Decodes the container ID stored in a row."""
+        _, offset, length, _, flags = RECORD.unpack_from(self._mm, HEADER.size + row * RECORD.size)
+        start = self._ids_offset + offset
+        value = self._mm[start:start + length].decode()
+        return int(value) if flags & FLAG_INT_ID else value
+
+    def __getitem__(self, row: int) -> Container:
+        """Decodes the container stored in a row.
+
+        Args:
+            row (int): Position of the container in the snapshot.
+
+        Returns:
+            Container: A new container built from the record.
+
+        Raises:
+            IndexError: If the row is out of range.
+        """
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError("snapshot row out of range")
+        weight_bits, offset, length, code, flags = RECORD.unpack_from(self._mm, HEADER.size + row * RECORD.size)
+        start = self._ids_offset + offset
+        container_id = self._mm[start:start + length].decode()
+        if flags & FLAG_INT_ID:
+            container_id = int(container_id)
+        if flags & FLAG_INT_WEIGHT:
+            weight = weight_bits
+        else:
+            weight = WEIGHT.unpack(struct.pack("<q", weight_bits))[0]
+        return self._types[code](container_id, weight)
+
+    def __iter__(self) -> Iterator[Container]:
+        """Decodes the containers one by one in the order they were saved."""
+        records = self._mm[HEADER.size:HEADER.size + self._count * RECORD.size]
+        # The same bytes read as doubles, for the rows whose weight is a float.
+        floats = memoryview(records).cast("d")
+        stride = RECORD.size // WEIGHT.size
+        ids = self._mm[self._ids_offset:self._meta_offset]
+        types = self._types
+        for row, (weight, offset, length, code, flags) in enumerate(RECORD.iter_unpack(records)):
+            container_id = ids[offset:offset + length].decode()
+            if flags & FLAG_INT_ID:
+                container_id = int(container_id)
+            if not flags & FLAG_INT_WEIGHT:
+                weight = floats[row * stride]
+            yield types[code](container_id, weight)
+
+    def get_container(self, container_id: ContainerId) -> Optional[Container]:
+        """Finds a container by its ID.
+
+        The first lookup builds an index of the IDs; the records themselves
+        are still decoded only for the containers that are returned.
+
+        Args:
+            container_id (ContainerId): ID of the container.
+
+        Returns:
+            Optional[Container]: The container, or None if it is not in the snapshot.
+        """
+        if self._rows is None:
+            self._rows = {self._id(row): row for row in range(self._count)}
+        row = self._rows.get(container_id)
+        return None if row is None else self[row]
+
+    def to_port(self) -> Port:
+        """Builds a regular port with every container of the snapshot.
+
+        Returns:
+            Port: A new Port instance equal to the saved one.
+
+        Raises:
+            ValueError: If two containers of the snapshot have the same ID.
+        """
+        port = Port(self.port_id, self.latitude, self.longitude)
+        port._containers = {container.id: container for container in self}
+        if len(port._containers) != self._count:
+            raise ValueError("Duplicate container ID in snapshot")
+        port._totals = ContainerTotals(port._containers.values())
+        port.ships = list(self.ships)
+        port.history = list(self.history)
+        return port
+
+    def close(self) -> None:
+        """Unmaps the snapshot file."""
+        self._mm.close()
+
+    def __enter__(self) -> 'PortSnapshot':
+        """Returns the snapshot itself for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Unmaps the snapshot file when the ``with`` block ends."""
+        self.close()
+
+
+def load_snapshot(filename: str) -> Port:
+    """Loads the full state of a port from a binary snapshot file.
+
+    Args:
+        filename (str): Path to the snapshot file.
+
+    Returns:
+        Port: A new Port instance equal to the saved one.
+    """
+    with PortSnapshot(filename) as snapshot:
+        return snapshot.to_port()
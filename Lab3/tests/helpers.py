@@ -0,0 +1,12 @@
+import contextlib
+import io
+import unittest
+
+
+class QuietTestCase(unittest.TestCase):
+    """Test case that hides what ports, ships and commands print while a test runs."""
+
+    def setUp(self):
+        output = contextlib.redirect_stdout(io.StringIO())
+        output.__enter__()
+        self.addCleanup(output.__exit__, None, None, None)
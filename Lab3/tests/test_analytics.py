@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.analytics import export_analytics, load_analytics, load_table
+from src.columnar import ItemStore, VoyageLog
+from src.commands import SailCommand
+from src.containers import HeavyContainer, LiquidContainer, SmallContainer
+from src.item import HeavyItem, SmallItem
+from src.port import Port
+from src.ship import Ship
+from helpers import QuietTestCase
+
+
+class TestAnalyticsExport(QuietTestCase):
+    def setUp(self):
+        super().setUp()
+        self.odesa = Port("odesa", 46.48, 30.73)
+        self.varna = Port("varna", 43.20, 27.91)
+        self.odesa.load_container(SmallContainer("c1", 100))
+        self.odesa.load_container(HeavyContainer(2, 3500.25))
+        self.varna.load_container(LiquidContainer("c3", 800))
+        self.items = ItemStore.from_items([SmallItem("i1", 1.5, 4, "c1"), HeavyItem("i2", 20.0, 2, "c3")])
+        self.voyages = VoyageLog(capacity=1)
+        self.ship = Ship("s1", 10000, 500)
+        self.ship.load(HeavyContainer("c9", 1000))
+        self.voyages.attach(self.ship)
+        SailCommand(self.ship, self.odesa, "varna", self.varna).execute()
+        SailCommand(self.ship, self.varna, "odesa", self.odesa).execute()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_voyages_are_logged(self):
+        self.assertEqual(list(self.voyages.ships), ["s1", "s1"])
+        self.assertEqual(list(self.voyages.origins), ["odesa", "varna"])
+        distance = self.odesa.calculate_distance(self.varna, method="haversine")
+        self.assertAlmostEqual(self.voyages.distances[0], distance)
+        self.assertAlmostEqual(self.voyages.fuel[1], distance * self.ship.total_consumption)
+
+    def test_parallel_sails_share_the_log(self):
+        log = VoyageLog(capacity=1)
+        commands = []
+        for i in range(400):
+            ship = Ship(f"p{i}", 10000, 500)
+            log.attach(ship)
+            commands.append(SailCommand(ship, self.odesa, "varna", self.varna))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertEqual(sum(pool.map(SailCommand.execute, commands)), 400)
+        self.assertEqual(len(log), 400)
+        self.assertEqual(sorted(log.ships), sorted(f"p{i}" for i in range(400)))
+
+    def test_round_trip(self):
+        for fmt in ("npy", "csv"):
+            directory = os.path.join(self.tmp.name, fmt)
+            manifest = export_analytics(directory, [self.odesa, self.varna], self.items, self.voyages, fmt)
+            self.assertEqual({name: table["rows"] for name, table in manifest["tables"].items()},
+                             {"containers": 3, "items": 2, "voyages": 2})
+            tables = load_analytics(directory)
+            containers = tables["containers"]
+            self.assertEqual(list(containers["container_id"]), ["c1", "2", "c3"])
+            self.assertEqual(list(containers["type"]), ["SmallContainer", "HeavyContainer", "LiquidContainer"])
+            self.assertEqual(list(containers["port_id"]), ["odesa", "odesa", "varna"])
+            np.testing.assert_array_equal(containers["weight"], [100, 3500.25, 800])
+            items = tables["items"]
+            self.assertEqual(list(items["type"]), ["SmallItem", "HeavyItem"])
+            self.assertEqual(items["count"].dtype, np.int64)
+            self.assertEqual(float((items["weight"] * items["count"]).sum()), self.items.total_weight())
+            np.testing.assert_array_equal(tables["voyages"]["fuel"], self.voyages.fuel)
+
+    def test_empty_tables(self):
+        for fmt in ("npy", "csv"):
+            directory = os.path.join(self.tmp.name, fmt)
+            export_analytics(directory, [Port("p", 0.0, 0.0)], fmt=fmt)
+            containers = load_table(directory, "containers")
+            self.assertEqual(len(containers["weight"]), 0)
+            self.assertEqual(containers["weight"].dtype, np.float64)
+        with self.assertRaises(ValueError):
+            export_analytics(self.tmp.name, fmt="parquet")
+
+
+if __name__ == '__main__':
+    unittest.main()
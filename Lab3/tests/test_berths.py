@@ -0,0 +1,134 @@
+import unittest
+from src.berths import BerthScheduler
+from src.commands import compile_commands
+from src.containers import SmallContainer
+from src.port import Port, Ship as DockedShip
+from src.ship import Ship
+from src.simulation import FleetSimulation, Timing
+from helpers import QuietTestCase
+
+
+class TestBerthScheduler(unittest.TestCase):
+    def queue_order(self, policy):
+        berths = BerthScheduler(1, policy=policy)
+        self.assertTrue(berths.request("first", "first", 0.0, service_hours=1.0))
+        berths.request("long", "long", 1.0, service_hours=9.0, deadline=5.0)
+        berths.request("short", "short", 2.0, service_hours=1.0)
+        berths.request("urgent", "urgent", 3.0, service_hours=5.0, deadline=4.0)
+        order = []
+        leaving = "first"
+        for now in (4.0, 5.0, 6.0):
+            admitted = berths.release(leaving, now)
+            order += admitted
+            leaving = admitted[0]
+        return order
+
+    def test_policies(self):
+        self.assertEqual(self.queue_order("fifo"), ["long", "short", "urgent"])
+        self.assertEqual(self.queue_order("sjf"), ["short", "urgent", "long"])
+        self.assertEqual(self.queue_order("edf"), ["urgent", "long", "short"])
+
+    def test_unknown_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            BerthScheduler(policy="random")
+
+    def test_cranes_limit_berthing(self):
+        berths = BerthScheduler(berths=3, cranes=2)
+        self.assertTrue(berths.request("a", "a", 0.0, cranes=2))
+        self.assertFalse(berths.request("b", "b", 0.0))
+        self.assertEqual(berths.release("a", 1.0), ["b"])
+        self.assertEqual(berths.occupied, 1)
+
+    def test_waiting_ship_can_leave_the_queue(self):
+        berths = BerthScheduler(1)
+        berths.request("a", "a", 0.0)
+        berths.request("b", "b", 0.0)
+        berths.request("c", "c", 0.0)
+        self.assertEqual(berths.release("b", 1.0), [])
+        self.assertEqual(berths.release("a", 2.0), ["c"])
+        self.assertEqual(berths.waiting, 0)
+
+    def test_requeued_ship_loses_its_old_place(self):
+        berths = BerthScheduler(1)
+        berths.request("a", "a", 0.0)
+        berths.request("c", "c", 1.0)
+        berths.request("b", "b", 2.0)
+        berths.request("d", "d", 3.0)
+        berths.release("b", 4.0)
+        self.assertFalse(berths.request("b", "b", 5.0))
+        self.assertEqual(berths.release("a", 6.0), ["c"])
+        self.assertEqual(berths.release("c", 7.0), ["d"])
+        self.assertEqual(berths.release("d", 8.0), ["b"])
+        self.assertEqual(berths.waiting, 0)
+
+    def test_stats(self):
+        berths = BerthScheduler(2)
+        berths.request("a", "a", 0.0)
+        berths.request("b", "b", 0.0)
+        berths.request("c", "c", 1.0)
+        berths.release("a", 3.0)
+        berths.release("b", 4.0)
+        stats = berths.stats(8.0)
+        self.assertEqual(stats["served"], 3)
+        self.assertAlmostEqual(stats["mean_wait_hours"], 2.0 / 3)
+        self.assertEqual(stats["max_wait_hours"], 2.0)
+        # Busy berth-hours: 3 + 4 for a and b, 5 for c, out of 2 berths for 8 hours.
+        self.assertAlmostEqual(stats["berth_utilization"], 12.0 / 16)
+
+
+class TestPortBerths(QuietTestCase):
+    def test_ships_are_docked_once(self):
+        port = Port("p1", 0.0, 0.0)
+        self.assertTrue(port.incoming_ship(DockedShip("s1")))
+        self.assertTrue(port.incoming_ship(DockedShip("s1")))
+        self.assertEqual(len(port.ships), 1)
+        port.outgoing_ship(DockedShip("s1"))
+        self.assertEqual(port.ships, ())
+        self.assertEqual([ship.ship_id for ship in port.history], ["s1"])
+
+    def test_docked_ships_cannot_be_changed_in_place(self):
+        port = Port("p1", 0.0, 0.0)
+        with self.assertRaises(AttributeError):
+            port.ships.append(DockedShip("s1"))
+        port.ships = [DockedShip("s1")]
+        self.assertTrue(port.is_docked(DockedShip("s1")))
+
+    def test_waiting_ship_docks_when_a_berth_is_freed(self):
+        port = Port("p1", 0.0, 0.0)
+        port.berths = BerthScheduler(1)
+        first, second = DockedShip("s1"), DockedShip("s2")
+        self.assertTrue(port.incoming_ship(first, 0.0))
+        self.assertFalse(port.incoming_ship(second, 1.0))
+        self.assertFalse(port.is_docked(second))
+        self.assertEqual(port.outgoing_ship(first, 2.0), [second])
+        self.assertEqual(port.ships, (second,))
+
+    def test_simulated_ships_wait_for_berths(self):
+        ports = {"p1": Port("p1", 46.0, 30.0), "p2": Port("p2", 46.1, 30.1)}
+        ports["p2"].berths = BerthScheduler(1)
+        ships = {f"s{i}": Ship(f"s{i}", 3000, 1500) for i in range(3)}
+        containers = {f"c{i}": SmallContainer(f"c{i}", 100) for i in range(3)}
+        records = []
+        for i in range(3):
+            ports["p1"].load_container(containers[f"c{i}"])
+            records += [
+                {"action": "load", "ship_id": f"s{i}", "port_id": "p1", "container_id": f"c{i}"},
+                {"action": "sail", "ship_id": f"s{i}", "port_id": "p1", "destination_port_id": "p2"},
+                {"action": "unload", "ship_id": f"s{i}", "port_id": "p2", "container_id": f"c{i}"},
+                {"action": "sail", "ship_id": f"s{i}", "port_id": "p2", "destination_port_id": "p1"},
+            ]
+        timing = Timing(handling_hours=1.0)
+        simulation = FleetSimulation(timing).submit(compile_commands(records, ports, ships, containers))
+        simulation.run()
+
+        self.assertEqual(simulation.failed, 0)
+        self.assertEqual(sorted(c.id for c in ports["p2"].containers), ["c0", "c1", "c2"])
+        stats = ports["p2"].berths.stats(simulation.now)
+        self.assertEqual(stats["served"], 3)
+        # The ships arrive together and unload one after another.
+        self.assertAlmostEqual(stats["max_wait_hours"], 2.0)
+        self.assertEqual(len(ports["p1"].ships), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import random
+import unittest
+from src.columnar import ContainerTable, ItemStore
+from src.containers import Container, SmallContainer, HeavyContainer, RefrigeratedContainer, LiquidContainer
+from src.item import SmallItem, HeavyItem
+from src.port import Port
+
+
+class TestContainerTable(unittest.TestCase):
+    def setUp(self):
+        self.containers = [
+            SmallContainer("c1", 100),
+            HeavyContainer("c2", 1500),
+            RefrigeratedContainer("c3", 800),
+            LiquidContainer("c4", 1200),
+            HeavyContainer("c5", 2000),
+        ]
+        self.table = ContainerTable(capacity=2)
+        self.table.extend(self.containers[:3])
+        for container in self.containers[3:]:
+            self.table.add(container)
+
+    def test_totals_match_objects(self):
+        self.assertEqual(len(self.table), 5)
+        self.assertAlmostEqual(self.table.total_weight(), sum(c.weight for c in self.containers))
+        self.assertAlmostEqual(self.table.total_consumption(), sum(c.consumption() for c in self.containers))
+
+    def test_per_type_totals(self):
+        self.assertEqual(self.table.count_by_type()["HeavyContainer"], 2)
+        self.assertIsInstance(self.table.count_by_type()["HeavyContainer"], int)
+        self.assertEqual(self.table.weight_by_type()["HeavyContainer"], 3500)
+        self.assertEqual(self.table.consumption_by_type()["LiquidContainer"], 4800)
+
+    def test_rows_are_container_views(self):
+        view = self.table.get("c3")
+        self.assertNotIsInstance(view, Container)
+        self.assertEqual(view.weight, 800)
+        self.assertEqual(view.consumption(), self.containers[2].consumption())
+        view.weight = 1000
+        self.assertEqual(self.table.weight_by_type()["RefrigeratedContainer"], 1000)
+        self.assertIsInstance(view.to_container(), RefrigeratedContainer)
+
+    def test_remove_keeps_views_valid(self):
+        view = self.table.get("c5")
+        self.assertTrue(self.table.remove("c2"))
+        self.assertFalse(self.table.remove("c2"))
+        self.assertNotIn("c2", self.table)
+        self.assertEqual(view.weight, 2000)
+        self.assertEqual(sorted(c.id for c in self.table), ["c1", "c3", "c4", "c5"])
+
+    def test_duplicate_id_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.table.add(SmallContainer("c1", 50))
+        self.assertEqual(len(self.table), 5)
+
+class TestItemStore(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        self.items = [rng.choice((SmallItem, HeavyItem))(i, rng.uniform(1, 50), rng.randint(1, 9), f"c{i % 7}")
+                      for i in range(200)]
+        self.store = ItemStore(capacity=4)
+        self.store.extend(self.items[:150])
+        for item in self.items[150:]:
+            self.store.add(item)
+
+    def expected(self, container_id):
+        return sum(item.get_total_weight() for item in self.items if item.containerID == container_id)
+
+    def check(self):
+        for i in range(8):
+            self.assertAlmostEqual(self.store.container_weight(f"c{i}"), self.expected(f"c{i}"))
+            self.assertEqual({item.ID for item in self.store.contents(f"c{i}")},
+                             {item.ID for item in self.items if item.containerID == f"c{i}"})
+
+    def test_weights_follow_moves_and_removals(self):
+        rng = random.Random(5)
+        for _ in range(300):
+            item = rng.choice(self.items)
+            if rng.random() < 0.2:
+                self.assertTrue(self.store.remove(item.ID))
+                self.items.remove(item)
+            else:
+                self.store.move(item.ID, f"c{rng.randrange(8)}")
+        self.assertEqual(len(self.store), len(self.items))
+        self.check()
+        before = [self.store.container_weight(f"c{i}") for i in range(8)]
+        self.store.recompute()
+        for i, weight in enumerate(before):
+            self.assertAlmostEqual(self.store.container_weight(f"c{i}"), weight)
+
+    def test_rollups(self):
+        self.store.set_count(0, 100)
+        ids = ["c0", "c3", "missing"]
+        self.assertEqual(list(self.store.container_weights(ids)),
+                         [self.store.container_weight(c) for c in ids])
+        self.assertAlmostEqual(self.store.total_weight(), sum(item.get_total_weight() for item in self.items))
+        rollup = self.store.rollup({"a": ["c0", "c1"], "b": ["c2"], "empty": []})
+        self.assertAlmostEqual(rollup["a"], self.expected("c0") + self.expected("c1"))
+        self.assertAlmostEqual(rollup["b"], self.expected("c2"))
+        self.assertEqual(rollup["empty"], 0.0)
+        port = Port("p1", 46.0, 30.0)
+        port.load_container(SmallContainer("c4", 10))
+        port.load_container(HeavyContainer("c5", 3000))
+        self.assertAlmostEqual(self.store.holder_weight(port), self.expected("c4") + self.expected("c5"))
+
+    def test_duplicates_and_unknown_items(self):
+        with self.assertRaises(ValueError):
+            self.store.add(SmallItem(0, 1.0, 1, "c0"))
+        self.assertFalse(self.store.remove("missing"))
+        self.assertFalse(self.store.move("missing", "c0"))
+        self.assertIsNone(self.store.get("missing"))
+        self.assertIs(self.store.get(3), self.items[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
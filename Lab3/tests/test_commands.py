@@ -0,0 +1,78 @@
+import unittest
+from src.commands import Command, LoadCommand, compile_command, compile_commands, run_commands
+from src.containers import HeavyContainer, SmallContainer
+from src.port import Port
+from src.ship import MediumShip
+from helpers import QuietTestCase
+
+
+class TestCompiledCommands(QuietTestCase):
+    def setUp(self):
+        super().setUp()
+        self.ports = {"p1": Port("p1", 46.0, 30.0), "p2": Port("p2", 47.0, 31.0)}
+        self.ship = MediumShip()
+        self.ships = {"s1": self.ship}
+        self.containers = {
+            "c1": SmallContainer("c1", 100),
+            "c2": HeavyContainer("c2", 1500),
+            "c3": HeavyContainer("c3", 1500),
+        }
+        for container in self.containers.values():
+            self.ports["p1"].load_container(container)
+
+    def compile(self, *records):
+        return compile_commands(records, self.ports, self.ships, self.containers)
+
+    def test_ids_are_resolved_once(self):
+        command = compile_command({"action": "load", "ship_id": "s1", "port_id": "p1", "container_id": "c1"},
+                                  self.ports, self.ships, self.containers)
+        self.assertIsInstance(command, LoadCommand)
+        self.assertIs(command.ship, self.ship)
+        self.assertIs(command.port, self.ports["p1"])
+        self.assertIs(command.container, self.containers["c1"])
+
+    def test_unknown_ship_or_action_is_dropped(self):
+        commands = self.compile(
+            {"action": "load", "ship_id": "nope", "port_id": "p1", "container_id": "c1"},
+            {"action": "teleport", "ship_id": "s1"},
+        )
+        self.assertEqual(commands, [])
+
+    def test_load_and_unload(self):
+        succeeded = run_commands(self.compile(
+            {"action": "load", "ship_id": "s1", "port_id": "p1", "container_id": "c1"},
+            {"action": "load", "ship_id": "s1", "port_id": "p1", "container_id": "c2"},
+            {"action": "load", "ship_id": "s1", "port_id": "p1", "container_id": "c3"},
+            {"action": "unload", "ship_id": "s1", "port_id": "p2", "container_id": "c1"},
+        ))
+        self.assertEqual(succeeded, 3)
+        self.assertEqual([c.id for c in self.ship.containers], ["c2"])
+        self.assertEqual(self.ship.current_weight, 1500)
+        self.assertEqual([c.id for c in self.ports["p1"].containers], ["c3"])
+        self.assertEqual([c.id for c in self.ports["p2"].containers], ["c1"])
+
+    def test_load_from_wrong_port_fails(self):
+        succeeded = run_commands(self.compile(
+            {"action": "load", "ship_id": "s1", "port_id": "p2", "container_id": "c1"},
+        ))
+        self.assertEqual(succeeded, 0)
+        self.assertEqual(len(self.ship.containers), 0)
+
+    def test_rejected_unload_keeps_container_on_ship(self):
+        self.ports["p2"].load_container(SmallContainer("c1", 5))
+        succeeded = run_commands(self.compile(
+            {"action": "load", "ship_id": "s1", "port_id": "p1", "container_id": "c1"},
+            {"action": "unload", "ship_id": "s1", "port_id": "p2", "container_id": "c1"},
+        ))
+        self.assertEqual(succeeded, 1)
+        self.assertIs(self.ship.get_container("c1"), self.containers["c1"])
+        self.assertEqual(self.ship.current_weight, 100)
+        self.assertEqual(self.ports["p2"].get_container("c1").weight, 5)
+
+    def test_command_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Command()
+
+
+if __name__ == "__main__":
+    unittest.main()
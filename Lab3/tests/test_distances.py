@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from src.distances import coordinates, distance_matrix, distances_from, nearest
+from src.port import Port
+
+
+class TestBatchDistances(unittest.TestCase):
+    def setUp(self):
+        self.ports = [
+            Port("odesa", 46.4825, 30.7326),
+            Port("istanbul", 41.0082, 28.9784),
+            Port("varna", 43.2141, 27.9147),
+            Port("constanta", 44.1598, 28.6348),
+        ]
+
+    def test_matches_scalar_distance(self):
+        for method in ("planar", "haversine"):
+            matrix = distance_matrix(self.ports, method=method)
+            self.assertEqual(matrix.shape, (4, 4))
+            for i, a in enumerate(self.ports):
+                for j, b in enumerate(self.ports):
+                    self.assertAlmostEqual(matrix[i, j], a.calculate_distance(b, method), places=6)
+
+    def test_haversine_is_in_kilometers(self):
+        odesa, istanbul = self.ports[:2]
+        self.assertAlmostEqual(odesa.calculate_distance(istanbul, "haversine"), 626, delta=5)
+
+    def test_one_to_many_accepts_coordinates(self):
+        row = distances_from(self.ports[0], coordinates(self.ports[1:]), "haversine")
+        np.testing.assert_allclose(row, distance_matrix(self.ports[:1], self.ports[1:], "haversine")[0])
+
+    def test_nearest(self):
+        index, cost = nearest(self.ports[0], self.ports[1:], "haversine")
+        self.assertEqual(self.ports[1:][index].port_id, "constanta")
+        index, _ = nearest(self.ports[0], self.ports[1:], "haversine", cost_per_unit=np.array([1.0, 1.0, 10.0]))
+        self.assertEqual(self.ports[1:][index].port_id, "varna")
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            distance_matrix(self.ports, method="manhattan")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import unittest
+from src.containers import HeavyContainer, LiquidContainer, RefrigeratedContainer, SmallContainer
+from src.export import export_ports, load_port, load_ports, read_manifest
+from src.port import Port, Ship
+
+KINDS = (SmallContainer, HeavyContainer, RefrigeratedContainer, LiquidContainer)
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.ports = []
+        for p in range(7):
+            port = Port(f"p{p}", 40.0 + p, -p * 1.5)
+            for i in range(p * 3):
+                port._store(KINDS[i % 4](f"c{p}-{i}", 100.5 * i))
+            port.ships = [Ship(f"s{p}")]
+            port.history = [Ship(f"h{p}")]
+            self.ports.append(port)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "export")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        manifest = export_ports(self.ports, self.directory, ports_per_shard=3, max_workers=2)
+        self.assertEqual(len(manifest["shards"]), 3)
+        self.assertEqual(read_manifest(self.directory), manifest)
+        loaded = load_ports(self.directory, max_workers=2)
+        self.assertEqual(list(loaded), [port.port_id for port in self.ports])
+        for port in self.ports:
+            self.assertEqual(loaded[port.port_id].to_dict(), port.to_dict())
+
+    def test_shards_are_json_and_ports_load_alone(self):
+        manifest = export_ports(self.ports, self.directory, ports_per_shard=4)
+        for name in manifest["shards"]:
+            with open(os.path.join(self.directory, name)) as f:
+                self.assertIsInstance(json.load(f), list)
+        self.assertEqual(load_port(self.directory, "p5").to_dict(), self.ports[5].to_dict())
+        with self.assertRaises(KeyError):
+            load_port(self.directory, "missing", manifest)
+
+    def test_ports_are_found_through_the_index(self):
+        manifest = export_ports(self.ports, self.directory, ports_per_shard=4)
+        manifest["ports"] = None
+        self.assertEqual(load_port(self.directory, "p5", manifest).to_dict(), self.ports[5].to_dict())
+        self.assertEqual(set(read_manifest(self.directory)["index"]), {port.port_id for port in self.ports})
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            export_ports(self.ports + [Port("p0", 0.0, 0.0)], self.directory)
+        with self.assertRaises(ValueError):
+            export_ports(self.ports, self.directory, ports_per_shard=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
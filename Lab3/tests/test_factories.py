@@ -0,0 +1,84 @@
+import unittest
+from src.containers import (Container, CONTAINER_CLASSES, CONTAINER_KINDS, HeavyContainer, LiquidContainer,
+                            container_factory, register_container)
+from src.factories import build_containers, build_items, build_ships, containers_from_columns, items_from_columns
+from src.item import ItemFactory, HeavyItem, SmallItem, LiquidItem
+from src.ship import SHIP_TYPES, ShipBuilder, MediumShip, register_ship_type
+
+
+class TestFactories(unittest.TestCase):
+    def test_bulk_containers_match_the_factory(self):
+        records = [{"id": i, "weight": weight, "special": special}
+                   for i, (weight, special) in enumerate([(100, None), (300, "basic"), (301, None),
+                                                          (5000, "refrigerated"), (50, "liquid")])]
+        expected = [container_factory(r["id"], r["weight"], r["special"]) for r in records]
+        for built in (build_containers(records),
+                      containers_from_columns([r["id"] for r in records], [r["weight"] for r in records],
+                                              [r["special"] for r in records])):
+            self.assertEqual([(type(c), c.id, c.weight) for c in built],
+                             [(type(c), c.id, c.weight) for c in expected])
+
+    def test_every_container_type_round_trips(self):
+        for cls in CONTAINER_CLASSES.values():
+            restored = Container.from_dict(cls("c1", 1234).to_dict())
+            self.assertIs(type(restored), cls)
+            self.assertEqual((restored.id, restored.weight), ("c1", 1234))
+        with self.assertRaises(ValueError):
+            Container.from_dict({"type": "BasicContainer", "id": "c1", "weight": 1})
+
+    def test_registered_container_type(self):
+        class FrozenContainer(HeavyContainer):
+            __slots__ = ()
+            UNIT_CONSUMPTION = 6.0
+
+        register_container(FrozenContainer, "frozen")
+        try:
+            self.assertIsInstance(container_factory("c1", 10, "frozen"), FrozenContainer)
+            self.assertIsInstance(build_containers([{"id": "c2", "weight": 10, "special": "frozen"}])[0],
+                                  FrozenContainer)
+            self.assertIsInstance(Container.from_dict({"type": "FrozenContainer", "id": "c3", "weight": 1}),
+                                  FrozenContainer)
+        finally:
+            del CONTAINER_CLASSES["FrozenContainer"]
+            del CONTAINER_KINDS["frozen"]
+
+    def test_bulk_items(self):
+        records = [{"item_type": "small", "item_id": 1, "weight": 2.0, "count": 3, "container_id": 9},
+                   {"item_type": "liquid", "item_id": 2, "weight": 5.0, "count": 1, "container_id": 9}]
+        items = build_items(records)
+        self.assertEqual([type(item) for item in items], [SmallItem, LiquidItem])
+        self.assertEqual([item.get_total_weight() for item in items], [6.0, 5.0])
+        columns = items_from_columns(*([r[key] for r in records]
+                                       for key in ("item_type", "item_id", "weight", "count", "container_id")))
+        self.assertEqual([(type(i), i.ID, i.count) for i in columns], [(type(i), i.ID, i.count) for i in items])
+        self.assertIsInstance(ItemFactory.create_item("heavy", 3, 1.0, 1, 9), HeavyItem)
+        with self.assertRaises(ValueError):
+            build_items([dict(records[0], item_type="gas")])
+
+    def test_bulk_ships_match_the_builder(self):
+        record = {"id": "s1", "ship_type": "medium", "max_weight": 1234, "fuel_capacity": 56}
+        built = ShipBuilder().set_ship_type("medium").set_name("s1").set_max_weight(1234) \
+            .set_fuel_capacity(56).build()
+        ship, = build_ships([record])
+        self.assertIsInstance(ship, MediumShip)
+        self.assertEqual((ship.name, ship.max_weight, ship.fuel_capacity),
+                         (built.name, built.max_weight, built.fuel_capacity))
+        with self.assertRaises(ValueError):
+            build_ships([dict(record, ship_type="submarine")])
+
+    def test_bulk_ships_run_the_constructor_of_their_type(self):
+        class TugShip(MediumShip):
+            def __init__(self):
+                super().__init__()
+                self.tugs = 2
+
+        register_ship_type("tug", TugShip)
+        try:
+            ship, = build_ships([{"id": "t1", "ship_type": "tug", "max_weight": 10, "fuel_capacity": 5}])
+        finally:
+            del SHIP_TYPES["tug"]
+        self.assertEqual((ship.name, ship.max_weight, ship.fuel_capacity, ship.tugs), ("t1", 10, 5, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
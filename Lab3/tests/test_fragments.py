@@ -0,0 +1,71 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.containers import HeavyContainer, LiquidContainer, RefrigeratedContainer, SmallContainer
+from src.fragments import FragmentCache
+from src.port import Port, Ship
+from helpers import QuietTestCase
+
+
+class TestFragmentCache(QuietTestCase):
+    def setUp(self):
+        super().setUp()
+        self.port = Port("p1", 46.48, 30.73)
+        for container in (SmallContainer("c1", 100), HeavyContainer(2, 3500.25),
+                          RefrigeratedContainer("холод", 1200), LiquidContainer("c4", 0.1)):
+            self.port.load_container(container)
+        self.port.incoming_ship(Ship("s1"))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "port.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertSavedLikeJsonDump(self):
+        self.port.save_to_json(self.filename)
+        expected = io.StringIO()
+        json.dump(Port.from_dict(json.loads(json.dumps(self.port.to_dict()))).to_dict(), expected, indent=4)
+        with open(self.filename) as f:
+            self.assertEqual(f.read(), expected.getvalue())
+
+    def test_saved_file_matches_json_dump(self):
+        self.assertSavedLikeJsonDump()
+        self.port.load_container(SmallContainer("c5", 5))
+        self.port.unload_container("c1")
+        self.port.get_container(2).weight = 4000
+        self.port.outgoing_ship(Ship("s1"))
+        self.port.incoming_ship(Ship("s2"))
+        self.assertSavedLikeJsonDump()
+
+    def test_empty_port(self):
+        port = Port("p2", 0.0, -1.5)
+        self.assertEqual(port.to_json(), json.dumps(port.to_dict(), indent=4))
+        self.assertEqual(port.to_json(indent=2), json.dumps(port.to_dict(), indent=2))
+
+    def test_only_changed_objects_are_encoded_again(self):
+        encoded = []
+
+        class Counted(SmallContainer):
+            __slots__ = ()
+
+            def to_dict(self):
+                encoded.append(self.id)
+                return super().to_dict()
+
+        cache = FragmentCache(lambda container: (container.id, container.weight))
+        containers = [Counted(i, 10) for i in range(5)]
+        first = cache.dicts(containers)
+        self.assertIs(cache.dicts(containers)[0], first[0])
+        containers[3].weight = 20
+        cache.json_items(containers, 4, 2)
+        self.assertEqual(encoded, [0, 1, 2, 3, 4, 3])
+        cache.invalidate(containers[0])
+        cache.dicts(containers[:2])
+        self.assertEqual(encoded[-1], 0)
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import random
+import tempfile
+import unittest
+from src.commands import compile_commands, run_commands
+from src.containers import HeavyContainer, SmallContainer
+from src.journal import Journal, read_events, replay, ship_state
+from src.port import Port, Ship as DockedShip
+from src.ship import HeavyShip, MediumShip
+from helpers import QuietTestCase
+
+
+def build_world(seed):
+    rng = random.Random(seed)
+    ports = {f"p{i}": Port(f"p{i}", 40.0 + i, 30.0 + i) for i in range(4)}
+    ships = {}
+    for i in range(6):
+        ship = HeavyShip() if i % 2 else MediumShip()
+        ship.name = f"s{i}"
+        ships[ship.name] = ship
+    containers = {}
+    for i in range(100):
+        cls = SmallContainer if i % 2 else HeavyContainer
+        container = cls(f"c{i}", rng.randint(50, 900))
+        containers[container.id] = container
+        ports[rng.choice(list(ports))].load_container(container)
+    records = []
+    for _ in range(600):
+        action = rng.choice(["load", "load", "unload", "sail", "refuel"])
+        record = {"action": action, "ship_id": rng.choice(list(ships)), "port_id": rng.choice(list(ports))}
+        if action in ("load", "unload"):
+            record["container_id"] = rng.choice(list(containers))
+        elif action == "sail":
+            record["destination_port_id"] = rng.choice(list(ports))
+        else:
+            record["amount"] = 10
+        records.append(record)
+    return ports, ships, compile_commands(records, ports, ships, containers)
+
+
+def world_state(ports, ships):
+    return ([port.to_dict() for port in ports.values()], [ship_state(ship) for ship in ships.values()])
+
+
+class TestJournal(QuietTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmp.name, "journal.log")
+        self.snapshot_path = os.path.join(self.tmp.name, "snapshot.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_replay_rebuilds_the_world(self):
+        ports, ships, commands = build_world(1)
+        journal = Journal(self.journal_path)
+        journal.attach_world(ports, ships)
+        run_commands(commands)
+        ports["p0"].incoming_ship(DockedShip("s9"))
+        ports["p0"].incoming_ship(DockedShip("s8"))
+        ports["p0"].outgoing_ship(ports["p0"].ships[0])
+        journal.close()
+        self.assertEqual(world_state(*replay(self.journal_path)), world_state(ports, ships))
+
+    def test_replay_from_snapshot_and_tail(self):
+        ports, ships, commands = build_world(2)
+        journal = Journal(self.journal_path)
+        journal.attach_world(ports, ships)
+        run_commands(commands[:300])
+        journal.compact(self.snapshot_path, ports, ships)
+        journal.close()
+
+        journal = Journal(self.journal_path)
+        for entity in list(ports.values()) + list(ships.values()):
+            entity.journal = journal
+        run_commands(commands[300:])
+        journal.close()
+
+        events = list(read_events(self.journal_path))
+        self.assertEqual(events[0]["event"], "compacted")
+        self.assertTrue(all(event["seq"] > events[0]["seq"] for event in events[1:]))
+        self.assertEqual(world_state(*replay(self.journal_path, self.snapshot_path)), world_state(ports, ships))
+
+    def test_torn_last_line_is_ignored(self):
+        ports, ships, _ = build_world(3)
+        journal = Journal(self.journal_path)
+        journal.attach_world(ports, ships)
+        journal.close()
+        with open(self.journal_path, "a") as f:
+            f.write('{"seq": 99, "event": "port_contai')
+        self.assertEqual(world_state(*replay(self.journal_path)), world_state(ports, ships))
+
+        journal = Journal(self.journal_path)
+        ships["s0"].journal = journal
+        ships["s0"].load(SmallContainer("extra", 1))
+        journal.close()
+        self.assertEqual(world_state(*replay(self.journal_path)), world_state(ports, ships))
+
+
+if __name__ == "__main__":
+    unittest.main()
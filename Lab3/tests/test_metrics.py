@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+from src.containers import SmallContainer
+from src.metrics import MetricsRegistry, registry
+from src.port import Port
+from src.ship import HeavyShip, Ship
+from helpers import QuietTestCase
+
+
+class TestMetrics(QuietTestCase):
+    def tearDown(self):
+        registry.disable()
+        registry.reset()
+
+    def test_disabled_registry_leaves_methods_untouched(self):
+        original = Ship.load
+        registry.enable()
+        self.assertIsNot(Ship.load, original)
+        registry.disable()
+        self.assertIs(Ship.load, original)
+
+    def test_counts_calls_and_failures(self):
+        registry.enable()
+        port = Port("p1", 10.0, 20.0)
+        ship = HeavyShip()
+        container = SmallContainer("c1", 100)
+        port.load_container(container)
+        port.load_container(container)
+        self.assertTrue(ship.load(container))
+        port.unload_container("missing")
+
+        counters = registry.to_dict()["counters"]
+        self.assertEqual(counters["port_load_container_total"], 2)
+        self.assertEqual(counters["port_load_container_failures_total"], 1)
+        self.assertEqual(counters["ship_load_total"], 1)
+        self.assertEqual(counters["ship_load_failures_total"], 0)
+        self.assertEqual(counters["port_unload_container_failures_total"], 1)
+        self.assertEqual(registry.histograms["ship_load_seconds"].count, 1)
+
+    def test_exceptions_count_as_failures(self):
+        class Broken:
+            def run(self):
+                raise RuntimeError
+
+        metrics = MetricsRegistry()
+        metrics.instrument(Broken, "run", "broken")
+        metrics.enable()
+        with self.assertRaises(RuntimeError):
+            Broken().run()
+        self.assertEqual(metrics.counters["broken_failures_total"].value, 1)
+
+    def test_prometheus_and_json_export(self):
+        registry.enable()
+        Port("p1", 10.0, 20.0).load_container(SmallContainer("c1", 100))
+        text = registry.to_prometheus()
+        self.assertIn("# TYPE port_load_container_total counter", text)
+        self.assertIn("port_load_container_total 1", text)
+        self.assertIn('port_load_container_seconds_bucket{le="+Inf"} 1', text)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "metrics.json")
+            registry.save(filename)
+            with open(filename) as f:
+                data = json.load(f)
+        self.assertEqual(data["histograms"]["port_load_container_seconds"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 from src.containers import SmallContainer, HeavyContainer
+from src.port import Port
 
 class TestContainerWeightWithMocks(unittest.TestCase):
     def setUp(self):
@@ -18,6 +19,41 @@ class TestContainerWeightWithMocks(unittest.TestCase):
         weight = self.heavy_container.get_total_weight()
         self.assertEqual(weight, 1500)
 
+class TestPortContainers(unittest.TestCase):
+    def setUp(self):
+        self.port = Port("port1", 46.4825, 30.7326)
+
+    def test_load_keeps_order(self):
+        for i in range(5):
+            self.assertTrue(self.port.load_container(SmallContainer(f"c{i}", 100)))
+        self.assertEqual([c.id for c in self.port.containers], ["c0", "c1", "c2", "c3", "c4"])
+
+    def test_duplicate_check_uses_id(self):
+        self.assertTrue(self.port.load_container(SmallContainer("c1", 100)))
+        self.assertTrue(self.port.load_container(SmallContainer("c2", 100)))
+        self.assertFalse(self.port.load_container(HeavyContainer("c1", 500)))
+        self.assertEqual(len(self.port.containers), 2)
+
+    def test_unload(self):
+        container = HeavyContainer("c1", 500)
+        self.port.load_container(container)
+        self.assertIs(self.port.get_container("c1"), container)
+        self.assertTrue(self.port.unload_container("c1"))
+        self.assertFalse(self.port.unload_container("c1"))
+        self.assertIsNone(self.port.get_container("c1"))
+        self.assertEqual(len(self.port.containers), 0)
+
+    def test_containers_is_read_only(self):
+        with self.assertRaises(AttributeError):
+            self.port.containers.append(SmallContainer("c1", 100))
+
+    def test_from_dict_rejects_duplicate_ids(self):
+        self.port.load_container(SmallContainer("c1", 100))
+        data = self.port.to_dict()
+        data = dict(data, containers=data["containers"] * 2)
+        with self.assertRaises(ValueError):
+            Port.from_dict(data)
+
 if __name__ == "__main__":
     unittest.main()
 
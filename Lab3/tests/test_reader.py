@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+import unittest
+from src.reader import iter_records, load_records
+
+
+class TestIterRecords(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {"type": "port", "id": "port1", "latitude": 46.4825, "longitude": 30.7326},
+            {"type": "container", "id": "c,1]", "weight": 200, "port_id": "port1", "special": None},
+            {"action": "load", "ship_id": "ship1", "port_id": "port1", "container_id": "c,1]"},
+        ]
+        fd, self.filename = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.records, f, indent=4)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_matches_json_load(self):
+        self.assertEqual(list(iter_records(self.filename)), load_records(self.filename))
+
+    def test_tiny_chunks(self):
+        for chunk_size in (1, 2, 7):
+            self.assertEqual(list(iter_records(self.filename, chunk_size=chunk_size)), self.records)
+
+    def test_empty_array(self):
+        with open(self.filename, "w") as f:
+            f.write(" [ ] ")
+        self.assertEqual(list(iter_records(self.filename)), [])
+
+    def test_malformed(self):
+        with open(self.filename, "w") as f:
+            f.write('[{"a": 1} {"b": 2}]')
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_records(self.filename))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from src.commands import compile_commands, run_commands
+from src.containers import HeavyContainer, SmallContainer
+from src.port import Port
+from src.ship import Ship, MediumShip
+from src.simulation import FleetSimulation, Simulation, Timing
+from helpers import QuietTestCase
+
+
+class TestSimulation(unittest.TestCase):
+    def test_events_run_in_time_order(self):
+        simulation = Simulation()
+        seen = []
+        for delay in (3.0, 1.0, 2.0, 1.0):
+            simulation.schedule(delay, lambda d=delay: seen.append((simulation.now, d)))
+        self.assertEqual(simulation.run(), 4)
+        self.assertEqual([t for t, _ in seen], [1.0, 1.0, 2.0, 3.0])
+        self.assertEqual(simulation.processed, 4)
+
+    def test_events_can_schedule_events(self):
+        simulation = Simulation()
+        ticks = []
+
+        def tick(n):
+            ticks.append(simulation.now)
+            if n:
+                simulation.schedule(0.5, tick, n - 1)
+
+        simulation.schedule(0.0, tick, 3)
+        simulation.run()
+        self.assertEqual(ticks, [0.0, 0.5, 1.0, 1.5])
+
+    def test_until_and_max_events(self):
+        simulation = Simulation()
+        for delay in range(10):
+            simulation.schedule(float(delay), lambda: None)
+        self.assertEqual(simulation.run(until=4.5), 5)
+        self.assertEqual(simulation.now, 4.5)
+        self.assertEqual(simulation.run(max_events=2), 2)
+        self.assertEqual(len(simulation), 3)
+
+    def test_negative_delay_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Simulation().schedule(-1.0, lambda: None)
+
+
+class TestFleetSimulation(QuietTestCase):
+    def world(self):
+        ports = {"p1": Port("p1", 46.0, 30.0), "p2": Port("p2", 47.0, 31.0)}
+        ships = {"s1": MediumShip(), "s2": Ship("Tanker", 3000, 1500)}
+        containers = {f"c{i}": (SmallContainer if i % 2 else HeavyContainer)(f"c{i}", 100 + 500 * (i % 3))
+                      for i in range(8)}
+        for container in containers.values():
+            ports["p1"].load_container(container)
+        records = []
+        for ship_id, ids in (("s1", ["c0", "c1", "c2"]), ("s2", ["c3", "c4", "c5", "c6"])):
+            records.append({"action": "refuel", "ship_id": ship_id, "amount": 200})
+            records += [{"action": "load", "ship_id": ship_id, "port_id": "p1", "container_id": c} for c in ids]
+            records.append({"action": "sail", "ship_id": ship_id, "port_id": "p1", "destination_port_id": "p2"})
+            records += [{"action": "unload", "ship_id": ship_id, "port_id": "p2", "container_id": c} for c in ids]
+        return ports, ships, compile_commands(records, ports, ships, containers)
+
+    def test_matches_sequential_execution(self):
+        ports, ships, commands = self.world()
+        expected = run_commands(commands)
+        expected_ports = {port_id: sorted(c.id for c in port.containers) for port_id, port in ports.items()}
+
+        ports, ships, commands = self.world()
+        simulation = FleetSimulation().submit(commands)
+        simulation.run()
+        self.assertEqual(simulation.succeeded, expected)
+        self.assertEqual(simulation.succeeded + simulation.failed, len(commands))
+        self.assertEqual({port_id: sorted(c.id for c in port.containers) for port_id, port in ports.items()},
+                         expected_ports)
+
+    def test_voyage_and_handling_take_time(self):
+        ports, ships, commands = self.world()
+        timing = Timing(speed_km_per_hour=10.0, handling_hours=1.0, refuel_per_hour=100.0)
+        simulation = FleetSimulation(timing).submit(commands)
+        simulation.run()
+        voyage = ports["p1"].calculate_distance(ports["p2"], method="haversine") / 10.0
+        # The slower ship: 2 hours of refueling, 4 loads, the voyage and 4 unloads.
+        self.assertAlmostEqual(simulation.now, 2.0 + 8 * 1.0 + voyage)
+
+    def test_ships_dock_at_the_destination(self):
+        ports, ships, commands = self.world()
+        FleetSimulation().submit(commands).run()
+        self.assertEqual(sorted(ship.ship_id for ship in ports["p2"].ships), ["Medium Ship", "Tanker"])
+        self.assertEqual(ports["p1"].ships, ())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from src.containers import HeavyContainer, LiquidContainer, RefrigeratedContainer, SmallContainer
+from src.port import Port, Ship
+from src.snapshot import PortSnapshot, load_snapshot, save_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.port = Port("p1", 46.48, 30.73)
+        for container in (SmallContainer("c1", 100), HeavyContainer(2, 3500.25),
+                          RefrigeratedContainer("холод", 1200), LiquidContainer("c4", 0.1)):
+            self.port.load_container(container)
+        self.port.ships = [Ship("s1")]
+        self.port.history = [Ship("s0"), Ship("s1")]
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "port.snap")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_is_lossless(self):
+        save_snapshot(self.port, self.filename)
+        loaded = load_snapshot(self.filename)
+        self.assertEqual(loaded.to_dict(), self.port.to_dict())
+        self.assertIsInstance(loaded.get_container(2).weight, float)
+        self.assertIsInstance(loaded.get_container("c1").weight, int)
+
+    def test_rows_are_decoded_on_demand(self):
+        save_snapshot(self.port, self.filename)
+        with PortSnapshot(self.filename) as snapshot:
+            self.assertEqual(len(snapshot), 4)
+            self.assertEqual(snapshot[-1].id, "c4")
+            self.assertIsInstance(snapshot.get_container("холод"), RefrigeratedContainer)
+            self.assertIsNone(snapshot.get_container("missing"))
+            with self.assertRaises(IndexError):
+                snapshot[4]
+
+    def test_empty_port(self):
+        save_snapshot(Port("p2", 0.0, 0.0), self.filename)
+        self.assertEqual(load_snapshot(self.filename).to_dict(), Port("p2", 0.0, 0.0).to_dict())
+
+    def test_rejects_other_files(self):
+        self.port.save_to_json(self.filename)
+        with self.assertRaises(ValueError):
+            PortSnapshot(self.filename)
+
+    def test_json_round_trip_keeps_containers_and_ships(self):
+        self.port.save_to_json(self.filename)
+        self.assertEqual(Port.load_from_json(self.filename).to_dict(), self.port.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
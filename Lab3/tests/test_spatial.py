@@ -0,0 +1,65 @@
+import random
+import unittest
+from src.port import Port
+from src.spatial import SpatialIndex
+
+
+def brute_force(ports, latitude, longitude):
+    probe = Port("probe", latitude, longitude)
+    return sorted(probe.calculate_distance(port, method="haversine") for port in ports)
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.rng = rng
+        self.ports = [Port(f"p{i}", rng.uniform(-90, 90), rng.uniform(-180, 180)) for i in range(800)]
+
+    def assertDistances(self, found, expected):
+        self.assertEqual(len(found), len(expected))
+        for (km, _), want in zip(found, expected):
+            self.assertAlmostEqual(km, want, places=6)
+
+    def test_nearest_matches_brute_force(self):
+        for cell_degrees in (0.5, 5.0, 30.0):
+            index = SpatialIndex(self.ports, cell_degrees=cell_degrees)
+            for _ in range(50):
+                latitude = self.rng.uniform(-90, 90)
+                longitude = self.rng.choice([self.rng.uniform(-180, 180), 179.9, -180.0])
+                k = self.rng.choice([1, 4, 12])
+                expected = brute_force(self.ports, latitude, longitude)[:k]
+                self.assertDistances(index.nearest(latitude, longitude, k), expected)
+
+    def test_within_matches_brute_force(self):
+        index = SpatialIndex(self.ports, cell_degrees=2.0)
+        for latitude, longitude, radius in ((0.0, 0.0, 1500.0), (88.0, 10.0, 700.0),
+                                            (-30.0, 179.5, 2000.0), (45.0, -100.0, 0.0)):
+            expected = [km for km in brute_force(self.ports, latitude, longitude) if km <= radius]
+            self.assertDistances(index.within(latitude, longitude, radius), expected)
+
+    def test_insert_remove_and_update(self):
+        index = SpatialIndex(self.ports[:10])
+        port = self.ports[0]
+        self.assertIn(port, index)
+        self.assertTrue(index.remove(port))
+        self.assertFalse(index.remove(port))
+        self.assertNotIn(port, index)
+        self.assertEqual(len(index), 9)
+
+        moved = self.ports[1]
+        moved.latitude, moved.longitude = 12.5, 45.5
+        index.update(moved)
+        self.assertIs(index.nearest(12.5, 45.5)[0][1], moved)
+
+        index.insert(port)
+        self.assertEqual(len(index), 10)
+        self.assertEqual(len(index.nearest(0.0, 0.0, k=50)), 10)
+
+    def test_empty_index(self):
+        index = SpatialIndex()
+        self.assertEqual(index.nearest(0.0, 0.0), [])
+        self.assertEqual(index.within(0.0, 0.0, 100.0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
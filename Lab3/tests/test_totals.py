@@ -0,0 +1,65 @@
+import random
+import unittest
+from collections import Counter
+from src.containers import HeavyContainer, LiquidContainer, RefrigeratedContainer, SmallContainer
+from src.port import Port
+from src.ship import Ship
+from src.totals import ContainerTotals
+from helpers import QuietTestCase
+
+KINDS = (SmallContainer, HeavyContainer, RefrigeratedContainer, LiquidContainer)
+
+
+def recomputed(containers):
+    containers = list(containers)
+    weights = Counter()
+    for container in containers:
+        weights[type(container).__name__] += container.weight
+    return (sum(c.weight for c in containers), sum(c.consumption() for c in containers),
+            dict(Counter(type(c).__name__ for c in containers)), dict(weights))
+
+
+def totals_of(holder):
+    return holder.total_weight, holder.total_consumption, dict(holder.count_by_type), dict(holder.weight_by_type)
+
+
+class TestContainerTotals(QuietTestCase):
+    def test_totals_follow_loads_and_unloads(self):
+        rng = random.Random(7)
+        port = Port("p1", 46.0, 30.0)
+        ship = Ship("s1", 10 ** 6, 1000)
+        containers = [rng.choice(KINDS)(f"c{i}", rng.randint(100, 5000)) for i in range(300)]
+        for container in containers:
+            port.load_container(container)
+        for _ in range(2000):
+            container = rng.choice(containers)
+            if port.get_container(container.id) is container and ship.load(container):
+                port.unload_container(container.id)
+            elif ship.unload(container):
+                port.load_container(container)
+        self.assertEqual(totals_of(port), recomputed(port.containers))
+        self.assertEqual(totals_of(ship), recomputed(ship.containers))
+
+    def test_emptied_holder_has_no_totals(self):
+        port = Port("p1", 46.0, 30.0)
+        port.load_container(SmallContainer("c1", 0.1))
+        port.load_container(SmallContainer("c2", 0.2))
+        port.unload_container("c1")
+        port.unload_container("c2")
+        self.assertEqual(totals_of(port), (0.0, 0.0, {}, {}))
+
+    def test_restored_ports_have_totals(self):
+        port = Port("p1", 46.0, 30.0)
+        for i, kind in enumerate(KINDS):
+            port.load_container(kind(f"c{i}", 1000 * (i + 1)))
+        restored = Port.from_dict(port.to_dict())
+        self.assertEqual(totals_of(restored), totals_of(port))
+
+    def test_views_are_read_only(self):
+        totals = ContainerTotals([HeavyContainer("c1", 4000)])
+        with self.assertRaises(TypeError):
+            totals.count_by_type["HeavyContainer"] = 0
+
+
+if __name__ == '__main__':
+    unittest.main()